@@ -40,27 +40,95 @@ Find the two entries that sum to ``2020``; what do you get if you multiply them
 """
 
 # stdlib
-import itertools
+import bisect
 import math
-import operator
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.lazy import lazy_import
+from aoc2020.loader import read_ints, stream_lines
+
+numpy = lazy_import("numpy")
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-expense_report = sorted(int(x) for x in PathPlus("input.txt").read_lines() if x)
 
-for pair in itertools.permutations(expense_report, 2):
-	if operator.add(*pair) == 2020:
-		print("The pair of numbers is:", pair)
-		print("The answer is:", operator.mul(*pair))  # 838624
-		break
+def parse_input(filename: PathLike = input_file) -> List[int]:
+	return sorted(read_ints(filename).tolist())
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[int]:
+	return (int(x) for x in stream_lines(lines))
+
+
+def iter_two_sums(entries: Iterable[int], target: int = 2020) -> Iterator[Tuple[int, int]]:
+	"""
+	Find the pairs of entries which sum to ``target``, in a single pass over the entries.
+
+	Each pair is yielded, smallest value first, as soon as its second entry is seen.
+	A pair of values is only yielded once, however many times the values appear.
+	An entry equal to half of ``target`` only pairs with itself if it appears at least twice.
+
+	If ``entries`` is a sequence with no negative values, entries larger than ``target``
+	can't be part of a pair and are not remembered, so at most ``target + 1`` distinct values are held in memory.
+	Otherwise (including for a stream of entries, where a negative value may still be to come)
+	every distinct value is remembered.
+
+	:param entries:
+	:param target:
+	"""
+
+	seen: Set[int] = set()
+	found: Set[int] = set()
+
+	# An entry larger than the target pairs with a negative entry.
+	prune = isinstance(entries, Sequence) and min(entries, default=0) >= 0
+
+	for entry in entries:
+		complement = target - entry
+
+		# The complement is only in ``seen`` if it appeared earlier, so ``entry == complement`` needs two copies.
+		if complement in seen and entry not in found:
+			found.update((entry, complement))
+			yield min(entry, complement), max(entry, complement)
+
+		if entry <= target or not prune:
+			seen.add(entry)
+
+
+def two_sum(entries: Iterable[int], target: int = 2020) -> List[Tuple[int, int]]:
+	"""
+	Returns all pairs of entries which sum to ``target``, in order of their smallest value.
+
+	See :func:`~.iter_two_sums` for details.
+
+	:param entries:
+	:param target:
+	"""
+
+	return sorted(iter_two_sums(entries, target))
+
+
+def part_one(expense_report: Iterable[int]) -> int:
+	for first, second in iter_two_sums(expense_report, 2020):
+		return first * second
+
+	raise ValueError("No pair of entries sums to 2020")
+
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 The Elves in accounting are thankful for your help;
@@ -73,8 +141,473 @@ Multiplying them together produces the answer, 241861950.
 In your expense report, what is the product of the three entries that sum to 2020?
 """
 
-for pair in itertools.permutations(expense_report, 3):
-	if sum(pair) == 2020:
-		print("The three numbers are:", pair)
-		print("The answer is:", math.prod(pair))  # 52764180
-		break
+
+def _k_sums(entries: Sequence[int], k: int, target: int, start: int) -> Iterator[Tuple[int, ...]]:
+	# ``entries`` is sorted, and only ``entries[start:]`` may be used.
+
+	if k == 2:
+		# Entries too large to pair even with the smallest entry are skipped with a binary search.
+		low = start
+		high = bisect.bisect_right(entries, target - entries[start], start) - 1 if start < len(entries) else start
+
+		while low < high:
+			total = entries[low] + entries[high]
+
+			if total < target:
+				low += 1
+			elif total > target:
+				high -= 1
+			else:
+				yield entries[low], entries[high]
+
+				# Skip over duplicates, so each combination of values is only yielded once.
+				while low < high and entries[low] == entries[low + 1]:
+					low += 1
+				while low < high and entries[high] == entries[high - 1]:
+					high -= 1
+
+				low += 1
+				high -= 1
+
+		return
+
+	for idx in range(start, len(entries) - k + 1):
+		entry = entries[idx]
+
+		if idx > start and entry == entries[idx - 1]:
+			continue
+
+		# The smallest sum including this entry is too large, and so is every sum after it.
+		if entry + sum(entries[idx + 1:idx + k]) > target:
+			break
+
+		# The largest sum including this entry is too small.
+		if entry + sum(entries[len(entries) - k + 1:]) < target:
+			continue
+
+		for rest in _k_sums(entries, k - 1, target - entry, idx + 1):
+			yield (entry, *rest)
+
+
+def iter_k_sums(entries: Iterable[int], k: int, target: int) -> Iterator[Tuple[int, ...]]:
+	"""
+	Find the combinations of ``k`` entries which sum to ``target``.
+
+	The entries are sorted, then all but the last two entries of each combination are chosen recursively,
+	and the last two are found with a two-pointer sweep, taking :math:`O(n^{k-1})` time.
+	Entries which can't be part of a combination (given the smallest and largest
+	possible sums of the remaining entries) are skipped.
+
+	Each combination of values is yielded once, in ascending order.
+	No combination can use more than ``k`` copies of a value, so any further copies are dropped before searching.
+
+	:param entries:
+	:param k: The number of entries in each combination.
+	:param target:
+	"""
+
+	if k < 1:
+		raise ValueError("'k' must be at least 1")
+
+	counts = Counter(entries)
+	entries = [value for value in sorted(counts) for _ in range(min(counts[value], k))]
+
+	if k == 1:
+		if target in entries:
+			yield (target, )
+		return
+
+	yield from _k_sums(entries, k, target, 0)
+
+
+def k_sum(entries: Iterable[int], k: int, target: int) -> List[Tuple[int, ...]]:
+	"""
+	Returns all combinations of ``k`` entries which sum to ``target``.
+
+	See :func:`~.iter_k_sums` for details.
+
+	:param entries:
+	:param k: The number of entries in each combination.
+	:param target:
+	"""
+
+	return list(iter_k_sums(entries, k, target))
+
+
+def _pair_sums(counts: bytearray, block_size: int) -> bytearray:
+	# Whether each sum (less twice the offset) is possible using two entries.
+	# The number of ordered pairs of values with each sum is the convolution of the values present with themselves,
+	# which is calculated a pair of blocks at a time to bound the size of the FFTs.
+	present = numpy.frombuffer(counts, dtype=numpy.uint8) > 0
+	n_fft = 2 * block_size
+
+	spectra = []
+	for start in range(0, len(present), block_size):
+		block = present[start:start + block_size]
+		spectra.append(numpy.fft.rfft(block, n_fft) if block.any() else None)
+
+	n_pairs = numpy.zeros(2 * len(present) + n_fft, dtype=numpy.int32)
+
+	# The pairs of blocks whose indices have the same total have their sums in the same range,
+	# so their products can be added up before the (much slower) inverse FFT.
+	for total in range(2 * len(spectra) - 1):
+		spectrum = None
+
+		for first in range(max(0, total - len(spectra) + 1), total // 2 + 1):
+			second = total - first
+			if spectra[first] is None or spectra[second] is None:
+				continue
+
+			product = spectra[first] * spectra[second]
+
+			# Pairs from two different blocks are only calculated once, but count in both orders.
+			if first != second:
+				product *= 2
+
+			if spectrum is None:
+				spectrum = product
+			else:
+				spectrum += product
+
+		if spectrum is not None:
+			start = total * block_size
+			n_pairs[start:start + n_fft] += numpy.rint(numpy.fft.irfft(spectrum, n_fft)).astype(numpy.int32)
+
+	# Each value paired with itself is only possible if it appears more than once.
+	n_pairs = n_pairs[:2 * len(present) - 1]
+	n_pairs[::2] -= present
+
+	possible = n_pairs > 0
+	possible[::2] |= numpy.frombuffer(counts, dtype=numpy.uint8) > 1
+
+	return bytearray(possible.tobytes())
+
+
+class ExpenseIndex:
+	"""
+	An index of an expense report, built once to answer many questions about which entries sum to a target.
+
+	The index holds the number of times (up to three) each value in the range of the report appears,
+	so checking whether a value is present takes constant time.
+	Optionally, it also holds a table of which pairwise sums are possible,
+	so targets which no pair (or, with the remaining entry, no triple) can reach are rejected immediately.
+
+	:param entries:
+	:param pair_sums: Whether to build the table of pairwise sums.
+		The table is the convolution of the values present with themselves, calculated with FFTs,
+		so it takes memory proportional to the range of the values but not time proportional to :math:`d^2`,
+		where :math:`d` is the number of distinct values.
+	:param block_size: The number of values convolved with each other at once when building the table.
+	"""
+
+	#: The smallest value in the report.
+	offset: int
+
+	#: The number of times each value appears, up to a maximum of three, indexed by ``value - offset``.
+	counts: bytearray
+
+	#: The distinct values in the report, in ascending order.
+	values: List[int]
+
+	#: Whether each sum is possible using two entries, indexed by ``sum - 2 * offset``.
+	pair_sums: Optional[bytearray]
+
+	#: The time in seconds taken to build the index.
+	build_time: float
+
+	def __init__(self, entries: Iterable[int], pair_sums: bool = False, block_size: int = 1 << 20):
+		start = time.perf_counter()
+
+		entries = list(entries)
+		if not entries:
+			raise ValueError("The expense report is empty")
+
+		self.offset = min(entries)
+		self.counts = bytearray(max(entries) - self.offset + 1)
+
+		for entry in entries:
+			if self.counts[entry - self.offset] < 3:
+				self.counts[entry - self.offset] += 1
+
+		self.values = [idx + self.offset for idx, count in enumerate(self.counts) if count]
+		self.pair_sums = None
+
+		if pair_sums:
+			self.pair_sums = _pair_sums(self.counts, block_size)
+
+		self.build_time = time.perf_counter() - start
+
+	def __repr__(self) -> str:
+		return (
+				f"<{type(self).__name__}: {len(self.values)} distinct values, "
+				f"built in {self.build_time:.6f}s, {self.nbytes} bytes>"
+				)
+
+	@property
+	def nbytes(self) -> int:
+		"""
+		The approximate memory used by the index, in bytes.
+		"""
+
+		nbytes = sys.getsizeof(self.counts) + sys.getsizeof(self.values)
+		nbytes += sum(sys.getsizeof(value) for value in self.values)
+
+		if self.pair_sums is not None:
+			nbytes += sys.getsizeof(self.pair_sums)
+
+		return nbytes
+
+	def count(self, value: int) -> int:
+		"""
+		Returns the number of times ``value`` appears in the report, up to a maximum of three.
+
+		:param value:
+		"""
+
+		idx = value - self.offset
+
+		if 0 <= idx < len(self.counts):
+			return self.counts[idx]
+
+		return 0
+
+	def _has_pair_sum(self, target: int) -> bool:
+		if self.pair_sums is None:
+			return True
+
+		idx = target - 2 * self.offset
+		return 0 <= idx < len(self.pair_sums) and bool(self.pair_sums[idx])
+
+	def pairs(self, target: int) -> List[Tuple[int, int]]:
+		"""
+		Returns the pairs of entries which sum to ``target``, smallest value first.
+
+		This takes :math:`O(d)` time, where :math:`d` is the number of distinct values.
+
+		:param target:
+		"""
+
+		if not self._has_pair_sum(target):
+			return []
+
+		pairs = []
+
+		for first in self.values:
+			second = target - first
+			if second < first:
+				break
+
+			if self.count(second) > (first == second):
+				pairs.append((first, second))
+
+		return pairs
+
+	def triples(self, target: int) -> List[Tuple[int, int, int]]:
+		"""
+		Returns the triples of entries which sum to ``target``, smallest value first.
+
+		This takes :math:`O(d^2)` time at worst, where :math:`d` is the number of distinct values,
+		but with the table of pairwise sums most values of the first entry are rejected in constant time.
+
+		:param target:
+		"""
+
+		triples = []
+
+		for idx, first in enumerate(self.values):
+			remainder = target - first
+
+			if remainder < 2 * first:
+				break
+
+			if not self._has_pair_sum(remainder):
+				continue
+
+			# The second entry may only equal the first if the first value appears more than once.
+			if self.counts[first - self.offset] < 2:
+				idx += 1
+
+			for second_idx in range(idx, len(self.values)):
+				second = self.values[second_idx]
+				third = remainder - second
+				if third < second:
+					break
+
+				# The second and first entries are present, so only the third value needs enough copies.
+				if self.count(third) > (third == second) + (third == first):
+					triples.append((first, second, third))
+
+		return triples
+
+	def query(self, targets: Iterable[int], k: int = 2) -> Dict[int, List[Tuple[int, ...]]]:
+		"""
+		Returns the pairs (or triples) of entries which sum to each of the targets.
+
+		:param targets:
+		:param k: The number of entries in each combination. Either ``2`` or ``3``.
+		"""
+
+		if k == 2:
+			find = self.pairs
+		elif k == 3:
+			find = self.triples  # type: ignore
+		else:
+			raise ValueError("'k' must be 2 or 3")
+
+		return {target: find(target) for target in targets}  # type: ignore
+
+
+def part_two(expense_report: Iterable[int]) -> int:
+	for triple in iter_k_sums(expense_report, 3, 2020):
+		return math.prod(triple)
+
+	raise ValueError("No three entries sum to 2020")
+
+
+# ==========================
+# NumPy engine
+# ==========================
+
+
+def as_array(entries: Iterable[int]) -> "numpy.ndarray":
+	"""
+	Returns the entries as an ``int32`` NumPy array.
+
+	:param entries:
+	"""
+
+	if isinstance(entries, numpy.ndarray):
+		return entries.astype(numpy.int32, copy=False)
+
+	return numpy.fromiter(entries, dtype=numpy.int32)
+
+
+def load_array(filename: PathLike = input_file) -> "numpy.ndarray":
+	"""
+	Parse the expense report directly into a sorted ``int32`` NumPy array.
+
+	:param filename:
+	"""
+
+	return numpy.sort(read_ints(filename, dtype="int32"))
+
+
+def two_sum_numpy(entries: Iterable[int], target: int = 2020) -> List[Tuple[int, int]]:
+	"""
+	Returns all pairs of entries which sum to ``target``, smallest value first.
+
+	The complement of every distinct value is looked up at once with :func:`numpy.searchsorted`.
+
+	:param entries:
+	:param target:
+	"""
+
+	values, counts = numpy.unique(as_array(entries), return_counts=True)
+
+	complements = target - values
+	positions = numpy.searchsorted(values, complements).clip(max=len(values) - 1)
+	present = values[positions] == complements
+
+	mask = present & ((values < complements) | ((values == complements) & (counts > 1)))
+
+	return list(zip(values[mask].tolist(), complements[mask].tolist()))
+
+
+def three_sum_numpy(
+		entries: Iterable[int],
+		target: int = 2020,
+		block_size: Optional[int] = None,
+		) -> List[Tuple[int, int, int]]:
+	"""
+	Returns all triples of entries which sum to ``target``, smallest value first.
+
+	For a block of values of the first entry, the third entry needed for every possible second entry
+	is calculated by broadcasting, and looked up with :func:`numpy.searchsorted`.
+
+	:param entries:
+	:param target:
+	:param block_size: The number of values of the first entry in each block.
+		Defaults to a size which keeps each block's arrays to around a million elements.
+	"""
+
+	values, counts = numpy.unique(as_array(entries), return_counts=True)
+
+	if not len(values):
+		return []
+
+	# The other two entries are at least the smallest value, which bounds the largest useful value.
+	n_useful = numpy.searchsorted(values, target - 2 * int(values[0]), side="right")
+	values, counts = values[:n_useful], counts[:n_useful]
+
+	if not len(values):
+		return []
+
+	if block_size is None:
+		block_size = max(1, (1 << 20) // len(values))
+
+	# The first entry is the smallest, so can be no more than a third of the target.
+	n_first = numpy.searchsorted(values, target // 3, side="right")
+	second_idx = numpy.arange(len(values))[numpy.newaxis, :]
+	triples: List[Tuple[int, int, int]] = []
+
+	for block_start in range(0, n_first, block_size):
+		first_idx = numpy.arange(block_start, min(block_start + block_size, n_first))[:, numpy.newaxis]
+
+		thirds = target - values[first_idx] - values[second_idx]
+		third_idx = numpy.searchsorted(values, thirds).clip(max=len(values) - 1)
+
+		mask = (second_idx >= first_idx) & (thirds >= values[second_idx]) & (values[third_idx] == thirds)
+
+		# Values used more than once must appear that many times in the report.
+		first_is_second = first_idx == second_idx
+		second_is_third = second_idx == third_idx
+		mask &= ~(first_is_second & second_is_third) | (counts[first_idx] > 2)
+		mask &= ~(first_is_second ^ second_is_third) | (counts[second_idx] > 1)
+
+		rows, columns = numpy.nonzero(mask)
+		triples.extend(
+				zip(
+						values[first_idx[rows, 0]].tolist(),
+						values[columns].tolist(),
+						thirds[rows, columns].tolist(),
+						)
+				)
+
+	return triples
+
+
+def part_one_numpy(expense_report: Iterable[int]) -> int:
+	for first, second in two_sum_numpy(expense_report, 2020):
+		return first * second
+
+	raise ValueError("No pair of entries sums to 2020")
+
+
+def part_two_numpy(expense_report: Iterable[int]) -> int:
+	for triple in three_sum_numpy(expense_report, 2020):
+		return math.prod(triple)
+
+	raise ValueError("No three entries sum to 2020")
+
+
+#: Alternative implementations of each part, which can be selected with ``--engine``.
+engines = {"numpy": {1: part_one_numpy, 2: part_two_numpy}}
+
+#: Parsers for the alternative implementations, used in place of :func:`parse_input`.
+parsers = {"numpy": load_array}
+
+
+if __name__ == "__main__":
+	expense_report = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The answer is:", part_one(expense_report))  # 838624
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
+
+	print("The answer is:", part_two(expense_report))  # 52764180
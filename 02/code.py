@@ -40,16 +40,35 @@ How many passwords are valid according to their policies?
 """
 
 # stdlib
-from typing import Tuple
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.lazy import lazy_import
+from aoc2020.loader import map_file, split_file, stream_lines
+from aoc2020.runner import load_day
+
+numpy = lazy_import("numpy")
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-passwords = [x.split(": ") for x in PathPlus("input.txt").read_lines() if x]
+
+def parse_input(filename: PathLike = input_file) -> List[List[str]]:
+	return [x.split(": ") for x in PathPlus(filename).read_lines() if x]
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[List[str]]:
+	return (x.split(": ") for x in stream_lines(lines))
 
 
 def parse_policy(policy: str) -> Tuple[range, str]:
@@ -65,15 +84,17 @@ def verify_password(password: str, policy: Tuple[range, str]) -> bool:
 	return count in policy[0]
 
 
-n_valid = 0
+def part_one(passwords: Iterable[List[str]]) -> int:
+	n_valid = 0
 
-for policy, password in passwords:
-	n_valid += verify_password(password, parse_policy(policy))
+	for policy, password in passwords:
+		n_valid += verify_password(password, parse_policy(policy))
+
+	return n_valid
 
-print(f"There are {n_valid} valid passwords.")  # 556
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 While it appears you validated the passwords correctly,
@@ -113,9 +134,483 @@ def verify_password_v2(password: str, policy: Tuple[int, int, str]) -> bool:
 		return password[policy[1]] == policy[2]
 
 
-n_valid = 0
+def part_two(passwords: Iterable[List[str]]) -> int:
+	n_valid = 0
+
+	for policy, password in passwords:
+		n_valid += verify_password_v2(password, parse_policy_v2(policy))
+
+	return n_valid
+
+
+# ==========================
+# Columnar engine
+# ==========================
+
+
+class PasswordColumns(NamedTuple):
+	"""
+	The password database as columns of NumPy arrays, with one element per line.
+
+	The passwords themselves are not copied out of the file;
+	each is described by its offset and length within ``buffer``.
+	"""
+
+	#: The first number in each policy.
+	lo: "numpy.ndarray"
+
+	#: The second number in each policy.
+	hi: "numpy.ndarray"
+
+	#: The letter in each policy, as a byte.
+	char: "numpy.ndarray"
+
+	#: The offset of each password within ``buffer``.
+	start: "numpy.ndarray"
+
+	#: The length of each password.
+	length: "numpy.ndarray"
+
+	#: The contents of the input file, as an array of bytes.
+	buffer: "numpy.ndarray"
+
+
+def _parse_numbers(buffer: "numpy.ndarray", starts: "numpy.ndarray", stops: "numpy.ndarray") -> "numpy.ndarray":
+	widths = stops - starts
+
+	if widths.size and (widths.min() < 1 or widths.max() > 9):
+		raise ValueError("Malformed password policy")
+
+	values = numpy.zeros(len(starts), dtype=numpy.int64)
+
+	# One pass per digit position, over the numbers which have that many digits.
+	for offset in range(int(widths.max(initial=0))):
+		rows = numpy.flatnonzero(widths > offset)
+		digits = buffer[starts[rows] + offset] - 48
+
+		if (digits > 9).any():  # Wraps around for bytes below "0"
+			raise ValueError("Malformed password policy")
+
+		values[rows] = values[rows] * 10 + digits
+
+	return values
+
+
+def load_columns(filename: PathLike = input_file) -> PasswordColumns:
+	"""
+	Parse the password database into columns, with vectorised operations over the bytes of the file.
+
+	:param filename:
+
+	:raises ValueError: If a line is not of the form ``1-3 a: abcde``.
+	"""
+
+	buffer = numpy.fromfile(filename, dtype=numpy.uint8)
+
+	newlines = numpy.flatnonzero(buffer == 10)
+	starts = numpy.concatenate(([0], newlines + 1))
+	ends = numpy.concatenate((newlines, [len(buffer)]))
+
+	# Strip the \r from \r\n line endings, then skip blank lines.
+	ends -= (ends > starts) & (buffer[numpy.maximum(ends - 1, 0)] == 13)
+	keep = ends > starts
+	starts, ends = starts[keep], ends[keep]
+
+	# Passwords are lowercase letters, so the only "-" and ":" on each line are in the policy.
+	dashes = numpy.flatnonzero(buffer == 45)
+	colons = numpy.flatnonzero(buffer == 58)
+
+	if len(dashes) != len(starts) or len(colons) != len(starts):
+		raise ValueError("Malformed password policy")
+	if not ((starts < dashes) & (dashes < colons - 3) & (colons < ends - 1)).all():
+		raise ValueError("Malformed password policy")
+
+	return PasswordColumns(
+			lo=_parse_numbers(buffer, starts, dashes),
+			hi=_parse_numbers(buffer, dashes + 1, colons - 2),
+			char=buffer[colons - 1],
+			start=colons + 2,
+			length=ends - colons - 2,
+			buffer=buffer,
+			)
+
+
+def _password_offsets(columns: PasswordColumns, rows: slice) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+	# The offset of every byte of every password in the given rows,
+	# and the bounds of each password within that array.
+	start, length = columns.start[rows], columns.length[rows]
+	bounds = numpy.concatenate(([0], numpy.cumsum(length)))
+	positions = numpy.arange(bounds[-1]) + numpy.repeat(start - bounds[:-1], length)
+
+	return positions, bounds
+
+
+def count_letters(columns: PasswordColumns, chunk_size: int = 1 << 16) -> "numpy.ndarray":
+	"""
+	Returns the number of times each password contains the letter from its policy.
+
+	:param columns:
+	:param chunk_size: The number of passwords to count at once,
+		which limits the size of the temporary arrays.
+	"""
+
+	counts = numpy.empty(len(columns.start), dtype=numpy.int64)
+
+	for chunk in range(0, len(counts), chunk_size):
+		rows = slice(chunk, chunk + chunk_size)
+		positions, bounds = _password_offsets(columns, rows)
+		matches = columns.buffer[positions] == numpy.repeat(columns.char[rows], columns.length[rows])
+
+		totals = numpy.concatenate(([0], numpy.cumsum(matches)))
+		counts[rows] = totals[bounds[1:]] - totals[bounds[:-1]]
+
+	return counts
+
+
+def part_one_columnar(columns: PasswordColumns) -> int:
+	counts = count_letters(columns)
+
+	return int(numpy.count_nonzero((columns.lo <= counts) & (counts <= columns.hi)))
+
+
+def _letter_at(columns: PasswordColumns, position: "numpy.ndarray") -> "numpy.ndarray":
+	# Positions past the end of the password never contain the letter.
+	in_range = (position >= 1) & (position <= columns.length)
+	offsets = numpy.where(in_range, columns.start + position - 1, 0)
+
+	return in_range & (columns.buffer[offsets] == columns.char)
+
+
+def part_two_columnar(columns: PasswordColumns) -> int:
+	return int(numpy.count_nonzero(_letter_at(columns, columns.lo) ^ _letter_at(columns, columns.hi)))
+
+
+# ==========================
+# Password index
+# ==========================
+
+
+class PolicySet(NamedTuple):
+	"""
+	A set of password policies, as NumPy arrays with one element per password.
+
+	Each field may also be a single value, which applies to every password.
+	"""
+
+	#: The minimum count of the letter, or its first position (starting from ``1``).
+	lo: "numpy.ndarray"
+
+	#: The maximum count of the letter, or its second position (starting from ``1``).
+	hi: "numpy.ndarray"
+
+	#: The letter, as a byte (e.g. ``ord('a')``).
+	char: "numpy.ndarray"
+
+
+class PasswordIndex:
+	"""
+	An index of a password database, built once so that any number of policy sets can be checked against it.
+
+	Each password's letter counts are held as a row of 26 ``uint8`` values,
+	so a count-based policy set is checked with a single lookup per password,
+	rather than a call to :meth:`str.count`.
+	The passwords are also held in a matrix of bytes, padded with zeros to the length of the longest password,
+	for position-based policy sets.
+
+	:param columns: The password database, from :func:`load_columns`.
+	:param chunk_size: The number of passwords to index at once,
+		which limits the size of the temporary arrays.
+
+	:raises ValueError: If a password contains anything other than lowercase letters.
+	"""
+
+	#: The number of times each letter appears in each password, up to a maximum of 255.
+	histograms: "numpy.ndarray"
+
+	#: The letters of each password as bytes, one password per row, padded with zeros.
+	characters: "numpy.ndarray"
+
+	#: The policies from the password database itself.
+	policies: PolicySet
+
+	#: The time in seconds taken to build the index.
+	build_time: float
+
+	def __init__(self, columns: PasswordColumns, chunk_size: int = 1 << 16):
+		start = time.perf_counter()
+
+		n_passwords = len(columns.start)
+		width = int(columns.length.max(initial=0))
+
+		self.histograms = numpy.empty((n_passwords, 26), dtype=numpy.uint8)
+		self.characters = numpy.zeros((n_passwords, width), dtype=numpy.uint8)
+		self.policies = PolicySet(columns.lo, columns.hi, columns.char)
+
+		for chunk in range(0, n_passwords, chunk_size):
+			rows = slice(chunk, chunk + chunk_size)
+			positions, bounds = _password_offsets(columns, rows)
+			letters = columns.buffer[positions] - 97
+
+			if (letters > 25).any():  # Wraps around for bytes below "a"
+				raise ValueError("Passwords may only contain lowercase letters")
+
+			lengths = numpy.diff(bounds)
+			row_numbers = numpy.repeat(numpy.arange(len(lengths)), lengths)
+
+			counts = numpy.bincount(row_numbers * 26 + letters, minlength=len(lengths) * 26)
+			self.histograms[rows] = counts.reshape(-1, 26).clip(max=255)
+
+			columns_within = numpy.arange(len(positions)) - numpy.repeat(bounds[:-1], lengths)
+			self.characters[row_numbers + chunk, columns_within] = columns.buffer[positions]
+
+		self.build_time = time.perf_counter() - start
+
+	def __repr__(self) -> str:
+		return (
+				f"<{type(self).__name__}: {len(self.histograms)} passwords, "
+				f"built in {self.build_time:.6f}s, {self.nbytes} bytes>"
+				)
+
+	@property
+	def nbytes(self) -> int:
+		"""
+		The memory used by the index's arrays, in bytes.
+		"""
+
+		nbytes = self.histograms.nbytes + self.characters.nbytes
+
+		return nbytes + sum(numpy.asarray(field).nbytes for field in self.policies)
+
+	def count(self, char: "numpy.ndarray") -> "numpy.ndarray":
+		"""
+		Returns the number of times each password contains the given letter, up to a maximum of 255.
+
+		:param char: The letter as a byte, or an array of one per password.
+		"""
+
+		letters = numpy.asarray(char, dtype=numpy.intp) - 97
+
+		return self.histograms[numpy.arange(len(self.histograms)), letters]
+
+	def check_counts(self, policies: PolicySet) -> "numpy.ndarray":
+		"""
+		Returns whether each password contains between ``lo`` and ``hi`` of the policy's letter.
+
+		This is the policy from part one.
+
+		:param policies:
+		"""
+
+		counts = self.count(policies.char)
+
+		return (policies.lo <= counts) & (counts <= policies.hi)
+
+	def _letter_at(self, position: "numpy.ndarray", char: "numpy.ndarray") -> "numpy.ndarray":
+		# The padding never matches a letter, so only positions outside the matrix need checking.
+		position = numpy.asarray(position)
+		in_range = (position >= 1) & (position <= self.characters.shape[1])
+		column = numpy.where(in_range, position - 1, 0)
+
+		return in_range & (self.characters[numpy.arange(len(self.characters)), column] == char)
+
+	def check_positions(self, policies: PolicySet) -> "numpy.ndarray":
+		"""
+		Returns whether exactly one of the positions ``lo`` and ``hi`` in each password contains the letter.
+
+		This is the policy from part two.
+
+		:param policies:
+		"""
+
+		return self._letter_at(policies.lo, policies.char) ^ self._letter_at(policies.hi, policies.char)
+
+	def count_valid(self, policy_sets: Iterable[PolicySet], positional: bool = False) -> List[int]:
+		"""
+		Returns the number of valid passwords under each of the policy sets.
+
+		:param policy_sets:
+		:param positional: Whether the policies are position-based (part two), rather than count-based (part one).
+		"""
+
+		check = self.check_positions if positional else self.check_counts
+
+		return [int(numpy.count_nonzero(check(policies))) for policies in policy_sets]
+
+
+def load_index(filename: PathLike = input_file) -> PasswordIndex:
+	"""
+	Parse the password database and build a :class:`~.PasswordIndex` of it.
+
+	:param filename:
+	"""
+
+	return PasswordIndex(load_columns(filename))
+
+
+def part_one_index(index: PasswordIndex) -> int:
+	return index.count_valid([index.policies])[0]
+
+
+def part_two_index(index: PasswordIndex) -> int:
+	return index.count_valid([index.policies], positional=True)[0]
+
+
+# ==========================
+# Parallel engine
+# ==========================
+
+
+class AuditResult(NamedTuple):
+	"""
+	The outcome of validating a password database, or a range of lines from one.
+	"""
+
+	#: The number of passwords checked.
+	n_checked: int
+
+	#: A mapping of part numbers to the number of passwords which are valid under that part's policy.
+	valid: Dict[int, int]
+
+	#: A mapping of part numbers to the byte offsets of the lines which are invalid under that part's policy.
+	invalid: Dict[int, List[int]]
+
+
+#: The function which verifies a password under the policy for each part.
+verifiers = {
+		1: lambda password, policy: verify_password(password, parse_policy(policy)),
+		2: lambda password, policy: verify_password_v2(password, parse_policy_v2(policy)),
+		}
+
+
+def validate_range(
+		filename: PathLike,
+		start: int,
+		end: int,
+		parts: Sequence[int] = (1, 2),
+		) -> AuditResult:
+	"""
+	Validate the lines of the password database between the byte offsets ``start`` and ``end``.
+
+	:param filename:
+	:param start: The offset of the first line.
+	:param end: The offset just after the last line (including its newline).
+	:param parts: The parts whose policies the passwords are checked against.
+	"""
+
+	n_checked = 0
+	valid = dict.fromkeys(parts, 0)
+	invalid: Dict[int, List[int]] = {part: [] for part in parts}
+
+	with map_file(filename) as buffer:
+		while start < end:
+			line_end = buffer.find(b'\n', start, end)
+			if line_end == -1:
+				line_end = end
+
+			line = buffer[start:line_end].rstrip(b'\r')
+
+			if line:
+				policy, password = line.decode("UTF-8").split(": ")
+				n_checked += 1
+
+				for part in parts:
+					try:
+						is_valid = verifiers[part](password, policy)
+					except IndexError:  # The policy refers to a position past the end of the password.
+						is_valid = False
+
+					if is_valid:
+						valid[part] += 1
+					else:
+						invalid[part].append(start)
+
+			start = line_end + 1
+
+	return AuditResult(n_checked, valid, invalid)
+
+
+def audit(
+		filename: PathLike = input_file,
+		parts: Sequence[int] = (1, 2),
+		jobs: Optional[int] = None,
+		) -> AuditResult:
+	"""
+	Validate a (potentially very large) password database in parallel.
+
+	The file is split into byte ranges aligned on newlines, which are validated in a pool of worker processes.
+	Only the counts and the offsets of the invalid lines are sent back from each worker.
+
+	:param filename:
+	:param parts: The parts whose policies the passwords are checked against.
+	:param jobs: The number of worker processes. Defaults to the number of CPUs.
+	"""
+
+	jobs = jobs or os.cpu_count() or 1
+
+	# Several ranges per worker, so one slow range doesn't leave the others idle.
+	ranges = split_file(filename, jobs * 4)
+
+	n_checked = 0
+	valid = dict.fromkeys(parts, 0)
+	invalid: Dict[int, List[int]] = {part: [] for part in parts}
+
+	# Under spawn or forkserver, the workers must import this module before they can unpickle validate_range().
+	with ProcessPoolExecutor(max_workers=jobs, initializer=load_day, initargs=(2, )) as executor:
+		futures = [executor.submit(validate_range, filename, start, end, parts) for start, end in ranges]
+
+		# The ranges are in order, so the offsets stay sorted.
+		for future in futures:
+			result = future.result()
+			n_checked += result.n_checked
+
+			for part in parts:
+				valid[part] += result.valid[part]
+				invalid[part].extend(result.invalid[part])
+
+	return AuditResult(n_checked, valid, invalid)
+
+
+def input_path(filename: PathLike = input_file) -> PathPlus:
+	"""
+	Returns the path to the password database, which the parallel engine reads itself in each worker process.
+
+	:param filename:
+	"""
+
+	return PathPlus(filename)
+
+
+def part_one_parallel(filename: PathLike) -> int:
+	return audit(filename, parts=(1, )).valid[1]
+
+
+def part_two_parallel(filename: PathLike) -> int:
+	return audit(filename, parts=(2, )).valid[2]
+
+
+#: Alternative implementations of each part, which can be selected with ``--engine``.
+#: The functions above which work a line at a time are kept as the reference implementation.
+engines = {
+		"columnar": {1: part_one_columnar, 2: part_two_columnar},
+		"index": {1: part_one_index, 2: part_two_index},
+		"parallel": {1: part_one_parallel, 2: part_two_parallel},
+		}
+
+#: Parsers for the alternative implementations, used in place of :func:`parse_input`.
+parsers = {"columnar": load_columns, "index": load_index, "parallel": input_path}
+
+
+if __name__ == "__main__":
+	passwords = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print(f"There are {part_one(passwords)} valid passwords.")  # 556
 
-for policy, password in passwords:
-	n_valid += verify_password_v2(password, parse_policy_v2(policy))
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print(f"There are {n_valid} valid passwords.")  # 605
+	print(f"There are {part_two(passwords)} valid passwords.")  # 605
@@ -71,22 +71,37 @@ how many trees would you encounter?
 """
 
 # stdlib
+import mmap
+import time
 from math import prod
-from typing import Dict, Tuple
+from types import TracebackType
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Type
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.lazy import lazy_import
+from aoc2020.loader import as_grid
+
+numpy = lazy_import("numpy")
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-lines = [list(x) for x in PathPlus("input.txt").read_lines() if x]
-line_length = len(lines[0])
-n_lines = len(lines)
 
+def parse_input(filename: PathLike = input_file) -> List[List[str]]:
+	return [list(x) for x in PathPlus(filename).read_lines() if x]
+
+
+def check_slope(lines: List[List[str]], x_move: int, y_move: int) -> int:
+	line_length = len(lines[0])
+	n_lines = len(lines)
 
-def check_slope(x_move: int, y_move: int):
 	x_pos = 0
 	y_pos = 0
 
@@ -101,10 +116,12 @@ def check_slope(x_move: int, y_move: int):
 	return trees_hit
 
 
-print("Number of trees hit:", check_slope(3, 1))  # 244
+def part_one(lines: List[List[str]]) -> int:
+	return check_slope(lines, 3, 1)
+
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 Time to check the rest of the slopes - you need to minimize the probability
@@ -126,17 +143,475 @@ multiplied together, these produce the answer ``336``.
 What do you get if you multiply together the number of trees encountered on each of the listed slopes?
 """
 
-trees_hit: Dict[Tuple[int, int], int] = {}
-
-for (x_move, y_move) in [
+slopes = [
 		(1, 1),
 		(3, 1),
 		(5, 1),
 		(7, 1),
 		(1, 2),
-		]:
-	trees_hit[(x_move, y_move)] = check_slope(x_move, y_move)
+		]
+
+
+def part_two(lines: List[List[str]]) -> int:
+	trees_hit: Dict[Tuple[int, int], int] = {}
+
+	for (x_move, y_move) in slopes:
+		trees_hit[(x_move, y_move)] = check_slope(lines, x_move, y_move)
+
+	return prod(trees_hit.values())
+
+
+# ==========================
+# Packed engine
+# ==========================
+
+
+class TreeMap:
+	"""
+	The map of the trees, packed into a NumPy array with one bit per square.
+
+	:param trees: A 2D boolean array, :py:obj:`True` where there is a tree.
+	"""
+
+	#: The number of rows in the map.
+	n_rows: int
+
+	#: The width of the map, before it repeats.
+	width: int
+
+	#: The squares of the map, eight to a byte, as packed by :func:`numpy.packbits`.
+	bits: "numpy.ndarray"
+
+	def __init__(self, trees: "numpy.ndarray"):
+		self.n_rows, self.width = trees.shape
+		self.bits = numpy.packbits(trees, axis=1)
+
+	def __repr__(self) -> str:
+		return f"<{type(self).__name__}: {self.n_rows} rows x {self.width} columns>"
+
+	def is_tree(self, rows: "numpy.ndarray", columns: "numpy.ndarray") -> "numpy.ndarray":
+		"""
+		Returns whether there is a tree at each of the given squares.
+
+		:param rows:
+		:param columns: The columns, which must be less than the width of the map.
+		"""
+
+		return (self.bits[rows, columns >> 3] >> (7 - (columns & 7))) & 1 != 0
+
+	def count_trees(self, slopes: Iterable[Tuple[int, int]], block_size: int = 1 << 14) -> List[int]:
+		"""
+		Returns the number of trees hit on each of the given slopes, starting from the top-left corner.
+
+		The map is processed a block of rows at a time, and the squares visited on every slope
+		are looked up in that block before moving on to the next,
+		so any number of slopes take about one pass over the map.
+
+		:param slopes: ``(right, down)`` pairs.
+		:param block_size: The number of rows in each block.
+
+		:raises ValueError: If a slope does not move down the map.
+		"""
+
+		slopes = list(slopes)
+		trees_hit = [0] * len(slopes)
+
+		for x_move, y_move in slopes:
+			if y_move < 1:
+				raise ValueError(f"The slope ({x_move}, {y_move}) does not move down the map.")
+
+		for block_start in range(0, self.n_rows, block_size):
+			block_end = min(block_start + block_size, self.n_rows)
+
+			for idx, (x_move, y_move) in enumerate(slopes):
+				# The steps which land in this block, skipping the starting square.
+				steps = numpy.arange(-(-max(block_start, y_move) // y_move), -(-block_end // y_move))
+				hits = self.is_tree(steps * y_move, (steps * x_move) % self.width)
+				trees_hit[idx] += int(numpy.count_nonzero(hits))
+
+			self.release(block_start, block_end)
+
+		return trees_hit
+
+	def release(self, start: int, end: int) -> None:
+		"""
+		Called by :meth:`~.count_trees` when it has finished with the rows from ``start`` to ``end``.
+
+		By default this does nothing.
+
+		:param start:
+		:param end:
+		"""
+
+
+class MappedTreeMap(TreeMap):
+	"""
+	A map of the trees which is read directly from a memory map of the input file, for very tall maps.
+
+	Every line of the file is the same width, so the offset of each row is calculated rather than searched for,
+	and only the pages containing the squares visited are read from the file.
+	Each block of rows is dropped from memory once :meth:`~.TreeMap.count_trees` has finished with it,
+	so the resident memory stays about the same however tall the map is.
+
+	The map can be used as a context manager, which closes it on exit.
+
+	:param filename:
+	"""
+
+	#: The squares of the map as bytes, as a view of the memory map.
+	grid: "numpy.ndarray"
+
+	def __init__(self, filename: PathLike = input_file):
+		self.filename = PathPlus(filename)
+
+		with open(filename, "rb") as fp:
+			self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+		self.grid = as_grid(self._mmap)
+		self.n_rows, self.width = self.grid.shape
+
+	def __reduce__(self) -> Tuple[Type["MappedTreeMap"], Tuple[PathPlus]]:
+		# The memory map can't be pickled, so the file is mapped again when unpickled.
+		return type(self), (self.filename, )
+
+	def __enter__(self) -> "MappedTreeMap":
+		return self
+
+	def __exit__(
+			self,
+			exc_type: Optional[Type[BaseException]],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType],
+			) -> None:
+		self.close()
+
+	def close(self) -> None:
+		"""
+		Close the memory map.
+		"""
+
+		self.grid = numpy.empty((0, self.width), dtype=numpy.uint8)
+		self._mmap.close()
+
+	def is_tree(self, rows: "numpy.ndarray", columns: "numpy.ndarray") -> "numpy.ndarray":
+		"""
+		Returns whether there is a tree at each of the given squares.
+
+		:param rows:
+		:param columns: The columns, which must be less than the width of the map.
+		"""
+
+		return self.grid[rows, columns] == ord('#')
+
+	def release(self, start: int, end: int) -> None:
+		"""
+		Drop the pages of the file containing the rows from ``start`` to ``end`` from memory.
+
+		The pages are read from the file again if they are needed later.
+
+		:param start:
+		:param end:
+		"""
+
+		if not hasattr(mmap, "MADV_DONTNEED"):  # Not available on Windows
+			return
+
+		stride = self.grid.strides[0]
+		offset = start * stride // mmap.PAGESIZE * mmap.PAGESIZE
+		self._mmap.madvise(mmap.MADV_DONTNEED, offset, min(end * stride, len(self._mmap)) - offset)
+
+
+def load_map(filename: PathLike = input_file) -> TreeMap:
+	"""
+	Parse the map into a :class:`~.TreeMap`.
+
+	:param filename:
+	"""
+
+	return TreeMap(as_grid(PathPlus(filename).read_bytes()) == ord('#'))
+
+
+def part_one_packed(tree_map: TreeMap) -> int:
+	return tree_map.count_trees([(3, 1)])[0]
+
+
+def part_two_packed(tree_map: TreeMap) -> int:
+	return prod(tree_map.count_trees(slopes))
+
+
+def input_path(filename: PathLike = input_file) -> PathPlus:
+	"""
+	Returns the path to the map, which the mmap engine maps itself for each part
+	so that the memory map is closed as soon as the part is solved.
+
+	:param filename:
+	"""
+
+	return PathPlus(filename)
+
+
+def part_one_mmap(filename: PathLike) -> int:
+	with MappedTreeMap(filename) as tree_map:
+		return part_one_packed(tree_map)
+
+
+def part_two_mmap(filename: PathLike) -> int:
+	with MappedTreeMap(filename) as tree_map:
+		return part_two_packed(tree_map)
+
+
+# ==========================
+# Slope statistics
+# ==========================
+
+
+class SlopeSearch(NamedTuple):
+	"""
+	The number of trees hit on each slope in a search space.
+	"""
+
+	#: The ``(right, down)`` slopes searched, in order.
+	slopes: List[Tuple[int, int]]
+
+	#: The number of trees hit on each slope.
+	counts: List[int]
+
+	#: The first slope which hits the fewest trees.
+	argmin: Tuple[int, int]
+
+	#: The first slope which hits the most trees.
+	argmax: Tuple[int, int]
+
+	@classmethod
+	def from_counts(cls, slopes: List[Tuple[int, int]], counts: List[int]) -> "SlopeSearch":
+		"""
+		Construct a :class:`~.SlopeSearch` from the slopes and the number of trees hit on each.
+
+		:param slopes:
+		:param counts:
+		"""
+
+		if not slopes:
+			raise ValueError("No slopes to search")
+
+		argmin = min(range(len(counts)), key=counts.__getitem__)
+		argmax = max(range(len(counts)), key=counts.__getitem__)
+
+		return cls(slopes, counts, slopes[argmin], slopes[argmax])
+
+
+class SlopeIndex:
+	"""
+	Statistics of the map, built once to answer queries about many slopes without walking the map again.
+
+	On a slope of right ``x`` and down ``y``, step ``k`` visits row ``k * y`` and column ``(k * x) % width``.
+	The column therefore only depends on ``k % width``, so for each ``y`` the index holds the number of trees
+	in each column across the rows visited at each residue of ``k``.
+	The number of trees hit on any slope is then the sum of ``width`` entries of the index.
+
+	The index takes :math:`O(y \\cdot width^2)` memory, however tall the map is.
+
+	:param tree_map:
+	:param max_y_move: The steepest slope (in rows moved down per step) the index can answer queries about.
+	:param block_size: The number of steps to look up in the map at once.
+	"""
+
+	#: The width of the map, before it repeats.
+	width: int
+
+	#: The number of trees at ``[y - 1, k % width, column]``, over every step ``k`` (apart from the start)
+	#: of a slope moving down ``y`` rows per step.
+	residue_counts: "numpy.ndarray"
+
+	#: The time in seconds taken to build the index.
+	build_time: float
+
+	def __init__(self, tree_map: TreeMap, max_y_move: int = 5, block_size: int = 1 << 14):
+		start = time.perf_counter()
+
+		width = self.width = tree_map.width
+		columns = numpy.arange(width)
+		self.residue_counts = numpy.zeros((max_y_move, width, width), dtype=numpy.int64)
+
+		for y_move in range(1, max_y_move + 1):
+			n_steps = -(-tree_map.n_rows // y_move)
+
+			for block_start in range(1, n_steps, block_size):
+				steps = numpy.arange(block_start, min(block_start + block_size, n_steps))
+				hits = tree_map.is_tree((steps * y_move)[:, None], columns[None, :])
+
+				bins = ((steps % width)[:, None] * width + columns)[hits]
+				counts = numpy.bincount(bins, minlength=width * width)
+				self.residue_counts[y_move - 1] += counts.reshape(width, width)
+
+				tree_map.release(int(steps[0]) * y_move, int(steps[-1]) * y_move + 1)
+
+		self.build_time = time.perf_counter() - start
+
+	def __repr__(self) -> str:
+		return (
+				f"<{type(self).__name__}: up to {self.max_y_move} rows down, "
+				f"built in {self.build_time:.6f}s, {self.residue_counts.nbytes} bytes>"
+				)
+
+	@property
+	def max_y_move(self) -> int:
+		"""
+		The steepest slope the index can answer queries about.
+		"""
+
+		return len(self.residue_counts)
+
+	def count_trees(self, x_moves: Iterable[int], y_move: int) -> List[int]:
+		"""
+		Returns the number of trees hit on the slopes moving down ``y_move`` rows and right by each of ``x_moves``.
+
+		:param x_moves:
+		:param y_move:
+
+		:raises ValueError: If ``y_move`` is outside the range covered by the index.
+		"""
+
+		if not 1 <= y_move <= self.max_y_move:
+			raise ValueError(f"The index only covers slopes moving down 1 to {self.max_y_move} rows per step.")
+
+		residues = numpy.arange(self.width)
+		columns = numpy.outer(numpy.fromiter(x_moves, dtype=numpy.int64), residues) % self.width
+
+		return self.residue_counts[y_move - 1][residues, columns].sum(axis=1).tolist()
+
+	def count(self, x_move: int, y_move: int) -> int:
+		"""
+		Returns the number of trees hit on the slope right ``x_move``, down ``y_move``.
+
+		:param x_move:
+		:param y_move:
+		"""
+
+		return self.count_trees([x_move], y_move)[0]
+
+	def search(self, x_moves: Iterable[int], y_moves: Iterable[int]) -> SlopeSearch:
+		"""
+		Count the trees hit on every combination of ``x_moves`` and ``y_moves``,
+		and find the slopes which hit the fewest and the most.
+
+		:param x_moves:
+		:param y_moves:
+		"""
+
+		x_moves = list(x_moves)
+		found_slopes = []
+		counts = []
+
+		for y_move in y_moves:
+			found_slopes.extend((x_move, y_move) for x_move in x_moves)
+			counts.extend(self.count_trees(x_moves, y_move))
+
+		return SlopeSearch.from_counts(found_slopes, counts)
+
+
+def search_slopes(lines: List[List[str]], x_moves: Iterable[int], y_moves: Iterable[int]) -> SlopeSearch:
+	"""
+	Count the trees hit on every combination of ``x_moves`` and ``y_moves`` by walking each slope,
+	and find the slopes which hit the fewest and the most.
+
+	This is the reference implementation for :meth:`SlopeIndex.search`.
+
+	:param lines:
+	:param x_moves:
+	:param y_moves:
+	"""
+
+	found_slopes = [(x_move, y_move) for y_move in y_moves for x_move in x_moves]
+
+	return SlopeSearch.from_counts(found_slopes, [check_slope(lines, *slope) for slope in found_slopes])
+
+
+def benchmark_search(
+		filename: PathLike = input_file,
+		x_moves: Iterable[int] = range(51),
+		y_moves: Iterable[int] = range(1, 6),
+		) -> Dict[str, float]:
+	"""
+	Time searching the given slopes by walking each one,
+	with :meth:`TreeMap.count_trees`, and with a :class:`~.SlopeIndex`.
+
+	:param filename:
+	:param x_moves:
+	:param y_moves:
+
+	:returns: A mapping of each method to the time taken in seconds, excluding parsing the input.
+		The time taken to build the index is reported separately.
+
+	:raises ValueError: If the methods disagree.
+	"""
+
+	x_moves, y_moves = list(x_moves), list(y_moves)
+	found_slopes = [(x_move, y_move) for y_move in y_moves for x_move in x_moves]
+	times = {}
+
+	lines = parse_input(filename)
+	start = time.perf_counter()
+	expected = search_slopes(lines, x_moves, y_moves)
+	times["walk"] = time.perf_counter() - start
+
+	tree_map = load_map(filename)
+	start = time.perf_counter()
+	packed = SlopeSearch.from_counts(found_slopes, tree_map.count_trees(found_slopes))
+	times["packed"] = time.perf_counter() - start
+
+	index = SlopeIndex(tree_map, max_y_move=max(y_moves))
+	times["index build"] = index.build_time
+	start = time.perf_counter()
+	indexed = index.search(x_moves, y_moves)
+	times["index query"] = time.perf_counter() - start
+
+	if not expected == packed == indexed:
+		raise ValueError("The slope searches disagree")
+
+	return times
+
+
+def load_index(filename: PathLike = input_file) -> SlopeIndex:
+	"""
+	Parse the map and build a :class:`~.SlopeIndex` covering the slopes from the puzzle.
+
+	:param filename:
+	"""
+
+	return SlopeIndex(load_map(filename), max_y_move=max(y_move for _, y_move in slopes))
+
+
+def part_one_index(index: SlopeIndex) -> int:
+	return index.count(3, 1)
+
+
+def part_two_index(index: SlopeIndex) -> int:
+	return prod(index.count(*slope) for slope in slopes)
+
+
+#: Alternative implementations of each part, which can be selected with ``--engine``.
+engines = {
+		"packed": {1: part_one_packed, 2: part_two_packed},
+		"mmap": {1: part_one_mmap, 2: part_two_mmap},
+		"index": {1: part_one_index, 2: part_two_index},
+		}
+
+#: Parsers for the alternative implementations, used in place of :func:`parse_input`.
+parsers = {"packed": load_map, "mmap": input_path, "index": load_index}
+
+
+if __name__ == "__main__":
+	lines = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("Number of trees hit:", part_one(lines))  # 244
 
-print(trees_hit)
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("Product of trees hit:", prod(trees_hit.values()))  # 9406609920
+	print("Product of trees hit:", part_two(lines))  # 9406609920
@@ -66,22 +66,41 @@ In your batch file, how many passports are valid?
 """
 
 # stdlib
+import os
 import re
-from typing import Dict, List
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Sequence, TextIO, Tuple
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.lazy import lazy_import
+from aoc2020.loader import map_file, split_file
+from aoc2020.runner import load_day
+
+numpy = lazy_import("numpy")
+pandas = lazy_import("pandas")
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-passport_batch = [x for x in PathPlus("input.txt").read_text().split("\n\n") if x]
 
-passports: List[Dict[str, str]] = []
+def parse_input(filename: PathLike = input_file) -> List[Dict[str, str]]:
+	passport_batch = [x for x in PathPlus(filename).read_text().split("\n\n") if x]
+
+	passports: List[Dict[str, str]] = []
+
+	for raw_passport in passport_batch:
+		passports.append(dict(field.split(':') for field in [x for x in re.split(r"[ \n]", raw_passport) if x]))
+
+	return passports
 
-for raw_passport in passport_batch:
-	passports.append(dict(field.split(':') for field in [x for x in re.split(r"[ \n]", raw_passport) if x]))
 
 required_keys = {
 		"byr",
@@ -102,15 +121,17 @@ def validate_passport(passport: Dict[str, str]) -> bool:
 	return True
 
 
-valid_passports = 0
+def part_one(passports: List[Dict[str, str]]) -> int:
+	valid_passports = 0
+
+	for passport in passports:
+		valid_passports += validate_passport(passport)
 
-for passport in passports:
-	valid_passports += validate_passport(passport)
+	return valid_passports
 
-print(f"There are {valid_passports} valid passports!")  # 230
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 The line is moving more quickly now, but you overhear airport security
@@ -217,8 +238,12 @@ def validate_eyr(passport: Dict[str, str]) -> bool:
 	return 2020 <= int(eyr) <= 2030
 
 
+hgt_re = re.compile(r"(\d+)(cm|in)")
+hcl_re = re.compile(r"#([0-9a-f]{6})")
+
+
 def validate_hgt(passport: Dict[str, str]) -> bool:
-	m = re.match(r"(\d+)(cm|in)", passport["hgt"])
+	m = hgt_re.match(passport["hgt"])
 
 	if not m:
 		return False
@@ -230,7 +255,7 @@ def validate_hgt(passport: Dict[str, str]) -> bool:
 
 
 def validate_hcl(passport: Dict[str, str]) -> bool:
-	return re.match(r"#([0-9a-f]{6})", passport["hcl"]) is not None
+	return hcl_re.match(passport["hcl"]) is not None
 
 
 valid_eye_colours = {
@@ -253,23 +278,923 @@ def validate_pid(passport: Dict[str, str]) -> bool:
 	return pid.isdigit() and len(pid) == 9
 
 
-valid_passports = 0
+validators = [
+		validate_passport,
+		validate_byr,
+		validate_iyr,
+		validate_eyr,
+		validate_hgt,
+		validate_hcl,
+		validate_ecl,
+		validate_pid,
+		]
+
+
+def part_two(passports: List[Dict[str, str]]) -> int:
+	valid_passports = 0
+
+	for passport in passports:
+		for func in validators:
+			if not func(passport):
+				break
+		else:
+			valid_passports += 1
+
+	return valid_passports
+
+
+# ==========================
+# Streaming engine
+# ==========================
+
 
-for passport in passports:
-	for func in [
-			validate_passport,
-			validate_byr,
-			validate_iyr,
-			validate_eyr,
-			validate_hgt,
-			validate_hcl,
-			validate_ecl,
-			validate_pid,
-			]:
+def iter_passports(stream: TextIO, chunk_size: int = 1 << 20) -> Iterator[str]:
+	"""
+	Iterate over the passports in a batch file, reading ``chunk_size`` characters at a time.
 
-		if not func(passport):
+	Each passport is yielded as a string as soon as the blank line after it has been read,
+	so only the current chunk is held in memory however large the batch is.
+
+	:param stream: A text stream, such as an open file or :py:obj:`sys.stdin`.
+	:param chunk_size:
+	"""
+
+	remainder = ''
+
+	while True:
+		chunk = stream.read(chunk_size)
+		if not chunk:
 			break
-	else:
-		valid_passports += 1
 
-print(f"There are {valid_passports} valid passports!")  # 156
+		# The last record may continue into the next chunk.
+		*records, remainder = (remainder + chunk).split("\n\n")
+
+		for record in records:
+			if record and not record.isspace():
+				yield record
+
+	if remainder and not remainder.isspace():
+		yield remainder
+
+
+class PassportFile:
+	"""
+	The passports in a batch file, which is read again each time the passports are iterated over.
+
+	:param filename:
+	"""
+
+	def __init__(self, filename: PathLike = input_file):
+		self.filename = PathPlus(filename)
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}({self.filename.as_posix()!r})"
+
+	def __iter__(self) -> Iterator[str]:
+		with self.filename.open(encoding="UTF-8") as fp:
+			yield from iter_passports(fp)
+
+
+class FieldRule(NamedTuple):
+	"""
+	The rule for the value of one of the required fields of a passport.
+	"""
+
+	field: str
+
+	#: The pattern the start of the value must match.
+	#: The first group, if any, is a number which must be within ``ranges``,
+	#: and the second group, if any, is its unit.
+	pattern: Pattern[str]
+
+	#: A mapping of units to the permitted range for the number.
+	#: Numbers without a unit are looked up under ``''``.
+	ranges: Optional[Dict[str, range]] = None
+
+
+#: The rules from part two, one per required field.
+rule_table = [
+		FieldRule("byr", re.compile(r"(\d{1,4})(?!\S)"), {'': range(1920, 2003)}),
+		FieldRule("iyr", re.compile(r"(\d{1,4})(?!\S)"), {'': range(2010, 2021)}),
+		FieldRule("eyr", re.compile(r"(\d{1,4})(?!\S)"), {'': range(2020, 2031)}),
+		FieldRule("hgt", hgt_re, {"cm": range(150, 194), "in": range(59, 77)}),
+		FieldRule("hcl", hcl_re),
+		FieldRule("ecl", re.compile(f"(?:{'|'.join(sorted(valid_eye_colours))})(?!\\S)")),
+		FieldRule("pid", re.compile(r"\d{9}(?!\S)")),
+		]
+
+# For each rule, a pattern which finds the field and matches the start of its value,
+# the permitted ranges, and whether the pattern captures a unit.
+# The key must be at the start of a field (after a space or newline, as in the reference implementation),
+# so that "xbyr:" is not taken for "byr:". That is checked after the key rather than before it,
+# so the search can still look for the key as a literal.
+# As with a dict, a repeated field takes the last value, so the field must not appear again later on.
+_compiled_rules = [(
+		re.compile(
+				rf"{rule.field}:(?<![^ \n]{rule.field}:)(?:{rule.pattern.pattern})"
+				rf"(?!.*{rule.field}:(?<![^ \n]{rule.field}:))",
+				re.DOTALL,
+				).search,
+		rule.ranges,
+		rule.pattern.groups > 1,
+		) for rule in rule_table]
+_required_keys = [f" {rule.field}:" for rule in rule_table]
+
+
+def check_passport(passport: str, strict: bool = True) -> bool:
+	"""
+	Returns whether the passport has all the required fields, searching for each one in place in the passport.
+
+	:param passport: The passport's fields, separated by whitespace.
+	:param strict: Whether to also check the value of each field against the :py:obj:`rule_table`, as in part two.
+	"""
+
+	if not strict:
+		# With a space before every field, each key can be found as a plain substring.
+		fields = ' ' + passport.replace('\n', ' ')
+
+		for key in _required_keys:
+			if key not in fields:
+				return False
+
+		return True
+
+	for search, ranges, has_unit in _compiled_rules:
+		m = search(passport)
+
+		if m is None:
+			return False
+
+		if ranges is not None:
+			limits = ranges.get(m.group(2) if has_unit else '')
+			if limits is None or int(m.group(1)) not in limits:
+				return False
+
+	return True
+
+
+def part_one_streaming(passports: Iterable[str]) -> int:
+	return sum(check_passport(passport, strict=False) for passport in passports)
+
+
+def part_two_streaming(passports: Iterable[str]) -> int:
+	return sum(check_passport(passport) for passport in passports)
+
+
+# ==========================
+# Columnar engine
+# ==========================
+
+#: The fields of a passport, in the order of the columns of a :class:`~.PassportTable`.
+fields = ["byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid", "cid"]
+
+
+class PassportTable(NamedTuple):
+	"""
+	A batch of passports as a table, with one column per field.
+
+	Each column is a NumPy array of fixed-width byte strings, with ``b''`` for passports without that field.
+	"""
+
+	#: A mapping of field names to columns.
+	columns: Dict[str, "numpy.ndarray"]
+
+	#: A mapping of field names to whether each passport has that field.
+	present: Dict[str, "numpy.ndarray"]
+
+	def __len__(self) -> int:
+		return len(self.columns[fields[0]])
+
+	def to_frame(self) -> "pandas.DataFrame":
+		"""
+		Returns the table as a :class:`pandas.DataFrame` of strings, with missing fields as ``NaN``.
+		"""
+
+		data = {field: column.astype(str) for field, column in self.columns.items()}
+
+		return pandas.DataFrame(data).where(pandas.DataFrame(self.present))
+
+
+def load_table(filename: PathLike = input_file) -> PassportTable:
+	"""
+	Parse a batch of passports into a :class:`~.PassportTable`,
+	with vectorised operations over the bytes of the file.
+
+	As with the reference implementation, fields with keys other than those in :py:obj:`fields` are ignored.
+
+	:param filename:
+
+	:raises ValueError: If a field is not of the form ``key:value``.
+	"""
+
+	buffer = numpy.fromfile(filename, dtype=numpy.uint8)
+
+	# The start and end of each key:value field. Spaces and control characters are whitespace.
+	in_field = buffer > 32
+	edges = numpy.diff(numpy.concatenate(([False], in_field, [False])).view(numpy.int8))
+	starts, ends = numpy.flatnonzero(edges == 1), numpy.flatnonzero(edges == -1)
+
+	# Every field must contain exactly one colon. Colons are never whitespace, so each is in some field,
+	# and there is one per field exactly when the n-th colon is in the n-th field.
+	colons = numpy.flatnonzero(buffer == 58)
+	if len(colons) != len(starts) or ((colons < starts) | (colons >= ends)).any():
+		raise ValueError("Malformed passport field")
+
+	# A new passport starts after a blank line, i.e. a newline straight after another, ignoring any "\r".
+	# As with the reference implementation, a line containing only spaces is not blank.
+	newlines = numpy.flatnonzero(buffer == 10)
+	previous = buffer[numpy.maximum(newlines - 1, 0)]
+	before_cr = buffer[numpy.maximum(newlines - 2, 0)]
+	is_blank = (newlines > 0) & ((previous == 10) | ((previous == 13) & (newlines > 1) & (before_cr == 10)))
+	blank_lines = newlines[is_blank]
+	new_passport = numpy.searchsorted(blank_lines, starts[1:]) > numpy.searchsorted(blank_lines, ends[:-1])
+	passport_numbers = numpy.concatenate(([0], numpy.cumsum(new_passport)))
+	n_passports = int(passport_numbers[-1]) + 1 if len(starts) else 0
+
+	# Only fields with three-character keys can be in the table; the others are skipped.
+	keyed = numpy.flatnonzero(colons - starts == 3)
+	keys = buffer[starts[keyed]].astype(numpy.int32) << 16
+	keys |= buffer[starts[keyed] + 1].astype(numpy.int32) << 8
+	keys |= buffer[starts[keyed] + 2]
+
+	columns = {}
+	present = {}
+
+	for field in fields:
+		code = int.from_bytes(field.encode("UTF-8"), "big")
+		selected = keyed[keys == code]
+
+		# As with a dict, a repeated field takes the last value.
+		rows = passport_numbers[selected]
+		last = numpy.ones(len(rows), dtype=bool)
+		last[:-1] = rows[1:] != rows[:-1]
+		selected, rows = selected[last], rows[last]
+
+		value_starts = starts[selected] + 4
+		widths = ends[selected] - value_starts
+		width = max(int(widths.max(initial=0)), 1)
+
+		values = numpy.zeros((len(selected), width), dtype=numpy.uint8)
+		row_numbers = numpy.repeat(numpy.arange(len(selected)), widths)
+		columns_within = numpy.arange(len(row_numbers)) - numpy.repeat(numpy.cumsum(widths) - widths, widths)
+		values[row_numbers, columns_within] = buffer[value_starts[row_numbers] + columns_within]
+
+		columns[field] = numpy.zeros(n_passports, dtype=f"S{width}")
+		columns[field][rows] = values.view(f"S{width}").ravel()
+		present[field] = numpy.zeros(n_passports, dtype=bool)
+		present[field][rows] = True
+
+	return PassportTable(columns, present)
+
+
+def _as_chars(column: "numpy.ndarray") -> "numpy.ndarray":
+	# The column as a 2D array of bytes, padded with zeros.
+	return column.view(numpy.uint8).reshape(len(column), column.itemsize)
+
+
+def _leading_number(chars: "numpy.ndarray") -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+	# The number of leading digits of each value, and their value.
+	# Floats are exact well beyond the numbers the rules accept, and don't overflow.
+	is_digit = (chars - 48) < 10  # Wraps around for bytes below "0"
+	n_digits = numpy.where(is_digit.all(axis=1), chars.shape[1], (~is_digit).argmax(axis=1))
+
+	value = numpy.zeros(len(chars))
+	for idx in range(chars.shape[1]):
+		value = numpy.where(idx < n_digits, value * 10 + (chars[:, idx] - 48), value)
+
+	return n_digits, value
+
+
+def _check_year(column: "numpy.ndarray", limits: range) -> "numpy.ndarray":
+	# Four-digit strings compare in the same order as the numbers they represent.
+	lowest, highest = str(limits.start).encode("UTF-8"), str(limits[-1]).encode("UTF-8")
+
+	is_year = numpy.char.isdigit(column) & (numpy.char.str_len(column) == 4)
+
+	return is_year & (column >= lowest) & (column <= highest)
+
+
+def _check_hgt(column: "numpy.ndarray") -> "numpy.ndarray":
+	chars = numpy.pad(_as_chars(column), ((0, 0), (0, 2)))
+	n_digits, value = _leading_number(chars)
+
+	rows = numpy.arange(len(chars))
+	unit = chars[rows, n_digits].astype(numpy.int32) << 8 | chars[rows, n_digits + 1]
+
+	is_cm = (unit == int.from_bytes(b"cm", "big")) & (150 <= value) & (value <= 193)
+	is_in = (unit == int.from_bytes(b"in", "big")) & (59 <= value) & (value <= 76)
+
+	return (n_digits >= 1) & (is_cm | is_in)
+
+
+def _check_hcl(column: "numpy.ndarray") -> "numpy.ndarray":
+	chars = numpy.pad(_as_chars(column), ((0, 0), (0, 7)))[:, :7]
+	colour = chars[:, 1:]
+	is_hex = ((colour - 48) < 10) | ((colour - 97) < 6)
+
+	return (chars[:, 0] == 35) & is_hex.all(axis=1)
+
+
+def _check_pid(column: "numpy.ndarray") -> "numpy.ndarray":
+	return numpy.char.isdigit(column) & (numpy.char.str_len(column) == 9)
+
+
+def failure_matrix(table: PassportTable) -> "pandas.DataFrame":
+	"""
+	Returns which of the rules from part two each passport fails.
+
+	There is one column for each of the :py:obj:`validators`, and one row per passport.
+	Unlike :func:`part_two`, every rule is checked for every passport;
+	a missing field fails both ``validate_passport`` and the rule for that field.
+
+	:param table:
+	"""
+
+	columns, present = table.columns, table.present
+	complete = numpy.logical_and.reduce([present[key] for key in sorted(required_keys)])
+
+	passes = {
+			"byr": _check_year(columns["byr"], range(1920, 2003)),
+			"iyr": _check_year(columns["iyr"], range(2010, 2021)),
+			"eyr": _check_year(columns["eyr"], range(2020, 2031)),
+			"hgt": _check_hgt(columns["hgt"]),
+			"hcl": _check_hcl(columns["hcl"]),
+			"ecl": numpy.isin(columns["ecl"], [colour.encode("UTF-8") for colour in valid_eye_colours]),
+			"pid": _check_pid(columns["pid"]),
+			}
+
+	failures = {"validate_passport": ~complete}
+	for field, valid in passes.items():
+		failures[f"validate_{field}"] = ~(valid & present[field])
+
+	return pandas.DataFrame(failures)
+
+
+class PassportAudit(NamedTuple):
+	"""
+	The results of validating a batch of passports with the columnar engine.
+	"""
+
+	n_passports: int
+
+	#: The number of passports with all the required fields (part one).
+	n_complete: int
+
+	#: The number of passports with all the required fields, and valid values for them (part two).
+	n_valid: int
+
+	#: Which rules each passport fails. See :func:`~.failure_matrix`.
+	failures: "pandas.DataFrame"
+
+	@property
+	def rejections(self) -> "pandas.Series":
+		"""
+		The number of passports failing each rule, most first.
+		"""
+
+		return self.failures.sum().sort_values(ascending=False, kind="stable")
+
+
+def audit_table(table: PassportTable) -> PassportAudit:
+	"""
+	Validate every passport in the table against every rule.
+
+	:param table:
+	"""
+
+	failures = failure_matrix(table)
+
+	return PassportAudit(
+			n_passports=len(table),
+			n_complete=int((~failures["validate_passport"]).sum()),
+			n_valid=int((~failures.to_numpy().any(axis=1)).sum()),
+			failures=failures,
+			)
+
+
+def part_one_columnar(table: PassportTable) -> int:
+	return int(numpy.logical_and.reduce([table.present[key] for key in sorted(required_keys)]).sum())
+
+
+def part_two_columnar(table: PassportTable) -> int:
+	return audit_table(table).n_valid
+
+
+# ==========================
+# Adaptive validation
+# ==========================
+
+
+class RuleStats(NamedTuple):
+	"""
+	How often one of the :py:obj:`validators` was called, and how often it rejected a passport.
+	"""
+
+	name: str
+
+	#: The number of calls to the rule, including those made to time it after the warm-up.
+	calls: int
+
+	#: The number of passports this rule was the first to reject.
+	rejections: int
+
+	#: The fraction of passports the rule rejected during the warm-up, when every rule is called.
+	rejection_rate: float
+
+	#: The mean time per call over the warm-up sample, in seconds.
+	mean_cost: float
+
+
+class ValidationReport(NamedTuple):
+	"""
+	The results of validating a batch of passports with an :class:`~.AdaptiveValidator`.
+	"""
+
+	n_passports: int
+	n_valid: int
+
+	#: The order the rules were called in after the warm-up.
+	order: List[str]
+
+	#: The statistics for each rule, in the original order.
+	rules: List[RuleStats]
+
+	#: The number of calls to the rules.
+	calls: int
+
+	#: The number of calls the rules would have taken in their original order, as in :func:`part_two`.
+	fixed_order_calls: int
+
+	#: The time taken to validate the batch, in seconds.
+	elapsed: float
+
+	#: The time taken to validate the batch with the rules in their original order, in seconds.
+	fixed_order_elapsed: float
+
+	@property
+	def calls_saved(self) -> int:
+		"""
+		The number of calls saved by reordering the rules.
+		"""
+
+		return self.fixed_order_calls - self.calls
+
+
+class AdaptiveValidator:
+	"""
+	Validates passports against a list of rules, in an order chosen from a warm-up sample of the batch.
+
+	For the first ``warmup`` passports every rule is called, and whether it rejects the passport is recorded.
+	Each rule is then timed over the whole warm-up sample, as a single call takes well under a microsecond
+	and timing calls individually would mostly measure the timer.
+	The rules are then ordered greedily: first the rule with the lowest cost per passport rejected,
+	then the rule with the lowest cost per passport rejected out of those the first accepted, and so on.
+	The rules which cheaply reject the most passports are therefore called first,
+	and the others can be skipped for those passports.
+
+	A rule which raises a :exc:`KeyError` (because the field it checks is missing) rejects the passport,
+	so the field rules can safely be called before :func:`validate_passport`.
+
+	:param rules: The rules, each a function taking the passport and returning whether it is valid.
+	:param warmup: The number of passports in the warm-up sample.
+	:param by: ``'cost'`` to order the rules by their cost per rejection,
+		or ``'calls'`` to ignore their cost and minimise the number of calls.
+	"""
+
+	def __init__(
+			self,
+			rules: Iterable[Callable[[Dict[str, str]], bool]] = validators,
+			warmup: int = 1000,
+			by: str = "cost",
+			):
+		if by not in {"cost", "calls"}:
+			raise ValueError(f"Unknown ordering {by!r}")
+
+		self.rules = list(rules)
+		self.warmup = warmup
+		self.by = by
+
+		#: The indices of the rules, in the order they are called.
+		self.order = list(range(len(self.rules)))
+
+		self.n_passports = 0
+
+		# The warm-up passports, which rules rejected each of them, and the time each rule took for all of them.
+		self._warmup_sample: List[Dict[str, str]] = []
+		self._warmup_results: List[List[bool]] = []
+		self._warmup_time = [0.0] * len(self.rules)
+		self._timing_calls = [0] * len(self.rules)
+
+		# The number of passports each rule rejected first, during and after the warm-up.
+		self._warmup_rejections = [0] * len(self.rules)
+		self._rejections = [0] * len(self.rules)
+
+	def __call__(self, passport: Dict[str, str]) -> bool:
+		"""
+		Returns whether the passport passes every rule.
+
+		:param passport:
+		"""
+
+		self.n_passports += 1
+
+		if self.n_passports <= self.warmup:
+			return self._check_all(passport)
+
+		for idx in self.order:
+			try:
+				if self.rules[idx](passport):
+					continue
+			except KeyError:
+				pass
+
+			self._rejections[idx] += 1
+			return False
+
+		return True
+
+	def count_valid(self, passports: Sequence[Dict[str, str]]) -> int:
+		"""
+		Returns the number of passports which pass every rule.
+
+		This gives the same result as calling the validator for each passport,
+		but once the warm-up is over the rules are called in a tighter loop.
+
+		:param passports:
+		"""
+
+		n_warmup = max(min(self.warmup - self.n_passports, len(passports)), 0)
+		n_valid = sum(map(self, passports[:n_warmup]))
+
+		rules = [(idx, self.rules[idx]) for idx in self.order]
+		rejections = self._rejections
+
+		for passport in passports[n_warmup:]:
+			try:
+				for idx, func in rules:
+					if not func(passport):
+						rejections[idx] += 1
+						break
+				else:
+					n_valid += 1
+			except KeyError:
+				rejections[idx] += 1
+
+		self.n_passports += len(passports) - n_warmup
+
+		return n_valid
+
+	def _check_all(self, passport: Dict[str, str]) -> bool:
+		rejected = []
+
+		for rule in self.rules:
+			try:
+				is_valid = rule(passport)
+			except KeyError:
+				is_valid = False
+
+			rejected.append(not is_valid)
+
+		self._warmup_sample.append(passport)
+		self._warmup_results.append(rejected)
+
+		if True in rejected:
+			self._warmup_rejections[rejected.index(True)] += 1
+
+		if self.n_passports == self.warmup:
+			self._time_rules()
+			self.reorder()
+
+		return True not in rejected
+
+	def _time_rules(self, repeat: int = 3) -> None:
+		# As with timeit, the fastest of several runs is the one least disturbed by other processes.
+		for idx, rule in enumerate(self.rules):
+			timings = []
+
+			for _ in range(repeat):
+				start = time.perf_counter()
+
+				for passport in self._warmup_sample:
+					try:
+						rule(passport)
+					except KeyError:
+						pass
+
+				timings.append(time.perf_counter() - start)
+
+			self._warmup_time[idx] = min(timings)
+			self._timing_calls[idx] += repeat * len(self._warmup_sample)
+
+		self._warmup_sample = []
+
+	def reorder(self) -> None:
+		"""
+		Order the rules greedily by their cost per rejection, using the results from the warm-up.
+
+		Rules which rejected nothing in the warm-up are called last, in their original order.
+		"""
+
+		remaining = self._warmup_results
+		unused = list(range(len(self.rules)))
+		order = []
+
+		while unused:
+
+			def cost_per_rejection(idx: int) -> float:
+				n_rejected = sum(rejected[idx] for rejected in remaining)
+				cost = self._warmup_time[idx] if self.by == "cost" else 1
+
+				return cost / n_rejected if n_rejected else float("inf")
+
+			best = min(unused, key=cost_per_rejection)
+			order.append(best)
+			unused.remove(best)
+
+			# The next rule only sees the passports accepted by the rules before it.
+			remaining = [rejected for rejected in remaining if not rejected[best]]
+
+		self.order = order
+
+	def stats(self) -> List[RuleStats]:
+		"""
+		Returns the statistics for each rule, in the original order.
+		"""
+
+		n_warmup = min(self.n_passports, self.warmup)
+		calls = [n_warmup + timing_calls for timing_calls in self._timing_calls]
+
+		# After the warm-up, each rule is only called for the passports the rules before it accepted.
+		n_reaching = self.n_passports - n_warmup
+		for idx in self.order:
+			calls[idx] += n_reaching
+			n_reaching -= self._rejections[idx]
+
+		return [
+				RuleStats(
+						name=rule.__name__,
+						calls=calls[idx],
+						rejections=self._warmup_rejections[idx] + self._rejections[idx],
+						rejection_rate=sum(rejected[idx] for rejected in self._warmup_results) / (n_warmup or 1),
+						mean_cost=self._warmup_time[idx] / (n_warmup or 1),
+						) for idx, rule in enumerate(self.rules)
+				]
+
+
+def fixed_order_calls(passports: Iterable[Dict[str, str]], rules: Sequence[Callable] = validators) -> int:
+	"""
+	Returns the number of calls to the rules needed to validate the passports with the rules in a fixed order.
+
+	:param passports:
+	:param rules:
+	"""
+
+	calls = 0
+
+	for passport in passports:
+		for func in rules:
+			calls += 1
+			if not func(passport):
+				break
+
+	return calls
+
+
+def validate_adaptively(
+		passports: Sequence[Dict[str, str]],
+		warmup: int = 1000,
+		by: str = "cost",
+		) -> ValidationReport:
+	"""
+	Validate the passports with an :class:`~.AdaptiveValidator`,
+	and compare the number of calls and time taken with the rules in their original order.
+
+	:param passports:
+	:param warmup: The number of passports in the warm-up sample. At most a tenth of the batch is used.
+	:param by: ``'cost'`` to order the rules by their cost per rejection,
+		or ``'calls'`` to ignore their cost and minimise the number of calls.
+	"""
+
+	# Keep the warm-up, when every rule is called, to a small part of the batch.
+	validator = AdaptiveValidator(validators, min(warmup, len(passports) // 10), by)
+
+	start = time.perf_counter()
+	n_valid = validator.count_valid(passports)
+	elapsed = time.perf_counter() - start
+
+	start = time.perf_counter()
+	baseline_calls = fixed_order_calls(passports)
+	fixed_order_elapsed = time.perf_counter() - start
+
+	rules = validator.stats()
+
+	return ValidationReport(
+			n_passports=len(passports),
+			n_valid=n_valid,
+			order=[validator.rules[idx].__name__ for idx in validator.order],
+			rules=rules,
+			calls=sum(rule.calls for rule in rules),
+			fixed_order_calls=baseline_calls,
+			elapsed=elapsed,
+			fixed_order_elapsed=fixed_order_elapsed,
+			)
+
+
+def format_validation_report(report: ValidationReport) -> str:
+	"""
+	Format the report for display.
+
+	:param report:
+	"""
+
+	lines = [
+			f"{report.n_valid} of {report.n_passports} passports are valid.",
+			f"Rule order: {', '.join(report.order)}",
+			'',
+			f"  {'rule':<18}  {'calls':>10}  {'rejections':>10}  {'rejection rate':>14}  {'mean cost':>10}",
+			]
+
+	for rule in report.rules:
+		lines.append(
+				f"  {rule.name:<18}  {rule.calls:>10}  {rule.rejections:>10}  "
+				f"{rule.rejection_rate:>14.1%}  {rule.mean_cost * 1e6:>8.3f}us"
+				)
+
+	saved = report.calls_saved / report.fixed_order_calls if report.fixed_order_calls else 0
+	lines.extend([
+			'',
+			f"{report.calls} validator calls, against {report.fixed_order_calls} in the fixed order "
+			f"({report.calls_saved} saved, {saved:.1%}).",
+			f"Took {report.elapsed:.3f}s, against {report.fixed_order_elapsed:.3f}s in the fixed order.",
+			])
+
+	return '\n'.join(lines)
+
+
+def part_two_adaptive(passports: List[Dict[str, str]]) -> int:
+	# Unlike validate_adaptively(), this doesn't also validate the batch in the fixed order for comparison.
+	validator = AdaptiveValidator(validators, min(1000, len(passports) // 10))
+	return validator.count_valid(passports)
+
+
+# ==========================
+# Parallel engine
+# ==========================
+
+
+class ValidationCounts(NamedTuple):
+	"""
+	The outcome of validating a batch of passports, or a range of records from one.
+	"""
+
+	#: The number of passports checked.
+	n_checked: int
+
+	#: A mapping of part numbers to the number of passports which are valid under that part's rules.
+	valid: Dict[int, int]
+
+	#: A mapping of part numbers to the byte offsets of the passports which are invalid under that part's rules.
+	invalid: Dict[int, List[int]]
+
+
+def _separator(buffer: bytes) -> bytes:
+	# The blank line between passports, which depends on the file's line endings.
+	first_newline = buffer.find(b'\n')
+	return b"\r\n\r\n" if first_newline > 0 and buffer[first_newline - 1] == 13 else b"\n\n"
+
+
+def validate_range(
+		filename: PathLike,
+		start: int,
+		end: int,
+		parts: Sequence[int] = (1, 2),
+		) -> ValidationCounts:
+	"""
+	Validate the passports in the batch file between the byte offsets ``start`` and ``end``.
+
+	:param filename:
+	:param start: The offset of the first passport.
+	:param end: The offset just after the last passport (including the blank line after it).
+	:param parts: The parts whose rules the passports are checked against.
+	"""
+
+	n_checked = 0
+	valid = dict.fromkeys(parts, 0)
+	invalid: Dict[int, List[int]] = {part: [] for part in parts}
+
+	with map_file(filename) as buffer:
+		separator = _separator(buffer)
+
+		while start < end:
+			record_end = buffer.find(separator, start, end)
+			if record_end == -1:
+				record_end = end
+
+			record = buffer[start:record_end]
+			passport = record.lstrip()
+
+			if passport:
+				n_checked += 1
+				offset = start + len(record) - len(passport)
+				passport_text = passport.decode("UTF-8")
+
+				for part in parts:
+					if check_passport(passport_text, strict=part == 2):
+						valid[part] += 1
+					else:
+						invalid[part].append(offset)
+
+			start = record_end + len(separator)
+
+	return ValidationCounts(n_checked, valid, invalid)
+
+
+def audit_batch(
+		filename: PathLike = input_file,
+		parts: Sequence[int] = (1, 2),
+		jobs: Optional[int] = None,
+		) -> ValidationCounts:
+	"""
+	Validate a (potentially very large) batch of passports in parallel.
+
+	The file is memory mapped and split into byte ranges which end on the blank lines between passports,
+	and the ranges are validated in a pool of worker processes.
+	Only the counts and the offsets of the invalid passports are sent back from each worker.
+
+	:param filename:
+	:param parts: The parts whose rules the passports are checked against.
+	:param jobs: The number of worker processes. Defaults to the number of CPUs.
+	"""
+
+	jobs = jobs or os.cpu_count() or 1
+
+	with map_file(filename) as buffer:
+		separator = _separator(buffer)
+
+	# Several ranges per worker, so one slow range doesn't leave the others idle.
+	ranges = split_file(filename, jobs * 4, separator)
+
+	n_checked = 0
+	valid = dict.fromkeys(parts, 0)
+	invalid: Dict[int, List[int]] = {part: [] for part in parts}
+
+	# Each worker loads this module, and so compiles the rule table, once rather than once per range.
+	with ProcessPoolExecutor(max_workers=jobs, initializer=load_day, initargs=(4, )) as executor:
+		futures = [executor.submit(validate_range, filename, start, end, parts) for start, end in ranges]
+
+		# The ranges are in order, so the offsets stay sorted.
+		for future in futures:
+			result = future.result()
+			n_checked += result.n_checked
+
+			for part in parts:
+				valid[part] += result.valid[part]
+				invalid[part].extend(result.invalid[part])
+
+	return ValidationCounts(n_checked, valid, invalid)
+
+
+def input_path(filename: PathLike = input_file) -> PathPlus:
+	"""
+	Returns the path to the batch file, which the parallel engine reads itself in each worker process.
+
+	:param filename:
+	"""
+
+	return PathPlus(filename)
+
+
+def part_one_parallel(filename: PathLike) -> int:
+	return audit_batch(filename, parts=(1, )).valid[1]
+
+
+def part_two_parallel(filename: PathLike) -> int:
+	return audit_batch(filename, parts=(2, )).valid[2]
+
+
+#: Alternative implementations of each part, which can be selected with ``--engine``.
+engines = {
+		"streaming": {1: part_one_streaming, 2: part_two_streaming},
+		"columnar": {1: part_one_columnar, 2: part_two_columnar},
+		"adaptive": {1: part_one, 2: part_two_adaptive},
+		"parallel": {1: part_one_parallel, 2: part_two_parallel},
+		}
+
+#: Parsers for the alternative implementations, used in place of :func:`parse_input`.
+parsers = {"streaming": PassportFile, "columnar": load_table, "parallel": input_path}
+
+
+if __name__ == "__main__":
+	passports = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print(f"There are {part_one(passports)} valid passports!")  # 230
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
+
+	print(f"There are {part_two(passports)} valid passports!")  # 156
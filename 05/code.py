@@ -58,43 +58,78 @@ As a sanity check, look through your list of boarding passes.
 What is the highest seat ID on a boarding pass?.
 """
 
+# stdlib
+import re
+from typing import Iterable, Iterator, List
+
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.lazy import lazy_import
+from aoc2020.loader import as_grid, stream_lines
+
+numpy = lazy_import("numpy")
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-seats = [x for x in PathPlus("input.txt").read_lines() if x]
+
+def parse_input(filename: PathLike = input_file) -> List[str]:
+	return [x for x in PathPlus(filename).read_lines() if x]
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[str]:
+	return stream_lines(lines)
+
+
+#: Translates the letters of a boarding pass to the bits of its seat ID.
+seat_bits = str.maketrans("FBLR", "0101")
+
+#: Matches a valid boarding pass.
+seat_pattern = re.compile(r"[FB]{7}[LR]{3}")
+
+
+def decode_seat(seat: str) -> int:
+	"""
+	Returns the seat ID for the given boarding pass.
+
+	The row and column are binary numbers with ``F``/``L`` for ``0`` and ``B``/``R`` for ``1``,
+	and the row is multiplied by eight, so the whole pass is simply a 10-bit binary number.
+
+	:param seat:
+
+	:raises ValueError: If the boarding pass is not seven of ``F`` and ``B`` followed by three of ``L`` and ``R``.
+	"""
+
+	if seat_pattern.fullmatch(seat) is None:
+		raise ValueError(f"Invalid boarding pass {seat!r}")
+
+	return int(seat.translate(seat_bits), 2)
 
 
 def calc_seat_id(seat: str) -> int:
-	rows = list(range(128))
-	columns = list(range(8))
+	"""
+	Returns the seat ID for the given boarding pass.
 
-	for char in seat:
-		if char == 'F':
-			rows = rows[:len(rows) // 2]
-		elif char == 'B':
-			rows = rows[len(rows) // 2:]
-		elif char == 'L':
-			columns = columns[:len(columns) // 2]
-		elif char == 'R':
-			columns = columns[len(columns) // 2:]
+	Kept for compatibility; this is now the same as :func:`~.decode_seat`.
 
-	assert len(rows) == 1
-	assert len(columns) == 1
+	:param seat:
+	"""
 
-	return (rows[0] * 8) + columns[0]
+	return decode_seat(seat)
 
 
-seat_ids = [calc_seat_id(seat) for seat in seats]
-highest_seat_id = max(seat_ids)
+def part_one(seats: Iterable[str]) -> int:
+	return max(map(decode_seat, seats))
 
-print("The highest seat id is:", highest_seat_id)
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 Ding! The "fasten seat belt" signs have turned on. Time to find your seat.
@@ -109,8 +144,79 @@ from yours will be in your list.
 What is the ID of your seat?
 """
 
-missing_seats = set(seat_ids) ^ set(range(min(seat_ids), max(seat_ids) + 1))
 
-assert len(missing_seats) == 1
+def part_two(seats: Iterable[str]) -> int:
+	# There are only 1024 possible seat IDs, however many boarding passes there are.
+	seat_ids = set(map(decode_seat, seats))
+	missing_seats = seat_ids ^ set(range(min(seat_ids), max(seat_ids) + 1))
+
+	assert len(missing_seats) == 1
+
+	return next(iter(missing_seats))
+
+
+# ==========================
+# NumPy engine
+# ==========================
+
+
+def load_seat_ids(filename: PathLike = input_file) -> "numpy.ndarray":
+	"""
+	Decode every boarding pass in the file at once,
+	as a matrix of bits (one row per pass) multiplied by the powers of two.
+
+	:param filename:
+
+	:raises ValueError: If any boarding pass is not seven of ``F`` and ``B`` followed by three of ``L`` and ``R``.
+	"""
+
+	letters = as_grid(PathPlus(filename).read_bytes())
+
+	if letters.shape[1] != 10:
+		raise ValueError("Every boarding pass must be 10 letters long")
+
+	# The letters for 0 and 1 in each position of the pass.
+	zeros = numpy.frombuffer(b"FFFFFFFLLL", dtype=numpy.uint8)
+	ones = numpy.frombuffer(b"BBBBBBBRRR", dtype=numpy.uint8)
+
+	bits = letters == ones
+	if not (bits | (letters == zeros)).all():
+		raise ValueError("Boarding passes must be seven of 'F' and 'B' followed by three of 'L' and 'R'")
+
+	return bits.view(numpy.uint8) @ (1 << numpy.arange(9, -1, -1, dtype=numpy.uint16))
+
+
+def part_one_numpy(seat_ids: "numpy.ndarray") -> int:
+	return int(seat_ids.max())
+
+
+def part_two_numpy(seat_ids: "numpy.ndarray") -> int:
+	occupied = numpy.bincount(seat_ids - seat_ids.min())
+	missing_seats = numpy.flatnonzero(occupied == 0) + seat_ids.min()
+
+	assert len(missing_seats) == 1
+
+	return int(missing_seats[0])
+
+
+#: Alternative implementations of each part, which can be selected with ``--engine``.
+engines = {"numpy": {1: part_one_numpy, 2: part_two_numpy}}
+
+#: Parsers for the alternative implementations, used in place of :func:`parse_input`.
+parsers = {"numpy": load_seat_ids}
+
+
+if __name__ == "__main__":
+	seats = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The highest seat id is:", part_one(seats))  # 906
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("The missing seat is", next(iter(missing_seats)))
+	print("The missing seat is", part_two(seats))  # 519
@@ -59,25 +59,34 @@ What is the sum of those counts?.
 # stdlib
 import operator
 from functools import reduce
+from typing import List
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-groups = [x.splitlines() for x in PathPlus("input.txt").read_text().split("\n\n") if x]
 
-total_yes = 0
+def parse_input(filename: PathLike = input_file) -> List[List[str]]:
+	return [x.splitlines() for x in PathPlus(filename).read_text().split("\n\n") if x]
+
+
+def part_one(groups: List[List[str]]) -> int:
+	total_yes = 0
 
-for group in groups:
-	total_yes += len(set(''.join(group)))
+	for group in groups:
+		total_yes += len(set(''.join(group)))
+
+	return total_yes
 
-print("The total is:", total_yes)  # 6630
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 As you finish the last group's customs declaration, you notice that you misread one word in the instructions:
@@ -117,10 +126,28 @@ In this example, the sum of these counts is 3 + 0 + 1 + 1 + 1 = 6.
 For each group, count the number of questions to which everyone answered "yes". What is the sum of those counts?
 """
 
-total_yes = 0
 
-for group in groups:
-	members = [set(m) for m in group]
-	total_yes += len(reduce(operator.and_, members))
+def part_two(groups: List[List[str]]) -> int:
+	total_yes = 0
+
+	for group in groups:
+		members = [set(m) for m in group]
+		total_yes += len(reduce(operator.and_, members))
+
+	return total_yes
+
+
+if __name__ == "__main__":
+	groups = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The total is:", part_one(groups))  # 6630
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("The total is:", total_yes)  # 3437
+	print("The total is:", part_two(groups))  # 3437
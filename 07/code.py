@@ -48,76 +48,84 @@ How many bag colors can eventually contain at least one shiny gold bag?
 # stdlib
 import functools
 import re
-from typing import List
+from typing import Dict, List
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-rules = [x for x in PathPlus("input.txt").read_lines() if x]
-
 bags_re = re.compile(r"([a-z ]*) bags contain ((?:[0-9] [a-z ]*? (?:bag|bags)(?:, |\.))*)")
 delimiter_re = re.compile("[,.]")
 num_bags_re = re.compile("([0-9]) ([a-z ]*) (?:bag|bags)")
 
-bags = {}
 
-for rule in rules:
-	m = bags_re.match(rule)
+def parse_input(filename: PathLike = input_file) -> Dict[str, List[str]]:
+	rules = [x for x in PathPlus(filename).read_lines() if x]
 
-	if m:
-		bag_colour = m.group(1)
-		bag_contents = list(filter(bool, delimiter_re.split(m.group(2))))
+	bags = {}
 
-		if bag_colour in bags:
-			raise ValueError("Duplicate bag!")
+	for rule in rules:
+		m = bags_re.match(rule)
 
-		bags[bag_colour] = bag_contents
+		if m:
+			bag_colour = m.group(1)
+			bag_contents = list(filter(bool, delimiter_re.split(m.group(2))))
 
-for colour, contents in bags.items():
-	flat_contents = []
+			if bag_colour in bags:
+				raise ValueError("Duplicate bag!")
 
-	for inner_bag in contents:
-		# print(inner_bag)
-		m = num_bags_re.match(inner_bag.strip())
-		if m:
-			flat_contents.extend([m.group(2)] * int(m.group(1)))
+			bags[bag_colour] = bag_contents
+
+	for colour, contents in bags.items():
+		flat_contents = []
+
+		for inner_bag in contents:
+			# print(inner_bag)
+			m = num_bags_re.match(inner_bag.strip())
+			if m:
+				flat_contents.extend([m.group(2)] * int(m.group(1)))
+
+		bags[colour] = flat_contents
 
-	bags[colour] = flat_contents
+	return bags
 
-shiny_gold_contents = bags.pop("shiny gold")
 
+def part_one(bags: Dict[str, List[str]]) -> int:
+	bags = {colour: contents for colour, contents in bags.items() if colour != "shiny gold"}
 
-@functools.lru_cache(594)
-def get_contents(colour: str) -> List[str]:
-	contents = bags[colour]
+	@functools.lru_cache(594)
+	def get_contents(colour: str) -> List[str]:
+		contents = bags[colour]
 
-	flat_contents = []
+		flat_contents = []
 
-	for inner_bag in contents:
-		if inner_bag == "shiny gold":
-			flat_contents.append(inner_bag)
-		else:
-			flat_contents.extend(get_contents(inner_bag))
+		for inner_bag in contents:
+			if inner_bag == "shiny gold":
+				flat_contents.append(inner_bag)
+			else:
+				flat_contents.extend(get_contents(inner_bag))
 
-	return flat_contents
+		return flat_contents
 
+	valid_bags = 0
 
-valid_bags = 0
+	for colour in bags:
+		contents = get_contents(colour)
+		# print(colour, sorted(set(contents)))
+		if contents:
+			valid_bags += 1
 
-for colour in bags:
-	contents = get_contents(colour)
-	# print(colour, sorted(set(contents)))
-	if contents:
-		valid_bags += 1
+	return valid_bags
 
-print(f"{valid_bags} bags contain at least one shiny gold bag.")  # 161
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 It's getting pretty expensive to fly these days - not because of ticket prices,
@@ -152,23 +160,40 @@ How many individual bags are required inside your single shiny gold bag?
 """
 
 
-@functools.lru_cache(594)
-def get_contents_v2(colour: str) -> List[str]:
-	contents = bags[colour]
+def part_two(bags: Dict[str, List[str]]) -> int:
+
+	@functools.lru_cache(594)
+	def get_contents_v2(colour: str) -> List[str]:
+		contents = bags[colour]
+
+		total_contents = []
+
+		for inner_bag in contents:
+			total_contents.append(inner_bag)
+			total_contents.extend(get_contents_v2(inner_bag))
+
+		return total_contents
 
 	total_contents = []
 
-	for inner_bag in contents:
-		total_contents.append(inner_bag)
-		total_contents.extend(get_contents_v2(inner_bag))
+	for bag in bags["shiny gold"]:
+		total_contents.append(bag)
+		total_contents.extend(get_contents_v2(bag))
+
+	return len(total_contents)
+
 
-	return total_contents
+if __name__ == "__main__":
+	bags = parse_input()
 
+	# ==========================
+	print("Part One")
+	# ==========================
 
-total_contents = []
+	print(f"{part_one(bags)} bags contain at least one shiny gold bag.")  # 161
 
-for bag in shiny_gold_contents:
-	total_contents.append(bag)
-	total_contents.extend(get_contents_v2(bag))
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print(f"A shiny gold bag contains {len(total_contents)} bags!")  # 30899
+	print(f"A shiny gold bag contains {part_two(bags)} bags!")  # 30899
@@ -73,12 +73,18 @@ from typing import List
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-instructions = [x for x in PathPlus("input.txt").read_lines() if x]
+
+def parse_input(filename: PathLike = input_file) -> List[str]:
+	return [x for x in PathPlus(filename).read_lines() if x]
+
 
 # instructions = [
 # 		"nop +0",
@@ -122,10 +128,12 @@ def run_program(instructions: List[str], abort: bool = False) -> int:
 	return accumulator
 
 
-print("The value of the accumulator is:", run_program(instructions))  # 1548
+def part_one(instructions: List[str]) -> int:
+	return run_program(instructions)
+
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 After some careful analysis, you believe that exactly one instruction is corrupted.
@@ -176,22 +184,40 @@ Fix the program so that it terminates normally by changing exactly one ``jmp`` (
 What is the value of the accumulator after the program terminates?
 """
 
-for idx, op in enumerate(instructions):
-	m = re.match("([a-z]{3}) ([+-][0-9]+)", op)
-	if m.group(1) == "nop":
-		patched_instructions = instructions[:]
-		patched_instructions[idx] = f"jmp {m.group(2)}"
-		try:
-			result = run_program(patched_instructions, True)
-		except RecursionError:
-			continue
-
-	elif m.group(1) == "jmp":
-		patched_instructions = instructions[:]
-		patched_instructions[idx] = f"nop {m.group(2)}"
-		try:
-			result = run_program(patched_instructions, True)
-		except RecursionError:
-			continue
-
-print("After patching boot code, the value of the accumulator is:", result)  # 1375
+
+def part_two(instructions: List[str]) -> int:
+	for idx, op in enumerate(instructions):
+		m = re.match("([a-z]{3}) ([+-][0-9]+)", op)
+		if m.group(1) == "nop":
+			patched_instructions = instructions[:]
+			patched_instructions[idx] = f"jmp {m.group(2)}"
+			try:
+				return run_program(patched_instructions, True)
+			except RecursionError:
+				continue
+
+		elif m.group(1) == "jmp":
+			patched_instructions = instructions[:]
+			patched_instructions[idx] = f"nop {m.group(2)}"
+			try:
+				return run_program(patched_instructions, True)
+			except RecursionError:
+				continue
+
+	raise ValueError("No single patch makes the boot code terminate")
+
+
+if __name__ == "__main__":
+	instructions = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The value of the accumulator is:", part_one(instructions))  # 1548
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
+
+	print("After patching boot code, the value of the accumulator is:", part_two(instructions))  # 1375
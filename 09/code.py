@@ -67,33 +67,58 @@ which is not the sum of two of the ``25`` numbers before it.
 What is the first number that does not have this property?
 """
 
+# stdlib
+import itertools
+from collections import deque
+from typing import Deque, Iterable, Iterator, List
+
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.loader import read_ints, stream_lines
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-numbers = [int(x) for x in PathPlus("input.txt").read_lines() if x]
 
-for idx, value in enumerate(numbers[25:]):
-	last_25 = numbers[idx:idx + 25]
+def parse_input(filename: PathLike = input_file) -> List[int]:
+	return read_ints(filename).tolist()
 
-	valid: bool = False
 
+def parse_stream(lines: Iterable[str]) -> Iterator[int]:
+	return (int(x) for x in stream_lines(lines))
+
+
+def is_valid(value: int, last_25: Deque[int]) -> bool:
 	for other in last_25:
 		if value - other in last_25:
 			if other == value - other and last_25.count(value - other) == 1:
 				continue
 
-			valid = True
+			return True
+
+	return False
+
+
+def part_one(numbers: Iterable[int]) -> int:
+	last_25: Deque[int] = deque(maxlen=25)
+
+	for value in numbers:
+		if len(last_25) == 25 and not is_valid(value, last_25):
+			return value
+
+		last_25.append(value)
+
+	raise ValueError("All values are valid")
 
-	if not valid:
-		print(f"Value {value} at index {idx + 25} is not valid.")  # 41682220
-		break
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 The final step in breaking the XMAS encryption relies on the invalid number you just found:
@@ -131,15 +156,47 @@ in this example, these are ``15`` and ``47``, producing ``62``.
 What is the encryption weakness in your XMAS-encrypted list of numbers?
 """
 
-for idx in range(len(numbers)):
 
-	group = [numbers[idx]]
-	length = 1
+def remember(numbers: Iterable[int], seen: List[int]) -> Iterator[int]:
+	for number in numbers:
+		seen.append(number)
+		yield number
+
+
+def part_two(numbers: Iterable[int]) -> int:
+	numbers = iter(numbers)
+
+	# The numbers before the invalid one have to be kept, as the range is usually among them.
+	seen: List[int] = []
+	value = part_one(remember(numbers, seen))
+
+	group: Deque[int] = deque()
+	total = 0
+
+	for number in itertools.chain(seen, numbers):
+		group.append(number)
+		total += number
+
+		while total > value:
+			total -= group.popleft()
+
+		if total == value and len(group) > 1:
+			return min(group) + max(group)
+
+	raise ValueError("No contiguous range sums to the invalid number")
+
+
+if __name__ == "__main__":
+	numbers = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The first invalid value is:", part_one(numbers))  # 41682220
 
-	while sum(group) < value:
-		group.append(numbers[idx + length])
-		length += 1
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-	if sum(group) == value:
-		print("The encryption weakness is:", min(group) + max(group))  # 5388976
-		break
+	print("The encryption weakness is:", part_two(numbers))  # 5388976
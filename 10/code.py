@@ -118,34 +118,49 @@ What is the number of 1-jolt differences multiplied by the number of 3-jolt diff
 # stdlib
 from collections import Counter
 from functools import reduce
-from typing import Iterator, List
+from typing import List
 
 # 3rd party
-from domdf_python_tools.iterative import make_tree
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.loader import read_ints
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-adapters = sorted(int(x) for x in PathPlus("input.txt").read_lines() if x)
 
-c = Counter()
+def parse_input(filename: PathLike = input_file) -> List[int]:
+	return sorted(read_ints(filename).tolist())
+
+
+def part_one(adapters: List[int]) -> int:
+	c = Counter()
+
+	# Add the joltage of the seat socket
+	adapters = [0, *adapters]
 
-# Add the joltage of the seat socket
-adapters.insert(0, 0)
+	def update_counter(x, y):
+		c[y - x] += 1
+		return y
 
-device_voltage = adapters[-1] + 3
+	reduce(update_counter, adapters)
 
+	# Add an extra 3 jolt difference between last charger and device
+	c[3] += 1
 
-def update_counter(x, y):
-	c[y - x] += 1
-	return y
+	return c[1] * c[3]
 
 
-reduce(update_counter, adapters)
+if __name__ == "__main__":
+	adapters = parse_input()
 
-# Add an extra 3 jolt difference between last charger and device
-c[3] += 1
+	# ==========================
+	print("Part One")
+	# ==========================
 
-print("The answer is:", c[1] * c[3])
+	print("The answer is:", part_one(adapters))  # 2210
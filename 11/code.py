@@ -114,26 +114,28 @@ How many seats end up occupied?
 # stdlib
 from collections import Counter
 from itertools import chain
-from typing import Iterable
+from typing import Iterable, List
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-original_seats = seats = [list(x) for x in PathPlus("input.txt").read_lines() if x]
-
-row_length = len(seats[0])
-col_length = len(seats)
-
 EMPTY = 'L'
 OCCUPIED = '#'
 FLOOR = '.'
 
 
-def get_adjacent_seats(x: int, y: int) -> Iterable[str]:
+def parse_input(filename: PathLike = input_file) -> List[List[str]]:
+	return [list(x) for x in PathPlus(filename).read_lines() if x]
+
+
+def get_adjacent_seats(seats: List[List[str]], x: int, y: int) -> Iterable[str]:
 	x_min = x - 1
 	x_max = x + 1
 	y_min = y - 1
@@ -158,49 +160,46 @@ def get_adjacent_seats(x: int, y: int) -> Iterable[str]:
 				pass
 
 
-iteration = 1
+def part_one(seats: List[List[str]]) -> int:
+	iteration = 1
 
-while True:
-	changes = 0
-	new_seats = []
+	while True:
+		changes = 0
+		new_seats = []
 
-	for y_idx, row in enumerate(seats):
-		new_seats.append([])
+		for y_idx, row in enumerate(seats):
+			new_seats.append([])
 
-		for x_idx, seat in enumerate(row):
+			for x_idx, seat in enumerate(row):
 
-			adjacent_seats = Counter(get_adjacent_seats(x_idx, y_idx))
+				adjacent_seats = Counter(get_adjacent_seats(seats, x_idx, y_idx))
 
-			if seat == EMPTY:
-				if not adjacent_seats[OCCUPIED]:
-					new_seats[y_idx].append(OCCUPIED)
-					changes += 1
-					continue
-			elif seat == OCCUPIED:
-				if adjacent_seats[OCCUPIED] >= 4:
-					new_seats[y_idx].append(EMPTY)
-					changes += 1
-					continue
+				if seat == EMPTY:
+					if not adjacent_seats[OCCUPIED]:
+						new_seats[y_idx].append(OCCUPIED)
+						changes += 1
+						continue
+				elif seat == OCCUPIED:
+					if adjacent_seats[OCCUPIED] >= 4:
+						new_seats[y_idx].append(EMPTY)
+						changes += 1
+						continue
 
-			new_seats[y_idx].append(seat)
+				new_seats[y_idx].append(seat)
 
-	if seats == new_seats:
-		break
-
-	seats = new_seats
+		if seats == new_seats:
+			break
 
-	# print("Iteration", iteration, ",", changes, "changes")
-	iteration += 1
+		seats = new_seats
 
-for row in new_seats:
-	print(row)
+		# print("Iteration", iteration, ",", changes, "changes")
+		iteration += 1
 
-occupied_seats = Counter(chain.from_iterable(seats))[OCCUPIED]
+	return Counter(chain.from_iterable(seats))[OCCUPIED]
 
-print(f"After everyone has stopped moving, {occupied_seats} seats are occupied.")  # 2324
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 As soon as people start to arrive, you realize your mistake.
@@ -342,10 +341,10 @@ Given the new visibility method and the rule change for occupied seats becoming
 once equilibrium is reached, how many seats end up occupied?
 """
 
-seats = original_seats
 
-
-def get_visible_seats(x: int, y: int) -> Iterable[str]:
+def get_visible_seats(seats: List[List[str]], x: int, y: int) -> Iterable[str]:
+	row_length = len(seats[0])
+	col_length = len(seats)
 
 	# looking right
 	for x_idx in range(x + 1, row_length):
@@ -452,41 +451,55 @@ def get_visible_seats(x: int, y: int) -> Iterable[str]:
 		offset += 1
 
 
-iteration = 1
+def part_two(seats: List[List[str]]) -> int:
+	iteration = 1
 
-while True:
-	changes = 0
-	new_seats = []
+	while True:
+		changes = 0
+		new_seats = []
 
-	for y_idx, row in enumerate(seats):
-		new_seats.append([])
+		for y_idx, row in enumerate(seats):
+			new_seats.append([])
 
-		for x_idx, seat in enumerate(row):
+			for x_idx, seat in enumerate(row):
 
-			adjacent_seats = Counter(get_visible_seats(x_idx, y_idx))
+				adjacent_seats = Counter(get_visible_seats(seats, x_idx, y_idx))
 
-			if seat == EMPTY:
-				print(adjacent_seats)
-				if not adjacent_seats[OCCUPIED]:
-					new_seats[y_idx].append(OCCUPIED)
-					changes += 1
-					continue
-			elif seat == OCCUPIED:
-				if adjacent_seats[OCCUPIED] >= 5:
-					new_seats[y_idx].append(EMPTY)
-					changes += 1
-					continue
+				if seat == EMPTY:
+					if not adjacent_seats[OCCUPIED]:
+						new_seats[y_idx].append(OCCUPIED)
+						changes += 1
+						continue
+				elif seat == OCCUPIED:
+					if adjacent_seats[OCCUPIED] >= 5:
+						new_seats[y_idx].append(EMPTY)
+						changes += 1
+						continue
+
+				new_seats[y_idx].append(seat)
+
+		if seats == new_seats:
+			break
+
+		seats = new_seats
+
+		# print("Iteration", iteration, ",", changes, "changes")
+		iteration += 1
+
+	return Counter(chain.from_iterable(seats))[OCCUPIED]
 
-			new_seats[y_idx].append(seat)
 
-	if seats == new_seats:
-		break
+if __name__ == "__main__":
+	seats = parse_input()
 
-	seats = new_seats
+	# ==========================
+	print("Part One")
+	# ==========================
 
-	# print("Iteration", iteration, ",", changes, "changes")
-	iteration += 1
+	print(f"After everyone has stopped moving, {part_one(seats)} seats are occupied.")  # 2324
 
-occupied_seats = Counter(chain.from_iterable(seats))[OCCUPIED]
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print(f"After everyone has stopped moving, {occupied_seats} seats are occupied.")  # 2068
+	print(f"After everyone has stopped moving, {part_two(seats)} seats are occupied.")  # 2068
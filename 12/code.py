@@ -58,69 +58,80 @@ What is the Manhattan distance between that location and the ship's starting pos
 
 # stdlib
 import re
+from typing import Iterable, Iterator, List
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.loader import stream_lines
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-instructions = [x for x in PathPlus("input.txt").read_lines() if x]
-
-# print(instructions)
-
-x_pos = 0
-y_pos = 0
-angle = 90
-
-for instruction in instructions:
-	m = re.match(r"([NSEWLRF])([0-9]+)", instruction)
-	if m:
-		direction = m.group(1)
-		amount = int(m.group(2))
-	else:
-		raise ValueError(instruction)
-
-	if direction == 'E':
-		x_pos += amount
-	elif direction == 'W':
-		x_pos -= amount
-	elif direction == 'N':
-		y_pos += amount
-	elif direction == 'S':
-		y_pos -= amount
-	elif direction == 'R':
-		if amount % 90:
-			raise ValueError(f"Incompatible angle {amount}")
-		angle += amount
-		angle %= 360
-	elif direction == 'L':
-		if amount % 90:
-			raise ValueError(f"Incompatible angle {amount}")
-		angle -= amount
-		angle %= 360
-	elif direction == 'F':
-		if angle == 0:
-			y_pos += amount
-		elif angle == 90:
-			x_pos += amount
-		elif angle == 180:
-			y_pos -= amount
-		elif angle == 270:
-			x_pos -= amount
-	else:
-		raise ValueError
 
-	# print(instruction, x_pos, y_pos, angle)
-	# input(">>> ")
+def parse_input(filename: PathLike = input_file) -> List[str]:
+	return [x for x in PathPlus(filename).read_lines() if x]
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[str]:
+	return stream_lines(lines)
 
-manhattan_distance = abs(x_pos) + abs(y_pos)
 
-print("The manhattan distance from the start is:", manhattan_distance)  # 582
+def part_one(instructions: Iterable[str]) -> int:
+	x_pos = 0
+	y_pos = 0
+	angle = 90
+
+	for instruction in instructions:
+		m = re.match(r"([NSEWLRF])([0-9]+)", instruction)
+		if m:
+			direction = m.group(1)
+			amount = int(m.group(2))
+		else:
+			raise ValueError(instruction)
+
+		if direction == 'E':
+			x_pos += amount
+		elif direction == 'W':
+			x_pos -= amount
+		elif direction == 'N':
+			y_pos += amount
+		elif direction == 'S':
+			y_pos -= amount
+		elif direction == 'R':
+			if amount % 90:
+				raise ValueError(f"Incompatible angle {amount}")
+			angle += amount
+			angle %= 360
+		elif direction == 'L':
+			if amount % 90:
+				raise ValueError(f"Incompatible angle {amount}")
+			angle -= amount
+			angle %= 360
+		elif direction == 'F':
+			if angle == 0:
+				y_pos += amount
+			elif angle == 90:
+				x_pos += amount
+			elif angle == 180:
+				y_pos -= amount
+			elif angle == 270:
+				x_pos -= amount
+		else:
+			raise ValueError
+
+		# print(instruction, x_pos, y_pos, angle)
+
+	return abs(x_pos) + abs(y_pos)
+
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 Before you can give the destination to the captain,
@@ -168,75 +179,89 @@ What is the Manhattan distance between that location and
 the ship's starting position?
 """
 
-x_pos = 0
-y_pos = 0
-
-w_x_pos = 10
-w_y_pos = 1
-
-for instruction in instructions:
-	m = re.match(r"([NSEWLRF])([0-9]+)", instruction)
-	if m:
-		direction = m.group(1)
-		amount = int(m.group(2))
-	else:
-		raise ValueError(instruction)
-
-	if direction == 'E':
-		w_x_pos += amount
-	elif direction == 'W':
-		w_x_pos -= amount
-	elif direction == 'N':
-		w_y_pos += amount
-	elif direction == 'S':
-		w_y_pos -= amount
-	elif direction == 'R':
-		if amount % 90:
-			raise ValueError(f"Incompatible angle {amount}")
-		amount %= 360
-		print(amount)
-
-		if amount == 90:
-			new_w_y_pos = -w_x_pos
-			new_w_x_pos = w_y_pos
-			w_x_pos = new_w_x_pos
-			w_y_pos = new_w_y_pos
-		elif amount == 180:
-			w_x_pos = -w_x_pos
-			w_y_pos = -w_y_pos
-		elif amount == 270:
-			new_w_y_pos = w_x_pos
-			new_w_x_pos = -w_y_pos
-			w_x_pos = new_w_x_pos
-			w_y_pos = new_w_y_pos
-	elif direction == 'L':
-		if amount % 90:
-			raise ValueError(f"Incompatible angle {amount}")
-		amount %= 360
-
-		if amount == 90:
-			new_w_y_pos = w_x_pos
-			new_w_x_pos = -w_y_pos
-			w_x_pos = new_w_x_pos
-			w_y_pos = new_w_y_pos
-		elif amount == 180:
-			w_x_pos = -w_x_pos
-			w_y_pos = -w_y_pos
-		elif amount == 270:
-			new_w_y_pos = -w_x_pos
-			new_w_x_pos = w_y_pos
-			w_x_pos = new_w_x_pos
-			w_y_pos = new_w_y_pos
-	elif direction == 'F':
-		for repeat in range(amount):
-			y_pos += w_y_pos
-			x_pos += w_x_pos
-	else:
-		raise ValueError
-
-	# print(instruction, x_pos, y_pos, w_x_pos, w_y_pos)
-	# input(">>> ")
-
-manhattan_distance = abs(x_pos) + abs(y_pos)
-
-print("The manhattan distance from the start is:", manhattan_distance)  # 52069
+
+def part_two(instructions: Iterable[str]) -> int:
+	x_pos = 0
+	y_pos = 0
+
+	w_x_pos = 10
+	w_y_pos = 1
+
+	for instruction in instructions:
+		m = re.match(r"([NSEWLRF])([0-9]+)", instruction)
+		if m:
+			direction = m.group(1)
+			amount = int(m.group(2))
+		else:
+			raise ValueError(instruction)
+
+		if direction == 'E':
+			w_x_pos += amount
+		elif direction == 'W':
+			w_x_pos -= amount
+		elif direction == 'N':
+			w_y_pos += amount
+		elif direction == 'S':
+			w_y_pos -= amount
+		elif direction == 'R':
+			if amount % 90:
+				raise ValueError(f"Incompatible angle {amount}")
+			amount %= 360
+
+			if amount == 90:
+				new_w_y_pos = -w_x_pos
+				new_w_x_pos = w_y_pos
+				w_x_pos = new_w_x_pos
+				w_y_pos = new_w_y_pos
+			elif amount == 180:
+				w_x_pos = -w_x_pos
+				w_y_pos = -w_y_pos
+			elif amount == 270:
+				new_w_y_pos = w_x_pos
+				new_w_x_pos = -w_y_pos
+				w_x_pos = new_w_x_pos
+				w_y_pos = new_w_y_pos
+		elif direction == 'L':
+			if amount % 90:
+				raise ValueError(f"Incompatible angle {amount}")
+			amount %= 360
+
+			if amount == 90:
+				new_w_y_pos = w_x_pos
+				new_w_x_pos = -w_y_pos
+				w_x_pos = new_w_x_pos
+				w_y_pos = new_w_y_pos
+			elif amount == 180:
+				w_x_pos = -w_x_pos
+				w_y_pos = -w_y_pos
+			elif amount == 270:
+				new_w_y_pos = -w_x_pos
+				new_w_x_pos = w_y_pos
+				w_x_pos = new_w_x_pos
+				w_y_pos = new_w_y_pos
+		elif direction == 'F':
+			for repeat in range(amount):
+				y_pos += w_y_pos
+				x_pos += w_x_pos
+		else:
+			raise ValueError
+
+		# print(instruction, x_pos, y_pos, w_x_pos, w_y_pos)
+
+	return abs(x_pos) + abs(y_pos)
+
+
+if __name__ == "__main__":
+	instructions = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The manhattan distance from the start is:", part_one(instructions))  # 582
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
+
+	print("The manhattan distance from the start is:", part_two(instructions))  # 52069
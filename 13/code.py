@@ -69,39 +69,48 @@ the number of minutes you'll need to wait for that bus?.
 
 # stdlib
 from operator import itemgetter
+from typing import List
 
 # 3rd party
-import numpy
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.lazy import lazy_import
+
+numpy = lazy_import("numpy")
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-lines = PathPlus("input.txt").read_lines()
 
-earliest = int(lines[0])
-buses = sorted(map(int, filter(str.isdigit, lines[1].split(','))))
+def parse_input(filename: PathLike = input_file) -> List[str]:
+	return PathPlus(filename).read_lines()
 
-print(earliest)
-print(buses)
 
-possible_times = []
+def part_one(lines: List[str]) -> int:
+	earliest = int(lines[0])
+	buses = sorted(map(int, filter(str.isdigit, lines[1].split(','))))
 
-for bus in buses:
-	possible_times.append((bus, int(earliest / bus) * bus))
-	possible_times.append((bus, (int(earliest / bus) + 1) * bus))
+	possible_times = []
 
-possible_times = sorted(filter(lambda t: t[1] >= earliest, possible_times), key=itemgetter(1))
+	for bus in buses:
+		possible_times.append((bus, int(earliest / bus) * bus))
+		possible_times.append((bus, (int(earliest / bus) + 1) * bus))
 
-next_bus = possible_times[0]
+	possible_times = sorted(filter(lambda t: t[1] >= earliest, possible_times), key=itemgetter(1))
+
+	next_bus = possible_times[0]
+
+	# print(f"Have to wait {next_bus[1] - earliest} to catch bus {next_bus[0]}")
+	return (next_bus[1] - earliest) * next_bus[0]
 
-print(next_bus)
-print(f"Have to wait {next_bus[1] - earliest} to catch bus {next_bus[0]}")
-print("The answer is:", (next_bus[1] - earliest) * next_bus[0])  # 370
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 The shuttle company is running a contest: one gold coin for anyone that can find the earliest timestamp
@@ -177,25 +186,43 @@ What is the earliest timestamp such that all of the listed bus IDs depart at
 offsets matching their positions in the list?
 """
 
-buses = [int(x) if x.isdigit() else x for x in lines[1].split(',')]
 
-# From https://www.reddit.com/r/adventofcode/comments/kc4njx/2020_day_13_solutions/gfs4g0k
-# Start time and increment are equal to the first bus
-t = step = buses[0]
+def part_two(lines: List[str]) -> int:
+	buses = [int(x) if x.isdigit() else x for x in lines[1].split(',')]
+
+	# From https://www.reddit.com/r/adventofcode/comments/kc4njx/2020_day_13_solutions/gfs4g0k
+	# Start time and increment are equal to the first bus
+	t = step = buses[0]
+
+	for bus in buses[1:]:
+		if not isinstance(bus, int):
+			continue
+
+		while True:
+			# The index value of the number is how far it is from the first number
+			if (t + buses.index(bus)) % bus == 0:
+				break
+
+			t += step  # incrementing time with LCM of current number in the loop and the previous number
+			# print(t)
+
+		# Take the LCM in case some number in the input is not a prime number
+		step = numpy.lcm(step, bus)
+
+	return int(t)
+
 
-for bus in buses[1:]:
-	if not isinstance(bus, int):
-		continue
+if __name__ == "__main__":
+	lines = parse_input()
 
-	while True:
-		# The index value of the number is how far it is from the first number
-		if (t + buses.index(bus)) % bus == 0:
-			break
+	# ==========================
+	print("Part One")
+	# ==========================
 
-		t += step  # incrementing time with LCM of current number in the loop and the previous number
-		# print(t)
+	print("The answer is:", part_one(lines))  # 370
 
-	# Take the LCM in case some number in the input is not a prime number
-	step = numpy.lcm(step, bus)
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("The answer is:", t)  # 894954360381385
+	print("The answer is:", part_two(lines))  # 894954360381385
@@ -66,46 +66,62 @@ What is the sum of all values left in memory after it completes?.
 # stdlib
 import itertools
 import re
+from typing import Iterable, Iterator, List
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.loader import stream_lines
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-instructions = [x for x in PathPlus("input.txt").read_lines() if x]
-
 mask_re = re.compile("mask = ([01X]{36})")
 mem_re = re.compile(r"mem\[([0-9]+)] = ([0-9]+)")
 
-mask = None
-memory = {}
 
-for instruction in instructions:
-	mask_m = mask_re.match(instruction)
-	mem_m = mem_re.match(instruction)
+def parse_input(filename: PathLike = input_file) -> List[str]:
+	return [x for x in PathPlus(filename).read_lines() if x]
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[str]:
+	return stream_lines(lines)
+
+
+def part_one(instructions: Iterable[str]) -> int:
+	mask = None
+	memory = {}
+
+	for instruction in instructions:
+		mask_m = mask_re.match(instruction)
+		mem_m = mem_re.match(instruction)
 
-	if mask_m:
-		mask = mask_m.group(1)[::-1]
-	elif mem_m:
-		value = f"{int(mem_m.group(2)):b}".zfill(36)[::-1]
-		print(value, mask)
+		if mask_m:
+			mask = mask_m.group(1)[::-1]
+		elif mem_m:
+			value = f"{int(mem_m.group(2)):b}".zfill(36)[::-1]
+			# print(value, mask)
 
-		masked_val = []
+			masked_val = []
 
-		for val_val, mask_val in zip(value, mask):
-			if mask_val == 'X':
-				masked_val.append(val_val)
-			else:
-				masked_val.append(mask_val)
+			for val_val, mask_val in zip(value, mask):
+				if mask_val == 'X':
+					masked_val.append(val_val)
+				else:
+					masked_val.append(mask_val)
 
-		memory[int(mem_m.group(1))] = int(''.join(masked_val[::-1]), 2)
+			memory[int(mem_m.group(1))] = int(''.join(masked_val[::-1]), 2)
+
+	return sum(memory.values())
 
-print("The sum of values in memory is:", sum(memory.values()))  # 8332632930672
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 For some reason, the sea port's computer system still can't communicate with your ferry's docking program.
@@ -170,32 +186,50 @@ Execute the initialization program using an emulator for a version 2 decoder chi
 What is the sum of all values left in memory after it completes?
 """
 
-mask = None
-memory = {}
 
-for instruction in instructions:
-	mask_m = mask_re.match(instruction)
-	mem_m = mem_re.match(instruction)
+def part_two(instructions: Iterable[str]) -> int:
+	mask = None
+	memory = {}
+
+	for instruction in instructions:
+		mask_m = mask_re.match(instruction)
+		mem_m = mem_re.match(instruction)
+
+		if mask_m:
+			mask = mask_m.group(1)[::-1]
+		elif mem_m:
+			maddr = f"{int(mem_m.group(1)):b}".zfill(36)[::-1]
+
+			masked_maddr = []
+
+			for maddr_maddr, mask_maddr in zip(maddr, mask):
+				if mask_maddr == '0':
+					masked_maddr.append(maddr_maddr)
+				elif mask_maddr == '1':
+					masked_maddr.append(mask_maddr)
+				else:
+					masked_maddr.append('X')
+
+			x_perms = itertools.product("01", repeat=masked_maddr.count('X'))
+			for perm in x_perms:
+				perm = iter(perm)
+				floating_maddr = [v if v != 'X' else next(perm) for v in masked_maddr]
+				memory[int(''.join(floating_maddr[::-1]), 2)] = int(mem_m.group(2))
+
+	return sum(memory.values())
+
 
-	if mask_m:
-		mask = mask_m.group(1)[::-1]
-	elif mem_m:
-		maddr = f"{int(mem_m.group(1)):b}".zfill(36)[::-1]
+if __name__ == "__main__":
+	instructions = parse_input()
 
-		masked_maddr = []
+	# ==========================
+	print("Part One")
+	# ==========================
 
-		for maddr_maddr, mask_maddr in zip(maddr, mask):
-			if mask_maddr == '0':
-				masked_maddr.append(maddr_maddr)
-			elif mask_maddr == '1':
-				masked_maddr.append(mask_maddr)
-			else:
-				masked_maddr.append('X')
+	print("The sum of values in memory is:", part_one(instructions))  # 8332632930672
 
-		x_perms = itertools.product("01", repeat=masked_maddr.count('X'))
-		for perm in x_perms:
-			perm = iter(perm)
-			floating_maddr = [v if v != 'X' else next(perm) for v in masked_maddr]
-			memory[int(''.join(floating_maddr[::-1]), 2)] = int(mem_m.group(2))
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("The sum of values in memory is:", sum(memory.values()))  # 4753238784664
+	print("The sum of values in memory is:", part_two(instructions))  # 4753238784664
@@ -69,41 +69,57 @@ Given your starting numbers, what will be the ``2020``th number spoken?
 
 # stdlib
 from collections import defaultdict
+from typing import List
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
 
 # from domdf_python_tools.utils import head
 
+input_file = PathPlus(__file__).with_name("input.txt")
+
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-seed = list(map(int, "2,0,1,9,5,19".split(',')))
 
-# keys are numbers, values are turns when said
-history = defaultdict(list)
+def parse_input(filename: PathLike = input_file) -> List[int]:
+	return list(map(int, PathPlus(filename).read_text().strip().split(',')))
+
+
+def play_game(seed: List[int], n_turns: int) -> int:
+	# keys are numbers, values are turns when said
+	history = defaultdict(list)
+
+	for turn, num in enumerate(seed):
+		history[num].append(turn + 1)
+
+	last_num = seed[-1]
+
+	for turn in range(len(seed) + 1, n_turns + 1):
+		# print(f"This is turn {turn}. Last number was {last_num}")
 
-for turn, num in enumerate(seed):
-	history[num].append(turn + 1)
+		if len(history[last_num]) == 1:
+			# print("That was the first time it was spoken.")
+			last_num = 0
+		else:
+			# print(f"It has been spoken on turns {head(history[last_num][::-1])}")
+			last_num = history[last_num][-1] - history[last_num][-2]
 
-last_num = seed[-1]
+		# print(f'Say "{last_num}"\n')
 
-for turn in range(len(seed) + 1, 2021):
-	# print(f"This is turn {turn}. Last number was {last_num}")
+		history[last_num].append(turn)
 
-	if len(history[last_num]) == 1:
-		# print("That was the first time it was spoken.")
-		last_num = 0
-	else:
-		# print(f"It has been spoken on turns {head(history[last_num][::-1])}")
-		last_num = history[last_num][-1] - history[last_num][-2]
+	return last_num
 
-	# print(f'Say "{last_num}"\n')
 
-	history[last_num].append(turn)
+def part_one(seed: List[int]) -> int:
+	return play_game(seed, 2020)
 
-print("The 2020th number spoken is:", last_num)  # 1009
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 Impressed, the Elves issue you a challenge: determine the ``30000000th`` number spoken.
@@ -120,26 +136,22 @@ For example, given the same starting numbers as above:
 Given your starting numbers, what will be the 30000000th number spoken?
 """
 
-# keys are numbers, values are turns when said
-history = defaultdict(list)
 
-for turn, num in enumerate(seed):
-	history[num].append(turn + 1)
+def part_two(seed: List[int]) -> int:
+	return play_game(seed, 30000000)
 
-last_num = seed[-1]
 
-for turn in range(len(seed) + 1, 30000001):
-	# print(f"This is turn {turn}. Last number was {last_num}")
+if __name__ == "__main__":
+	seed = parse_input()
 
-	if len(history[last_num]) == 1:
-		# print("That was the first time it was spoken.")
-		last_num = 0
-	else:
-		# print(f"It has been spoken on turns {head(history[last_num][::-1])}")
-		last_num = history[last_num][-1] - history[last_num][-2]
+	# ==========================
+	print("Part One")
+	# ==========================
 
-	# print(f'Say "{last_num}"\n')
+	print("The 2020th number spoken is:", part_one(seed))  # 1009
 
-	history[last_num].append(turn)
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("The 30000000th number spoken is:", last_num)  # 62714
+	print("The 30000000th number spoken is:", part_two(seed))  # 62714
@@ -74,53 +74,79 @@ What is your ticket scanning error rate?
 import math
 import re
 from collections import defaultdict
+from typing import Dict, List, NamedTuple, Tuple
 
 # 3rd party
-import numpy
-import pandas
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.lazy import lazy_import
+
+numpy = lazy_import("numpy")
+pandas = lazy_import("pandas")
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-lines = [x for x in PathPlus("input.txt").read_lines() if x]
 
-# Parse fields
-fields = {}
+class Notes(NamedTuple):
+	fields: Dict[str, List[range]]
+	our_ticket: List[int]
+	nearby_tickets: List[List[int]]
+
+
+def parse_input(filename: PathLike = input_file) -> Notes:
+	lines = [x for x in PathPlus(filename).read_lines() if x]
+
+	# Parse fields
+	fields = {}
+
+	for field in lines[:20]:
+		m = re.match(r"([a-z ]+): ([0-9\- or]+)", field)
+
+		ranges = []
+		for match in re.findall(r"([0-9]+-[0-9]+)", m.group(2)):
+			start, stop = map(int, match.split('-'))
+			stop += 1
+			ranges.append(range(start, stop))
+
+		fields[m.group(1)] = ranges
 
-for field in lines[:20]:
-	m = re.match(r"([a-z ]+): ([0-9\- or]+)", field)
+	our_ticket = list(map(int, lines[21].split(',')))
+	nearby_tickets = [list(map(int, line.split(','))) for line in lines[23:]]
 
-	ranges = []
-	for match in re.findall(r"([0-9]+-[0-9]+)", m.group(2)):
-		start, stop = map(int, match.split('-'))
-		stop += 1
-		ranges.append(range(start, stop))
+	return Notes(fields, our_ticket, nearby_tickets)
 
-	fields[m.group(1)] = ranges
 
-our_ticket = list(map(int, lines[21].split(',')))
-nearby_tickets = [list(map(int, line.split(','))) for line in lines[23:]]
+def check_tickets(notes: Notes) -> Tuple[List[int], List[List[int]]]:
+	invalid_values = []
+	somewhat_valid_tickets = []
 
-invalid_values = []
-somewhat_valid_tickets = []
+	for ticket in notes.nearby_tickets:
+		all_valid = True
 
-for ticket in nearby_tickets:
-	all_valid = True
+		for field in ticket:
+			if not any([field in r for ranges in notes.fields.values() for r in ranges]):
+				invalid_values.append(field)
+				all_valid = False
 
-	for field in ticket:
-		if not any([field in r for ranges in fields.values() for r in ranges]):
-			invalid_values.append(field)
-			all_valid = False
+		if all_valid:
+			somewhat_valid_tickets.append(ticket)
 
-	if all_valid:
-		somewhat_valid_tickets.append(ticket)
+	return invalid_values, somewhat_valid_tickets
+
+
+def part_one(notes: Notes) -> int:
+	invalid_values, somewhat_valid_tickets = check_tickets(notes)
+	return sum(invalid_values)
 
-print("The sum of all invalid values is:", sum(invalid_values))  # 24110
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 Now that you've identified which tickets contain invalid values,
@@ -153,37 +179,55 @@ Once you work out which field is which, look for the six fields on your ticket t
 What do you get if you multiply those six values together?
 """
 
-somewhat_valid_df = pandas.DataFrame([*somewhat_valid_tickets, our_ticket])
-candidates = defaultdict(list)
 
-for field_idx in somewhat_valid_df.columns:
-	field_values = sorted(somewhat_valid_df[field_idx])
+def part_two(notes: Notes) -> int:
+	invalid_values, somewhat_valid_tickets = check_tickets(notes)
+
+	somewhat_valid_df = pandas.DataFrame([*somewhat_valid_tickets, notes.our_ticket])
+	candidates = defaultdict(list)
 
-	for field_name, field_ranges in fields.items():
-		if numpy.all([field in field_ranges[0] or field in field_ranges[1] for field in field_values]):
-			candidates[field_name].append(field_idx)
+	for field_idx in somewhat_valid_df.columns:
+		field_values = sorted(somewhat_valid_df[field_idx])
 
-finalised_fields = {}
+		for field_name, field_ranges in notes.fields.items():
+			if numpy.all([field in field_ranges[0] or field in field_ranges[1] for field in field_values]):
+				candidates[field_name].append(field_idx)
 
-while True:
-	for field_name, candidate_indices in candidates.items():
-		if len(candidate_indices) == 1:
-			new_candidates = {}
-			for key, value in candidates.items():
-				if key == field_name:
-					continue
+	finalised_fields = {}
 
-				value.remove(candidate_indices[0])
-				new_candidates[key] = value
+	while True:
+		for field_name, candidate_indices in candidates.items():
+			if len(candidate_indices) == 1:
+				new_candidates = {}
+				for key, value in candidates.items():
+					if key == field_name:
+						continue
 
-			finalised_fields[candidate_indices[0]] = field_name
-			candidates = new_candidates
+					value.remove(candidate_indices[0])
+					new_candidates[key] = value
+
+				finalised_fields[candidate_indices[0]] = field_name
+				candidates = new_candidates
+				break
+		else:
 			break
-	else:
-		break
 
-somewhat_valid_df.rename(finalised_fields, inplace=True, axis=1)
-departure_cols = [c for c in somewhat_valid_df.columns if c.startswith("departure")]
-answer = math.prod(list(somewhat_valid_df[col])[-1] for col in departure_cols)
+	somewhat_valid_df.rename(finalised_fields, inplace=True, axis=1)
+	departure_cols = [c for c in somewhat_valid_df.columns if c.startswith("departure")]
+	return math.prod(int(list(somewhat_valid_df[col])[-1]) for col in departure_cols)
+
+
+if __name__ == "__main__":
+	notes = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The sum of all invalid values is:", part_one(notes))  # 24110
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("The sum of the 'departure' fields on our ticket is:", answer)  # 6766503490793
+	print("The sum of the 'departure' fields on our ticket is:", part_two(notes))  # 6766503490793
@@ -166,104 +166,105 @@ How many cubes are left in the active state after the sixth cycle?.
 
 # stdlib
 from collections import Counter, defaultdict
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-state: Dict[Tuple[int, int, int], str] = defaultdict(lambda: '.')
-
 # initial_state = """\
 # .#.
 # ..#
 # ###""".splitlines()
 
-initial_state = """\
-###...#.
-.##.####
-.####.##
-###.###.
-.##.####
-#.##..#.
-##.####.
-.####.#.""".splitlines()
 
-for y, row in enumerate(initial_state):
-	for x, value in enumerate(row):
-		state[(x, y, 0)] = value
+def parse_input(filename: PathLike = input_file) -> List[str]:
+	return [x for x in PathPlus(filename).read_lines() if x]
 
-minx = 0
-maxx = len(initial_state[0]) - 1
-miny = 0
-maxy = len(initial_state) - 1
-minz = 0
-maxz = 0
 
+def part_one(initial_state: List[str]) -> int:
+	state: Dict[Tuple[int, int, int], str] = defaultdict(lambda: '.')
 
-def visualise_state():
-	for z in range(minz, maxz + 1):
-		print(f"z={z}")
+	for y, row in enumerate(initial_state):
+		for x, value in enumerate(row):
+			state[(x, y, 0)] = value
 
-		for y in range(miny, maxy + 1):
-			for x in range(minx, maxx + 1):
-				print(state[(x, y, z)], end='')
+	minx = 0
+	maxx = len(initial_state[0]) - 1
+	miny = 0
+	maxy = len(initial_state) - 1
+	minz = 0
+	maxz = 0
 
-			print()
+	def visualise_state():
+		for z in range(minz, maxz + 1):
+			print(f"z={z}")
 
-		print()
+			for y in range(miny, maxy + 1):
+				for x in range(minx, maxx + 1):
+					print(state[(x, y, z)], end='')
 
+				print()
 
-# visualise_state()
+			print()
 
-for cycle in range(6):
-	# print(f"\nAfter {cycle + 1} cycles:")
+	# visualise_state()
 
-	minz -= 1
-	minx -= 1
-	miny -= 1
-	maxz += 1
-	maxx += 1
-	maxy += 1
-	active_cubes = []
+	for cycle in range(6):
+		# print(f"\nAfter {cycle + 1} cycles:")
 
-	for z in range(minz, maxz + 1):
-		for y in range(miny, maxy + 1):
-			for x in range(minx, maxx + 1):
-				value = state[(x, y, z)]
-				if value == '#':
-					active_cubes.append((x, y, z))
+		minz -= 1
+		minx -= 1
+		miny -= 1
+		maxz += 1
+		maxx += 1
+		maxy += 1
+		active_cubes = []
 
-	for z in range(minz, maxz + 1):
-		for y in range(miny, maxy + 1):
-			for x in range(minx, maxx + 1):
-				active_neighbours = 0
+		for z in range(minz, maxz + 1):
+			for y in range(miny, maxy + 1):
+				for x in range(minx, maxx + 1):
+					value = state[(x, y, z)]
+					if value == '#':
+						active_cubes.append((x, y, z))
 
-				for x_offset in range(-1, 2):
-					for y_offset in range(-1, 2):
-						for z_offset in range(-1, 2):
-							check_coord = (x + x_offset, y + y_offset, z + z_offset)
-							if check_coord == (x, y, z):
-								continue
+		for z in range(minz, maxz + 1):
+			for y in range(miny, maxy + 1):
+				for x in range(minx, maxx + 1):
+					active_neighbours = 0
+
+					for x_offset in range(-1, 2):
+						for y_offset in range(-1, 2):
+							for z_offset in range(-1, 2):
+								check_coord = (x + x_offset, y + y_offset, z + z_offset)
+								if check_coord == (x, y, z):
+									continue
 
-							if check_coord in active_cubes:
-								active_neighbours += 1
+								if check_coord in active_cubes:
+									active_neighbours += 1
 
-				value = state[(x, y, z)]
+					value = state[(x, y, z)]
 
-				if value == '#':
-					if active_neighbours not in {2, 3}:
-						state[(x, y, z)] = '.'
-				else:
-					if active_neighbours == 3:
-						state[(x, y, z)] = '#'
+					if value == '#':
+						if active_neighbours not in {2, 3}:
+							state[(x, y, z)] = '.'
+					else:
+						if active_neighbours == 3:
+							state[(x, y, z)] = '#'
 
-	# visualise_state()
+		# visualise_state()
+
+	return Counter(state.values())['#']
 
-print(f"After 6 cycles there are {Counter(state.values())['#']} active cubes")  # 319
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 For some reason, your simulated results don't match what the experimental energy source engineers expected.
@@ -528,88 +529,104 @@ Starting with your given initial configuration, simulate six cycles in a 4-dimen
 How many cubes are left in the active state after the sixth cycle?
 """
 
-state: Dict[Tuple[int, int, int, int], str] = defaultdict(lambda: '.')
 
-for y, row in enumerate(initial_state):
-	for x, value in enumerate(row):
-		state[(x, y, 0, 0)] = value
+def part_two(initial_state: List[str]) -> int:
+	state: Dict[Tuple[int, int, int, int], str] = defaultdict(lambda: '.')
 
-minx = 0
-maxx = len(initial_state[0]) - 1
-miny = 0
-maxy = len(initial_state) - 1
-minz = 0
-maxz = 0
-minw = 0
-maxw = 0
+	for y, row in enumerate(initial_state):
+		for x, value in enumerate(row):
+			state[(x, y, 0, 0)] = value
 
+	minx = 0
+	maxx = len(initial_state[0]) - 1
+	miny = 0
+	maxy = len(initial_state) - 1
+	minz = 0
+	maxz = 0
+	minw = 0
+	maxw = 0
 
-def visualise_state():
-	for w in range(minw, maxw + 1):
-		print(f"w={w}")
+	def visualise_state():
+		for w in range(minw, maxw + 1):
+			print(f"w={w}")
 
-		for z in range(minz, maxz + 1):
-			print(f"z={z}")
+			for z in range(minz, maxz + 1):
+				print(f"z={z}")
 
-			for y in range(miny, maxy + 1):
-				for x in range(minx, maxx + 1):
-					print(state[(x, y, z, w)], end='')
+				for y in range(miny, maxy + 1):
+					for x in range(minx, maxx + 1):
+						print(state[(x, y, z, w)], end='')
 
-				print()
+					print()
 
+				print()
 			print()
-		print()
 
+	# visualise_state()
 
-# visualise_state()
+	for cycle in range(6):
+		# print(f"\nAfter {cycle + 1} cycles:")
 
-for cycle in range(6):
-	# print(f"\nAfter {cycle + 1} cycles:")
+		minw -= 1
+		minz -= 1
+		minx -= 1
+		miny -= 1
+		maxw += 1
+		maxz += 1
+		maxx += 1
+		maxy += 1
+		active_cubes = []
 
-	minw -= 1
-	minz -= 1
-	minx -= 1
-	miny -= 1
-	maxw += 1
-	maxz += 1
-	maxx += 1
-	maxy += 1
-	active_cubes = []
+		for w in range(minw, maxw + 1):
+			for z in range(minz, maxz + 1):
+				for y in range(miny, maxy + 1):
+					for x in range(minx, maxx + 1):
+						value = state[(x, y, z, w)]
+						if value == '#':
+							active_cubes.append((x, y, z, w))
 
-	for w in range(minw, maxw + 1):
-		for z in range(minz, maxz + 1):
-			for y in range(miny, maxy + 1):
-				for x in range(minx, maxx + 1):
-					value = state[(x, y, z, w)]
-					if value == '#':
-						active_cubes.append((x, y, z, w))
+		for w in range(minw, maxw + 1):
+			for z in range(minz, maxz + 1):
+				for y in range(miny, maxy + 1):
+					for x in range(minx, maxx + 1):
+						active_neighbours = 0
 
-	for w in range(minw, maxw + 1):
-		for z in range(minz, maxz + 1):
-			for y in range(miny, maxy + 1):
-				for x in range(minx, maxx + 1):
-					active_neighbours = 0
+						for x_offset in range(-1, 2):
+							for y_offset in range(-1, 2):
+								for z_offset in range(-1, 2):
+									for w_offset in range(-1, 2):
+										check_coord = (x + x_offset, y + y_offset, z + z_offset, w + w_offset)
+										if check_coord == (x, y, z, w):
+											continue
 
-					for x_offset in range(-1, 2):
-						for y_offset in range(-1, 2):
-							for z_offset in range(-1, 2):
-								for w_offset in range(-1, 2):
-									check_coord = (x + x_offset, y + y_offset, z + z_offset, w + w_offset)
-									if check_coord == (x, y, z, w):
-										continue
+										if check_coord in active_cubes:
+											active_neighbours += 1
 
-									if check_coord in active_cubes:
-										active_neighbours += 1
+						value = state[(x, y, z, w)]
 
-					value = state[(x, y, z, w)]
+						if value == '#':
+							if active_neighbours not in {2, 3}:
+								state[(x, y, z, w)] = '.'
+						else:
+							if active_neighbours == 3:
+								state[(x, y, z, w)] = '#'
 
-					if value == '#':
-						if active_neighbours not in {2, 3}:
-							state[(x, y, z, w)] = '.'
-					else:
-						if active_neighbours == 3:
-							state[(x, y, z, w)] = '#'
+		# visualise_state()
 
-	# visualise_state()
+	return Counter(state.values())['#']
+
+
+if __name__ == "__main__":
+	initial_state = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print(f"After 6 cycles there are {part_one(initial_state)} active cubes")  # 319
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print(f"After 6 cycles there are {Counter(state.values())['#']} active cubes")  # 2324
+	print(f"After 6 cycles there are {part_two(initial_state)} active cubes")  # 2324
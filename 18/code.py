@@ -51,16 +51,28 @@ Evaluate the expression on each line of the homework; what is the sum of the res
 # stdlib
 import operator
 import re
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, List, Optional
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.loader import stream_lines
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-sums = [x for x in PathPlus("input.txt").read_lines() if x]
+
+def parse_input(filename: PathLike = input_file) -> List[str]:
+	return [x for x in PathPlus(filename).read_lines() if x]
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[str]:
+	return stream_lines(lines)
 
 
 def evaluate_group(expression: str) -> int:
@@ -95,17 +107,19 @@ def evaluate_expression(expression: str) -> int:
 	return evaluate_group(expression)
 
 
-total = 0
+def part_one(sums: Iterable[str]) -> int:
+	total = 0
+
+	for sum_ in sums:
+		answer = evaluate_expression(sum_)
+		# print(sum_, '=', answer)
+		total += answer
 
-for sum_ in sums:
-	answer = evaluate_expression(sum_)
-	print(sum_, '=', answer)
-	total += answer
+	return total
 
-print("The sum of all expressions is:", total)  # 3159145843816
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 You manage to answer the child's questions and they finish part 1 of their homework,
@@ -179,11 +193,28 @@ def evaluate_expression_advanced(expression: str) -> int:
 	return evaluate_group_advanced(expression)
 
 
-total = 0
+def part_two(sums: Iterable[str]) -> int:
+	total = 0
+
+	for sum_ in sums:
+		answer = evaluate_expression_advanced(sum_)
+		# print(sum_, '=', answer)
+		total += answer
+
+	return total
+
+
+if __name__ == "__main__":
+	sums = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The sum of all expressions is:", part_one(sums))  # 3159145843816
 
-for sum_ in sums:
-	answer = evaluate_expression_advanced(sum_)
-	print(sum_, '=', answer)
-	total += answer
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("The sum of all expressions in advanced math is:", total)  # 55699621957369
+	print("The sum of all expressions in advanced math is:", part_two(sums))  # 55699621957369
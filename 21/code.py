@@ -51,13 +51,14 @@ from typing import Dict, List, NamedTuple
 # 3rd party
 from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.stringlist import DelimitedList
+from domdf_python_tools.typing import PathLike
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-foods = [x for x in PathPlus("input.txt").read_lines() if x]
-
 
 class Food(NamedTuple):
 	allergens: List[str]
@@ -71,62 +72,73 @@ class Food(NamedTuple):
 		return cls(allergens, ingredients)
 
 
-all_foods = [Food.parse(food) for food in foods]
-all_allergens = sorted(set(chain.from_iterable(food.allergens for food in all_foods)))
-allergen_possibilities: Dict[str, List[str]] = {}
+def parse_input(filename: PathLike = input_file) -> List[Food]:
+	return [Food.parse(food) for food in PathPlus(filename).read_lines() if food]
+
+
+def find_allergens(all_foods: List[Food]) -> Dict[str, str]:
+	all_allergens = sorted(set(chain.from_iterable(food.allergens for food in all_foods)))
+	allergen_possibilities: Dict[str, List[str]] = {}
 
-for allergen in all_allergens:
+	for allergen in all_allergens:
 
-	all_ingredients = []
-	matching_foods = 0
+		all_ingredients = []
+		matching_foods = 0
 
-	for food in all_foods:
-		if allergen in food.allergens:
-			assert max(Counter(food.ingredients).values()) == 1
-			# print(food)
-			all_ingredients.extend(food.ingredients)
-			matching_foods += 1
+		for food in all_foods:
+			if allergen in food.allergens:
+				assert max(Counter(food.ingredients).values()) == 1
+				# print(food)
+				all_ingredients.extend(food.ingredients)
+				matching_foods += 1
 
-	allergen_possibilities[allergen] = [k for k, v in Counter(all_ingredients).items() if v == matching_foods]
+		allergen_possibilities[allergen] = [k for k, v in Counter(all_ingredients).items() if v == matching_foods]
 
-# print(allergen_possibilities)
+	# print(allergen_possibilities)
 
-finalised_allergens = {}
+	finalised_allergens = {}
 
-while True:
-	for field_name, candidate_indices in allergen_possibilities.items():
-		if len(candidate_indices) == 1:
-			new_allergen_possibilities = {}
-			for key, value in allergen_possibilities.items():
-				if key == field_name:
-					continue
+	while True:
+		for field_name, candidate_indices in allergen_possibilities.items():
+			if len(candidate_indices) == 1:
+				new_allergen_possibilities = {}
+				for key, value in allergen_possibilities.items():
+					if key == field_name:
+						continue
 
-				if candidate_indices[0] in value:
-					value.remove(candidate_indices[0])
-				new_allergen_possibilities[key] = value
+					if candidate_indices[0] in value:
+						value.remove(candidate_indices[0])
+					new_allergen_possibilities[key] = value
 
-			finalised_allergens[candidate_indices[0]] = field_name
-			allergen_possibilities = new_allergen_possibilities
+				finalised_allergens[candidate_indices[0]] = field_name
+				allergen_possibilities = new_allergen_possibilities
+				break
+		else:
 			break
-	else:
-		break
 
-# print(finalised_allergens)
-assert sorted(finalised_allergens.values()) == all_allergens
-assert not allergen_possibilities
+	# print(finalised_allergens)
+	assert sorted(finalised_allergens.values()) == all_allergens
+	assert not allergen_possibilities
+
+	return finalised_allergens
+
+
+def part_one(all_foods: List[Food]) -> int:
+	finalised_allergens = find_allergens(all_foods)
+
+	non_allergen_ingredients = 0
 
-non_allergen_ingredients = 0
+	for ingredient, frequency in Counter(chain.from_iterable(food.ingredients for food in all_foods)).items():
+		if ingredient in finalised_allergens:
+			continue
+		else:
+			non_allergen_ingredients += frequency
 
-for ingredient, frequency in Counter(chain.from_iterable(food.ingredients for food in all_foods)).items():
-	if ingredient in finalised_allergens:
-		continue
-	else:
-		non_allergen_ingredients += frequency
+	return non_allergen_ingredients
 
-print("The number of times ingredients which aren't allergens appear is:", non_allergen_ingredients)  # 2203
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 Now that you've isolated the inert ingredients, you should have enough information to figure out which ingredient
@@ -146,8 +158,28 @@ In the above example, this would be ``mxmxvkd,sqjhc,fvjkl``.
 Time to stock your raft with supplies. What is your canonical dangerous ingredient list?
 """
 
-sorted_allergens = sorted(finalised_allergens.items(), key=itemgetter(1))
-dengerous_ingredient_list = DelimitedList(map(itemgetter(0), sorted_allergens))
-print(
-		f"The dangerous allergens are: {dengerous_ingredient_list:,}"
-		)  # fqfm,kxjttzg,ldm,mnzbc,zjmdst,ndvrq,fkjmz,kjkrm
+
+def part_two(all_foods: List[Food]) -> str:
+	finalised_allergens = find_allergens(all_foods)
+
+	sorted_allergens = sorted(finalised_allergens.items(), key=itemgetter(1))
+	dengerous_ingredient_list = DelimitedList(map(itemgetter(0), sorted_allergens))
+	return f"{dengerous_ingredient_list:,}"
+
+
+if __name__ == "__main__":
+	all_foods = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The number of times ingredients which aren't allergens appear is:", part_one(all_foods))  # 2203
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
+
+	print(
+			f"The dangerous allergens are: {part_two(all_foods)}"
+			)  # fqfm,kxjttzg,ldm,mnzbc,zjmdst,ndvrq,fkjmz,kjkrm
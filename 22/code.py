@@ -131,53 +131,62 @@ from typing import List, Tuple
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
 
-def prepare_decks():
-	players = [x for x in PathPlus("input.txt").read_text().split("\n\n") if x]
+def parse_input(filename: PathLike = input_file) -> Tuple[List[int], List[int]]:
+	players = [x for x in PathPlus(filename).read_text().split("\n\n") if x]
 	player1 = list(map(int, filter(bool, players[0].split('\n')[1:])))
 	player2 = list(map(int, filter(bool, players[1].split('\n')[1:])))
 
 	return player1, player2
 
 
-player1, player2 = prepare_decks()
+def calculate_score(deck: List[int]) -> int:
+	total_score = 0
+
+	for idx, card in enumerate(deck[::-1]):
+		idx += 1
+		total_score += (idx * card)
+
+	return total_score
+
 
-while True:
-	if not player2:
-		print("Player 1 wins!")
-		break
+def part_one(decks: Tuple[List[int], List[int]]) -> int:
+	player1, player2 = map(list, decks)
 
-	if not player1:
-		print("Player 2 wins!")
-		break
+	while True:
+		if not player2:
+			# print("Player 1 wins!")
+			break
 
-	player_1_card = player1.pop(0)
-	player_2_card = player2.pop(0)
+		if not player1:
+			# print("Player 2 wins!")
+			break
 
-	if player_1_card > player_2_card:
-		player1.append(player_1_card)
-		player1.append(player_2_card)
-	elif player_1_card < player_2_card:
-		player2.append(player_2_card)
-		player2.append(player_1_card)
-	elif player_1_card == player_2_card:
-		raise ValueError("Snap!")
+		player_1_card = player1.pop(0)
+		player_2_card = player2.pop(0)
 
-total_score = 0
+		if player_1_card > player_2_card:
+			player1.append(player_1_card)
+			player1.append(player_2_card)
+		elif player_1_card < player_2_card:
+			player2.append(player_2_card)
+			player2.append(player_1_card)
+		elif player_1_card == player_2_card:
+			raise ValueError("Snap!")
 
-for idx, card in enumerate((player1 or player2)[::-1]):
-	idx += 1
-	total_score += (idx * card)
+	return calculate_score(player1 or player2)
 
-print("The total score is:", total_score)  # 31809
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 You lost to the small crab!
@@ -531,13 +540,24 @@ class Game:
 		return bool(self.player1)
 
 
-game = Game(*prepare_decks())
-game.play()
+def part_two(decks: Tuple[List[int], List[int]]) -> int:
+	game = Game(*decks)
+	game.play()
+
+	return calculate_score(game.player1 or game.player2)
+
+
+if __name__ == "__main__":
+	decks = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
 
-total_score = 0
+	print("The total score is:", part_one(decks))  # 31809
 
-for idx, card in enumerate((game.player1 or game.player2)[::-1]):
-	idx += 1
-	total_score += (idx * card)
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print("The total score is:", total_score)  # 32835
+	print("The total score is:", part_two(decks))  # 32835
@@ -62,59 +62,72 @@ After all of the instructions have been followed, how many tiles are left with t
 """
 
 # stdlib
-from collections import Counter
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Set, Tuple
 
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.loader import stream_lines
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
-instructions = [x for x in PathPlus("input.txt").read_lines() if x]
 
-flipped_tiles: List[Tuple[int, int]] = []
+def parse_input(filename: PathLike = input_file) -> List[str]:
+	return [x for x in PathPlus(filename).read_lines() if x]
 
-for instruction in instructions:
-	x_pos = 0
-	y_pos = 0
 
-	for idx, char in enumerate(instruction):
-		if char == 'e':
-			if instruction[idx - 1] == 's':
-				y_pos -= 1
+def parse_stream(lines: Iterable[str]) -> Iterator[str]:
+	return stream_lines(lines)
 
-			elif instruction[idx - 1] == 'n':
-				y_pos += 1
-				x_pos += 1
 
-			else:
-				x_pos += 1
+def get_black_tiles(instructions: Iterable[str]) -> List[Tuple[int, int]]:
+	black_tiles: Set[Tuple[int, int]] = set()
 
-		elif char == 'w':
-			if instruction[idx - 1] == 's':
-				y_pos -= 1
-				x_pos -= 1
+	for instruction in instructions:
+		x_pos = 0
+		y_pos = 0
 
-			elif instruction[idx - 1] == 'n':
-				y_pos += 1
+		for idx, char in enumerate(instruction):
+			if char == 'e':
+				if instruction[idx - 1] == 's':
+					y_pos -= 1
 
-			else:
-				x_pos -= 1
+				elif instruction[idx - 1] == 'n':
+					y_pos += 1
+					x_pos += 1
+
+				else:
+					x_pos += 1
+
+			elif char == 'w':
+				if instruction[idx - 1] == 's':
+					y_pos -= 1
+					x_pos -= 1
+
+				elif instruction[idx - 1] == 'n':
+					y_pos += 1
+
+				else:
+					x_pos -= 1
 
-	flipped_tiles.append((x_pos, y_pos))
+		# Flip the tile
+		black_tiles ^= {(x_pos, y_pos)}
 
-black_tiles = []
+	return list(black_tiles)
 
-for tile, flips in Counter(flipped_tiles).items():
-	if flips % 2:
-		black_tiles.append(tile)
 
-print(f"{len(black_tiles)} tiles were turned to black.")  # 459
+def part_one(instructions: Iterable[str]) -> int:
+	return len(get_black_tiles(instructions))
+
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 The tile floor in the lobby is meant to be a living art exhibit. #
@@ -201,8 +214,27 @@ def flip_tiles(current_black_tiles: List[Tuple[int, int]]):
 	return sorted(set(new_black_tiles))
 
 
-for day in range(100):
-	black_tiles = flip_tiles(black_tiles)
-	# print(f"Day {day + 1}:", len(black_tiles))
+def part_two(instructions: Iterable[str]) -> int:
+	black_tiles = get_black_tiles(instructions)
+
+	for day in range(100):
+		black_tiles = flip_tiles(black_tiles)
+		# print(f"Day {day + 1}:", len(black_tiles))
+
+	return len(black_tiles)
+
+
+if __name__ == "__main__":
+	instructions = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print(f"{part_one(instructions)} tiles were turned to black.")  # 459
+
+	# ==========================
+	print("\nPart Two")
+	# ==========================
 
-print(f"After 100 days there will be {len(black_tiles)} black tiles.")  # 4150
+	print(f"After 100 days there will be {part_two(instructions)} black tiles.")  # 4150
@@ -79,16 +79,32 @@ with a loop size of 8 (the card's loop size) produces the encryption key, ``1489
 What encryption key is the handshake trying to establish?
 """
 
+# stdlib
+import itertools
+from typing import Iterable, Iterator, List
+
 # 3rd party
 from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.loader import read_ints, stream_lines
+
+input_file = PathPlus(__file__).with_name("input.txt")
 
 # ==========================
-print("Part One")
+# Part One
 # ==========================
 
 subject_number = 7
-keys = [int(x) for x in PathPlus("input.txt").read_lines() if x]
-door_public_key, card_public_key, *_ = keys
+
+
+def parse_input(filename: PathLike = input_file) -> List[int]:
+	return read_ints(filename).tolist()
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[int]:
+	return (int(x) for x in stream_lines(lines))
 
 
 def encrypt(subject_number: int, loop_size: int):
@@ -117,35 +133,24 @@ def calc_encryption_key(public_key: int, loop_size: int):
 	return encrypt(public_key, loop_size)
 
 
-assert encrypt(subject_number, 8) == 5764801  # card
-assert encrypt(subject_number, 11) == 17807724  # door
+def part_one(keys: Iterable[int]) -> int:
+	door_public_key, card_public_key = itertools.islice(keys, 2)
 
-assert find_loop_size(5764801) == 8  # card
-assert find_loop_size(17807724) == 11  # door
+	door_loop_size = find_loop_size(door_public_key)
+	card_loop_size = find_loop_size(card_public_key)
 
-assert calc_encryption_key(
-		5764801,  # card's public key
-		11,  # door's loop size
-		) == 14897079
-assert calc_encryption_key(
-		17807724,  # door's public key
-		8,  # card's loop size
-		) == 14897079
+	# print("The door's public key and loop size are:", door_public_key, door_loop_size)
+	# print("The card's public key and loop size are:", card_public_key, card_loop_size)
 
-door_loop_size = find_loop_size(door_public_key)
-card_loop_size = find_loop_size(card_public_key)
+	doors_result = calc_encryption_key(door_public_key, card_loop_size)
+	cards_result = calc_encryption_key(card_public_key, door_loop_size)
+	assert doors_result == cards_result
 
-print("The door's public key and loop size are:", door_public_key, door_loop_size)
-print("The card's public key and loop size are:", card_public_key, card_loop_size)
+	return doors_result
 
-doors_result = calc_encryption_key(door_public_key, card_loop_size)
-cards_result = calc_encryption_key(card_public_key, door_loop_size)
-assert doors_result == cards_result
-
-print("\nThe encryption key established by the handshake is:", doors_result)  # 6198540
 
 # ==========================
-print("\nPart Two")
+# Part Two
 # ==========================
 """
 The light turns green and the door unlocks.
@@ -168,3 +173,27 @@ Sitting at the bottom of the pouch is a gold coin with a little picture of a sta
 
 Looks like you only needed 49 stars after all.
 """
+
+if __name__ == "__main__":
+	assert encrypt(subject_number, 8) == 5764801  # card
+	assert encrypt(subject_number, 11) == 17807724  # door
+
+	assert find_loop_size(5764801) == 8  # card
+	assert find_loop_size(17807724) == 11  # door
+
+	assert calc_encryption_key(
+			5764801,  # card's public key
+			11,  # door's loop size
+			) == 14897079
+	assert calc_encryption_key(
+			17807724,  # door's public key
+			8,  # card's loop size
+			) == 14897079
+
+	keys = parse_input()
+
+	# ==========================
+	print("Part One")
+	# ==========================
+
+	print("The encryption key established by the handshake is:", part_one(keys))  # 6198540
@@ -0,0 +1,5 @@
+"""
+Tools for running and timing the Advent of Code 2020 solutions.
+
+Each day's solution lives in ``NN/code.py`` and exposes ``parse_input``, ``part_one`` and ``part_two``.
+"""
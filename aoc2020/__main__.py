@@ -0,0 +1,386 @@
+"""
+Command line interface for running the solutions.
+
+Run ``python -m aoc2020 --help`` for usage.
+"""
+
+# stdlib
+import argparse
+import sys
+import time
+from typing import List, Optional, Tuple
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+
+# this package
+from aoc2020.benchmark import (
+		benchmark_days,
+		compare_to_baseline,
+		format_benchmark,
+		load_baseline,
+		save_baseline,
+		scaling_exponent,
+		sweep_day
+		)
+from aoc2020.batch import find_inputs, format_jsonl, run_batch
+from aoc2020.budget import Budget, format_budgeted_result, run_days_with_budget
+from aoc2020.cache import ParseCache
+from aoc2020.generators import generators, iter_generate, write_input
+from aoc2020.profiling import format_profile, profile_day, write_collapsed_stacks
+from aoc2020.runner import discover_days, format_result, measure_startup, run_days, stream_day
+
+
+def run(args: argparse.Namespace) -> int:
+	if args.profile:
+		return profile(args)
+	elif args.time_limit or args.memory_limit or args.limit:
+		return run_with_budget(args)
+
+	start = time.perf_counter()
+
+	cache = ParseCache() if args.cache else None
+
+	for result in run_days(args.days or None, jobs=args.jobs, cache=cache, engine=args.engine):
+		print(format_result(result))
+
+	print(f"\nCompleted in {time.perf_counter() - start:.3f}s")
+
+	return 0
+
+
+def parse_limit(limit: str) -> Tuple[Tuple[int, int], Budget]:
+	"""
+	Parse a budget for one day or part, given as ``DAY[:PART]=SECONDS[,MB]``.
+
+	:param limit:
+	"""
+
+	try:
+		target, _, value = limit.partition('=')
+		day, _, part = target.partition(':')
+		seconds, _, megabytes = value.partition(',')
+
+		budget = Budget(
+				time=float(seconds) if seconds else None,
+				memory=int(float(megabytes) * 1024**2) if megabytes else None,
+				)
+		return (int(day), int(part or 0)), budget
+
+	except ValueError:
+		raise argparse.ArgumentTypeError(f"Invalid limit {limit!r}; expected DAY[:PART]=SECONDS[,MB]")
+
+
+def run_with_budget(args: argparse.Namespace) -> int:
+	default = Budget(
+			time=args.time_limit,
+			memory=int(args.memory_limit * 1024**2) if args.memory_limit else None,
+			)
+	budgets = dict(args.limit or [])
+	start = time.perf_counter()
+	failed = False
+
+	cache = ParseCache() if args.cache else None
+	results_by_day = run_days_with_budget(
+			args.days or None,
+			budgets,
+			default,
+			jobs=args.jobs,
+			cache=cache,
+			engine=args.engine,
+			)
+
+	for results in results_by_day:
+		print(f"Day {results[0].day:02d}")
+
+		for result in results:
+			print(format_budgeted_result(result))
+			failed |= result.answer is None
+
+	print(f"\nCompleted in {time.perf_counter() - start:.3f}s")
+
+	return int(failed)
+
+
+def profile(args: argparse.Namespace) -> int:
+	output_dir = PathPlus(args.profile_dir)
+	output_dir.maybe_make(parents=True)
+
+	cache = ParseCache() if args.cache else None
+
+	for day in args.days or discover_days():
+		for part_profile in profile_day(day, top=args.top, cache=cache, engine=args.engine):
+			print(format_profile(part_profile), end="\n\n")
+
+			engine = f"-{args.engine}" if args.engine else ''
+			stacks_file = output_dir / f"day{day:02d}-part{part_profile.part}{engine}.folded"
+			write_collapsed_stacks(part_profile, stacks_file)
+			print(f"  Collapsed stacks written to {stacks_file}\n")
+
+	return 0
+
+
+def bench(args: argparse.Namespace) -> int:
+	if args.sweep:
+		return sweep(args)
+
+	cache = ParseCache() if args.cache else None
+	results = benchmark_days(
+			args.days or None,
+			repeat=args.repeat,
+			cache=cache,
+			startup=args.startup,
+			all_engines=args.engines,
+			)
+	failed = False
+
+	for result in results:
+		print(format_benchmark(result))
+		failed |= result.correct is False
+
+	if args.compare:
+		regressions = compare_to_baseline(results, load_baseline(args.compare), threshold=args.threshold)
+
+		for regression in regressions:
+			engine = '' if regression.engine is None else f" [{regression.engine}]"
+			print(
+					f"Day {regression.day:02d} part {regression.part}{engine} "
+					f"is {regression.slowdown:.2f}x slower "
+					f"than the baseline ({regression.baseline:.6f}s -> {regression.current:.6f}s)"
+					)
+
+		failed |= bool(regressions)
+
+	if args.save:
+		save_baseline(results, args.save)
+
+	return int(failed)
+
+
+def sweep(args: argparse.Namespace) -> int:
+	if len(args.sweep) < 2:
+		raise SystemExit("At least two sizes are needed to measure how a solution scales.")
+
+	for day in args.days or generators:
+		results = sweep_day(day, args.sweep, repeat=args.repeat, seed=args.seed)
+		parts = {result.part for size_results in results.values() for result in size_results}
+
+		for part in sorted(parts):
+			times = []
+
+			for size, size_results in results.items():
+				for result in size_results:
+					if result.part == part:
+						print(f"Day {day:02d} part {part}: size {size:>10}  median {result.median:.6f}s")
+						times.append(result.median)
+
+			print(f"Day {day:02d} part {part}: time grows as size^{scaling_exponent(args.sweep, times):.2f}\n")
+
+	return 0
+
+
+def stream(args: argparse.Namespace) -> int:
+	try:
+		result = stream_day(args.day, args.part, sys.stdin)
+	except ValueError as e:
+		raise SystemExit(str(e))
+
+	print(f"Day {result.day:02d} part {result.part}: {result.answer}  [{result.elapsed:.3f}s]")
+
+	return 0
+
+
+def startup(args: argparse.Namespace) -> int:
+	for day in args.days or discover_days():
+		result = measure_startup(day)
+		print(f"Day {day:02d}: imported in {result.elapsed:.4f}s")
+
+		for module in result.imports[:args.top]:
+			print(f"  {module.cumulative:.4f}s  {module.module}")
+
+	return 0
+
+
+def batch(args: argparse.Namespace) -> int:
+	filenames = find_inputs(args.inputs)
+
+	if not filenames:
+		raise SystemExit(f"No input files found matching {args.inputs!r}")
+
+	output = open(args.output, 'w', encoding="UTF-8") if args.output else sys.stdout
+	failed = False
+
+	try:
+		for result in run_batch(args.day, filenames, jobs=args.jobs, chunksize=args.chunksize):
+			output.write(format_jsonl(result) + '\n')
+			output.flush()
+			failed |= result.error is not None
+	finally:
+		if args.output:
+			output.close()
+
+	return int(failed)
+
+
+def generate_input(args: argparse.Namespace) -> int:
+	if args.output:
+		write_input(args.day, args.size, args.output, seed=args.seed)
+	else:
+		sys.stdout.writelines(iter_generate(args.day, args.size, seed=args.seed))
+
+	return 0
+
+
+def cache_command(args: argparse.Namespace) -> int:
+	cache = ParseCache()
+
+	if args.action == "clear":
+		removed = cache.clear(args.day)
+		removed_size = sum(entry.size for entry in removed)
+		print(f"Removed {len(removed)} entries ({removed_size} bytes) from {cache.directory}")
+		return 0
+
+	entries = [entry for entry in cache.entries() if args.day is None or entry.day == args.day]
+
+	for entry in entries:
+		last_used = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry.last_used))
+		print(f"Day {entry.day:02d}  {entry.key[:16]}  {entry.size:>12} bytes  last used {last_used}")
+
+	total_size = sum(entry.size for entry in entries)
+	print(f"{len(entries)} entries, {total_size} of {cache.max_size} bytes, in {cache.directory}")
+
+	return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	parser = argparse.ArgumentParser(prog="aoc2020", description=__doc__.strip().splitlines()[0])
+	subparsers = parser.add_subparsers(dest="command", required=True)
+
+	run_parser = subparsers.add_parser("run", help="Run the solutions for one or more days.")
+	run_parser.add_argument("days", nargs='*', type=int, help="The days to run. Defaults to all days.")
+	run_parser.add_argument("-j", "--jobs", type=int, default=None, help="The number of worker processes.")
+	run_parser.add_argument("--cache", action="store_true", help="Use the parsed input cache.")
+	run_parser.add_argument("--engine", help="Use an alternative implementation, such as 'numpy'.")
+	run_parser.add_argument(
+			"--time-limit",
+			type=float,
+			metavar="SECONDS",
+			help="Run each part in its own process, and kill it if it takes longer than this.",
+			)
+	run_parser.add_argument(
+			"--memory-limit",
+			type=float,
+			metavar="MB",
+			help="Run each part in its own process, and kill it if its RSS grows beyond this.",
+			)
+	run_parser.add_argument(
+			"--limit",
+			type=parse_limit,
+			action="append",
+			metavar="DAY[:PART]=SECONDS[,MB]",
+			help="The time and memory limits for one day or part. May be given multiple times.",
+			)
+	run_parser.add_argument(
+			"--profile",
+			action="store_true",
+			help="Profile each part with cProfile and tracemalloc, one day at a time.",
+			)
+	run_parser.add_argument(
+			"--profile-dir",
+			metavar="DIR",
+			default="profiles",
+			help="The directory to write collapsed stacks to, for flame graphs. Default 'profiles'.",
+			)
+	run_parser.add_argument(
+			"--top", type=int, default=20, help="The number of functions and allocation sites to show. Default 20."
+			)
+	run_parser.set_defaults(func=run)
+
+	bench_parser = subparsers.add_parser("bench", help="Benchmark the solutions and check their answers.")
+	bench_parser.add_argument("days", nargs='*', type=int, help="The days to benchmark. Defaults to all days.")
+	bench_parser.add_argument(
+			"-r", "--repeat", type=int, default=5, help="The number of times to run each part. Default 5."
+			)
+	bench_parser.add_argument("--save", metavar="FILE", help="Save the timings as a JSON baseline.")
+	bench_parser.add_argument("--compare", metavar="FILE", help="Compare the timings against a JSON baseline.")
+	bench_parser.add_argument(
+			"--threshold",
+			type=float,
+			default=0.1,
+			help="The permitted slowdown relative to the baseline, as a fraction. Default 0.1.",
+			)
+	bench_parser.add_argument(
+			"--sweep",
+			nargs='+',
+			type=int,
+			metavar="SIZE",
+			help="Time each part on generated inputs of these sizes, and estimate how it scales.",
+			)
+	bench_parser.add_argument("--seed", type=int, default=0, help="The seed for generated inputs. Default 0.")
+	bench_parser.add_argument("--cache", action="store_true", help="Use the parsed input cache.")
+	bench_parser.add_argument(
+			"--engines",
+			action="store_true",
+			help="Also benchmark each day's alternative implementations, such as 'numpy'.",
+			)
+	bench_parser.add_argument(
+			"--no-startup",
+			dest="startup",
+			action="store_false",
+			help="Don't measure the time taken to import each solution.",
+			)
+	bench_parser.set_defaults(func=bench)
+
+	generate_parser = subparsers.add_parser("generate", help="Generate a synthetic input for a day.")
+	generate_parser.add_argument("day", type=int)
+	generate_parser.add_argument("size", type=int, help="The size of the input. The meaning depends on the day.")
+	generate_parser.add_argument(
+			"-o", "--output", metavar="FILE", help="Write the input to FILE instead of stdout."
+			)
+	generate_parser.add_argument("--seed", type=int, default=0, help="Default 0.")
+	generate_parser.set_defaults(func=generate_input)
+
+	batch_parser = subparsers.add_parser(
+			"batch",
+			help="Solve one day for many input files in parallel, writing the results as JSON Lines.",
+			)
+	batch_parser.add_argument("day", type=int)
+	batch_parser.add_argument(
+			"inputs", help="A directory of input files, or a glob pattern such as 'inputs/*.txt'."
+			)
+	batch_parser.add_argument("-j", "--jobs", type=int, default=None, help="The number of worker processes.")
+	batch_parser.add_argument(
+			"--chunksize", type=int, default=None, help="The number of inputs sent to a worker at a time."
+			)
+	batch_parser.add_argument(
+			"-o", "--output", metavar="FILE", help="Write the results to FILE instead of stdout."
+			)
+	batch_parser.set_defaults(func=batch)
+
+	startup_parser = subparsers.add_parser(
+			"startup",
+			help="Measure how long each solution takes to import, and its slowest imports.",
+			)
+	startup_parser.add_argument("days", nargs='*', type=int, help="The days to measure. Defaults to all days.")
+	startup_parser.add_argument("--top", type=int, default=5, help="The number of imports to show. Default 5.")
+	startup_parser.set_defaults(func=startup)
+
+	stream_parser = subparsers.add_parser(
+			"stream",
+			help="Solve one part of a day from input piped to stdin, in constant memory.",
+			)
+	stream_parser.add_argument("day", type=int)
+	stream_parser.add_argument("part", type=int, nargs='?', default=1, choices=[1, 2], help="Default 1.")
+	stream_parser.set_defaults(func=stream)
+
+	cache_parser = subparsers.add_parser("cache", help="Inspect or clear the parsed input cache.")
+	cache_parser.add_argument("action", choices=["list", "clear"])
+	cache_parser.add_argument("day", nargs='?', type=int, help="Only list or clear the entries for this day.")
+	cache_parser.set_defaults(func=cache_command)
+
+	args = parser.parse_args(argv)
+	return args.func(args)
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Solve one day's puzzle for many inputs at once, in a pool of worker processes.
+
+Each worker imports the solution once, when it starts, so module-level state
+such as compiled regular expressions and validator tables is built once per worker rather than once per input.
+Results are yielded in the order of the inputs, and can be written out as JSON Lines.
+"""
+
+# stdlib
+import glob
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.runner import load_day, run_day
+
+__all__ = ["BatchResult", "find_inputs", "solve_input", "run_batch", "format_jsonl"]
+
+
+class BatchResult(NamedTuple):
+	"""
+	The answers for one input file.
+	"""
+
+	day: int
+	filename: str
+
+	#: A mapping of part numbers to answers.
+	answers: Dict[int, Any]
+
+	#: Wall time in seconds taken to parse the input.
+	parse_time: float
+
+	#: A mapping of part numbers to the wall time in seconds taken to solve that part.
+	times: Dict[int, float]
+
+	#: The total wall time in seconds for the input.
+	elapsed: float
+
+	#: The traceback, if solving the input raised an exception.
+	error: Optional[str] = None
+
+
+def find_inputs(pattern: PathLike) -> List[PathPlus]:
+	"""
+	Returns the input files in a directory, or matching a glob pattern.
+
+	:param pattern: A directory, or a glob pattern such as ``inputs/**/*.txt``.
+	"""
+
+	if os.path.isdir(pattern):
+		return sorted(path for path in PathPlus(pattern).iterdir() if path.is_file())
+
+	filenames = glob.glob(os.fspath(pattern), recursive=True)
+	return sorted(PathPlus(filename) for filename in filenames if os.path.isfile(filename))
+
+
+def _init_worker(day: int) -> None:
+	load_day(day)
+
+
+def solve_input(day: int, filename: PathLike) -> BatchResult:
+	"""
+	Solve each part of the given day for one input file.
+
+	Exceptions are caught and recorded in the result, so one bad input does not stop the batch.
+
+	:param day:
+	:param filename:
+	"""
+
+	start = time.perf_counter()
+
+	try:
+		result = run_day(day, filename)
+	except Exception:
+		elapsed = time.perf_counter() - start
+		return BatchResult(day, os.fspath(filename), {}, 0, {}, elapsed, error=traceback.format_exc())
+
+	return BatchResult(
+			day=day,
+			filename=os.fspath(filename),
+			answers={part.part: part.answer for part in result.parts},
+			parse_time=result.parse_time,
+			times={part.part: part.elapsed for part in result.parts},
+			elapsed=result.elapsed,
+			)
+
+
+def run_batch(
+		day: int,
+		filenames: Sequence[PathLike],
+		jobs: Optional[int] = None,
+		chunksize: Optional[int] = None,
+		) -> Iterator[BatchResult]:
+	"""
+	Solve the given day for each of the input files, in a pool of worker processes.
+
+	:param day:
+	:param filenames:
+	:param jobs: The number of worker processes. Defaults to the number of CPUs.
+	:param chunksize: The number of inputs sent to a worker at a time.
+		Defaults to enough for each worker to receive around four chunks,
+		which keeps the workers busy without the overhead of sending each input separately.
+	"""
+
+	load_day(day)  # Fail early if there is no solution for the day.
+
+	jobs = jobs or os.cpu_count() or 1
+
+	if chunksize is None:
+		chunksize = max(1, len(filenames) // (jobs * 4))
+
+	with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(day, )) as executor:
+		yield from executor.map(partial(solve_input, day), filenames, chunksize=chunksize)
+
+
+def format_jsonl(result: BatchResult) -> str:
+	"""
+	Format the result for an input as a single line of JSON.
+
+	Answers which are not JSON types are converted to strings.
+
+	:param result:
+	"""
+
+	return json.dumps(result._asdict(), default=str)
@@ -0,0 +1,390 @@
+"""
+Repeatedly time each part of each day, and compare the timings against a saved baseline.
+
+The answer to each part is also checked against the expected answer recorded in the trailing comment
+on the line in ``code.py`` which prints it, e.g.:
+
+.. code-block:: python
+
+	print("The answer is:", part_one(expense_report))  # 838624
+"""
+
+# stdlib
+import ast
+import io
+import json
+import math
+import statistics
+import tempfile
+import time
+import tokenize
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.cache import ParseCache
+from aoc2020.generators import write_input
+from aoc2020.runner import discover_days, get_engines, get_parts, load_day, load_input, measure_startup
+
+__all__ = [
+		"PartBenchmark",
+		"Regression",
+		"expected_answers",
+		"percentile",
+		"benchmark_day",
+		"benchmark_days",
+		"save_baseline",
+		"load_baseline",
+		"compare_to_baseline",
+		"format_benchmark",
+		"sweep_day",
+		"scaling_exponent",
+		]
+
+_part_functions = {"part_one": 1, "part_two": 2}
+
+
+class PartBenchmark(NamedTuple):
+	"""
+	Timings for repeated runs of one part of a day's puzzle.
+	"""
+
+	day: int
+	part: int
+	answer: str
+
+	#: The answer recorded in ``code.py``, or :py:obj:`None` if there isn't one.
+	expected: Optional[str]
+
+	#: The number of times the part was run.
+	runs: int
+
+	#: Wall times in seconds.
+	min: float
+	median: float
+	p95: float
+
+	#: Wall time in seconds to import the day's solution in a fresh interpreter,
+	#: or :py:obj:`None` if it wasn't measured.
+	startup: Optional[float] = None
+
+	#: The alternative implementation which was benchmarked, or :py:obj:`None` for the default one.
+	engine: Optional[str] = None
+
+	@property
+	def correct(self) -> Optional[bool]:
+		"""
+		Whether the answer matches the expected answer, or :py:obj:`None` if there is no expected answer.
+		"""
+
+		if self.expected is None:
+			return None
+
+		return self.answer == self.expected
+
+
+class Regression(NamedTuple):
+	"""
+	A part which has become slower than its baseline timing.
+	"""
+
+	day: int
+	part: int
+	baseline: float
+	current: float
+
+	#: The alternative implementation, or :py:obj:`None` for the default one.
+	engine: Optional[str] = None
+
+	@property
+	def slowdown(self) -> float:
+		"""
+		The current median time as a fraction of the baseline median time.
+		"""
+
+		return self.current / self.baseline
+
+
+def expected_answers(day: int) -> Dict[int, str]:
+	"""
+	Returns the expected answers for the given day, taken from the trailing comments in its ``code.py``.
+
+	:param day:
+
+	:returns: A mapping of part numbers to answers. Parts without a recorded answer are omitted.
+	"""
+
+	source = discover_days()[day].read_text()
+
+	comments: Dict[int, str] = {}
+	for token in tokenize.generate_tokens(io.StringIO(source).readline):
+		if token.type == tokenize.COMMENT:
+			comments[token.start[0]] = token.string.lstrip('#').strip()
+
+	answers: Dict[int, str] = {}
+
+	for node in ast.parse(source).body:
+		if not (isinstance(node, ast.If) and ast.unparse(node.test) == "__name__ == '__main__'"):
+			continue
+
+		for statement in node.body:
+			for child in ast.walk(statement):
+				if (
+						isinstance(child, ast.Call) and isinstance(child.func, ast.Name)
+						and child.func.id in _part_functions and statement.end_lineno in comments
+						):
+					answers[_part_functions[child.func.id]] = comments[statement.end_lineno]  # type: ignore
+
+	return answers
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+	"""
+	Returns the given percentile of ``values``, using the nearest-rank method.
+
+	:param values:
+	:param pct: The percentile, between 0 and 100.
+	"""
+
+	ordered = sorted(values)
+	rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+	return ordered[rank - 1]
+
+
+def benchmark_day(
+		day: int,
+		repeat: int = 5,
+		filename: Optional[PathLike] = None,
+		cache: Optional[ParseCache] = None,
+		startup: bool = True,
+		engine: Optional[str] = None,
+		) -> List[PartBenchmark]:
+	"""
+	Time each part of the given day ``repeat`` times.
+
+	The input is parsed once, before timing starts.
+	The time taken to import the solution is measured separately, in a fresh interpreter,
+	as heavy imports would otherwise be hidden by modules already imported in this process.
+
+	:param day:
+	:param repeat: The number of times to run each part.
+	:param filename: The input file. Defaults to the ``input.txt`` file next to the solution.
+		Answers are only checked against the expected answers when using the default input.
+	:param cache: If given, the parsed input is loaded from (and stored in) this cache.
+	:param startup: Whether to measure the time taken to import the solution.
+	:param engine: The name of an alternative implementation to benchmark. See :func:`~.get_engines`.
+	"""
+
+	module = load_day(day)
+	startup_time = measure_startup(day).elapsed if startup else None
+
+	if cache is not None:
+		data = cache.load_input(day, filename, engine)
+	else:
+		data = load_input(day, filename, engine)
+
+	expected = expected_answers(day) if filename is None else {}
+
+	results = []
+
+	for part, func in get_parts(module, engine).items():
+		times = []
+
+		for _ in range(repeat):
+			start = time.perf_counter()
+			answer = func(data)
+			times.append(time.perf_counter() - start)
+
+		results.append(
+				PartBenchmark(
+						day=day,
+						part=part,
+						answer=str(answer),
+						expected=expected.get(part),
+						runs=repeat,
+						min=min(times),
+						median=statistics.median(times),
+						p95=percentile(times, 95),
+						startup=startup_time,
+						engine=engine,
+						)
+				)
+
+	return results
+
+
+def benchmark_days(
+		days: Optional[Iterable[int]] = None,
+		repeat: int = 5,
+		cache: Optional[ParseCache] = None,
+		startup: bool = True,
+		all_engines: bool = False,
+		) -> List[PartBenchmark]:
+	"""
+	Time each part of each of the given days.
+
+	Days are run one after another in this process, so they do not compete with each other for CPU time.
+
+	:param days: The days to benchmark. Defaults to all days with a solution.
+	:param repeat: The number of times to run each part.
+	:param cache: If given, parsed inputs are loaded from (and stored in) this cache.
+	:param startup: Whether to measure the time taken to import each solution.
+	:param all_engines: Whether to also benchmark each day's alternative implementations.
+		See :func:`~.get_engines`.
+	"""
+
+	if days is None:
+		days = discover_days()
+
+	results = []
+
+	for day in days:
+		results.extend(benchmark_day(day, repeat=repeat, cache=cache, startup=startup))
+
+		if all_engines:
+			for engine in get_engines(load_day(day)):
+				results.extend(benchmark_day(day, repeat=repeat, cache=cache, startup=False, engine=engine))
+
+	return results
+
+
+def _baseline_key(result: PartBenchmark) -> str:
+	if result.engine is None:
+		return str(result.part)
+
+	return f"{result.part}:{result.engine}"
+
+
+def save_baseline(results: Iterable[PartBenchmark], filename: PathLike) -> None:
+	"""
+	Save benchmark results as a JSON baseline.
+
+	:param results:
+	:param filename:
+	"""
+
+	baseline: Dict[str, Dict[str, Dict]] = {}
+
+	for result in results:
+		record = result._asdict()
+		del record["day"], record["part"]
+		baseline.setdefault(f"{result.day:02d}", {})[_baseline_key(result)] = record
+
+	PathPlus(filename).write_clean(json.dumps(baseline, indent=2))
+
+
+def load_baseline(filename: PathLike) -> Dict[str, Dict[str, Dict]]:
+	"""
+	Load a JSON baseline saved with :func:`~.save_baseline`.
+
+	:param filename:
+	"""
+
+	return json.loads(PathPlus(filename).read_text())
+
+
+def compare_to_baseline(
+		results: Iterable[PartBenchmark],
+		baseline: Dict[str, Dict[str, Dict]],
+		threshold: float = 0.1,
+		) -> List[Regression]:
+	"""
+	Find the parts whose median time is more than ``threshold`` slower than in the baseline.
+
+	Parts which are not in the baseline are ignored.
+
+	:param results:
+	:param baseline: The baseline, as returned by :func:`~.load_baseline`.
+	:param threshold: The permitted slowdown, as a fraction of the baseline time.
+	"""
+
+	regressions = []
+
+	for result in results:
+		record = baseline.get(f"{result.day:02d}", {}).get(_baseline_key(result))
+		if record is None:
+			continue
+
+		if result.median > record["median"] * (1 + threshold):
+			regression = Regression(result.day, result.part, record["median"], result.median, result.engine)
+			regressions.append(regression)
+
+	return regressions
+
+
+def format_benchmark(result: PartBenchmark) -> str:
+	"""
+	Format the benchmark result for a part for display.
+
+	:param result:
+	"""
+
+	if result.correct is None:
+		status = "unchecked"
+	elif result.correct:
+		status = "ok"
+	else:
+		status = f"WRONG (expected {result.expected})"
+
+	startup = '' if result.startup is None else f"startup {result.startup:.6f}s  "
+
+	engine = '' if result.engine is None else f" [{result.engine}]"
+
+	return (
+			f"Day {result.day:02d} part {result.part}{engine}: {startup}"
+			f"compute min {result.min:.6f}s  median {result.median:.6f}s  p95 {result.p95:.6f}s  "
+			f"answer {result.answer} {status}"
+			)
+
+
+def sweep_day(
+		day: int,
+		sizes: Iterable[int],
+		repeat: int = 3,
+		seed: int = 0,
+		) -> Dict[int, List[PartBenchmark]]:
+	"""
+	Time each part of the given day on generated inputs of increasing size.
+
+	:param day:
+	:param sizes: The sizes of input to generate. See :mod:`aoc2020.generators` for what size means for each day.
+	:param repeat: The number of times to run each part for each size.
+	:param seed: The seed for the input generator.
+
+	:returns: A mapping of input sizes to the timings for each part.
+	"""
+
+	results = {}
+
+	with tempfile.TemporaryDirectory() as tmpdir:
+		for size in sizes:
+			filename = write_input(day, size, PathPlus(tmpdir) / f"{day:02d}_{size}.txt", seed=seed)
+			results[size] = benchmark_day(day, repeat=repeat, filename=filename, startup=False)
+
+	return results
+
+
+def scaling_exponent(sizes: Sequence[int], times: Sequence[float]) -> float:
+	"""
+	Estimate the empirical complexity of a solution from its timings at different input sizes.
+
+	This is the slope of the least-squares fit of log(time) against log(size),
+	so ``1`` means the time grows linearly with the size of the input, ``2`` quadratically, and so on.
+
+	:param sizes:
+	:param times: The time taken for each size, in seconds.
+	"""
+
+	log_sizes = [math.log(size) for size in sizes]
+	log_times = [math.log(max(time, 1e-9)) for time in times]
+
+	mean_size = statistics.mean(log_sizes)
+	mean_time = statistics.mean(log_times)
+
+	covariance = sum((x - mean_size) * (y - mean_time) for x, y in zip(log_sizes, log_times))
+	variance = sum((x - mean_size)**2 for x in log_sizes)
+
+	return covariance / variance
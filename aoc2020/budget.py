@@ -0,0 +1,363 @@
+"""
+Run each part of a day's puzzle in a worker process, with limits on its wall time and memory usage.
+
+A part which exceeds its budget is killed, rather than holding up the rest of the run.
+Before the worker is killed it is asked (with ``SIGUSR1``, where available) to report where it had got to:
+the innermost function from the day's solution, the line it was executing,
+and the values of any simple local variables such as loop counters.
+
+The resident set size (RSS) of each worker is read from ``/proc``,
+so memory budgets are only enforced on Linux.
+"""
+
+# stdlib
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import FrameType
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# 3rd party
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.cache import ParseCache
+from aoc2020.runner import discover_days, get_parts, load_day, load_input
+
+__all__ = [
+		"Budget",
+		"BudgetedResult",
+		"describe_progress",
+		"run_part_with_budget",
+		"run_day_with_budget",
+		"run_days_with_budget",
+		"format_budgeted_result",
+		]
+
+#: How often the worker's wall time and memory usage are checked, in seconds.
+poll_interval = 0.05
+
+
+class Budget(NamedTuple):
+	"""
+	The resources one part of a puzzle may use.
+	"""
+
+	#: The maximum wall time in seconds, including parsing the input, or :py:obj:`None` for no limit.
+	time: Optional[float] = None
+
+	#: The maximum resident set size in bytes, or :py:obj:`None` for no limit.
+	memory: Optional[int] = None
+
+
+class BudgetedResult(NamedTuple):
+	"""
+	The outcome of running one part of a puzzle within a :class:`~.Budget`.
+	"""
+
+	day: int
+	part: int
+
+	#: The answer, or :py:obj:`None` if the part did not finish.
+	answer: Any
+
+	#: Wall time in seconds, including parsing the input.
+	elapsed: float
+
+	#: The peak resident set size of the worker in bytes, if known.
+	peak_memory: Optional[int]
+
+	#: ``'time'`` or ``'memory'`` if the part was killed for exceeding its budget.
+	exceeded: Optional[str] = None
+
+	#: Where the part had got to when it was killed.
+	progress: Optional[str] = None
+
+	#: The traceback, if the part raised an exception.
+	error: Optional[str] = None
+
+
+def _get_rss(pid: int) -> Optional[int]:
+	try:
+		with open(f"/proc/{pid}/statm", encoding="UTF-8") as fp:
+			return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+	except (OSError, ValueError, IndexError):
+		return None
+
+
+def describe_progress(frame: Optional[FrameType], max_locals: int = 12) -> Optional[str]:
+	"""
+	Describe how far the solution had got, from the frame that was executing.
+
+	The innermost frame from a day's ``code.py`` is described, along with its
+	integer, float, boolean and short string local variables.
+
+	:param frame:
+	:param max_locals: The maximum number of local variables to include.
+	"""
+
+	while frame is not None and os.path.basename(frame.f_code.co_filename) != "code.py":
+		frame = frame.f_back
+
+	if frame is None:
+		return None
+
+	day_dir = os.path.basename(os.path.dirname(frame.f_code.co_filename))
+	lineno = frame.f_lineno or '?'
+	description = f"{frame.f_code.co_name} ({day_dir}/code.py:{lineno})"
+
+	values = []
+
+	for name, value in frame.f_locals.items():
+		if isinstance(value, (int, float)) or (isinstance(value, str) and len(value) <= 40):
+			values.append(f"{name}={value!r}")
+
+		if len(values) == max_locals:
+			values.append("...")
+			break
+
+	if values:
+		description += ' ' + ", ".join(values)
+
+	return description
+
+
+def _worker(
+		day: int,
+		part: int,
+		filename: Optional[PathLike],
+		connection: Any,
+		cache: Optional[ParseCache] = None,
+		engine: Optional[str] = None,
+		) -> None:
+	def report_progress(signum: int, frame: Optional[FrameType]) -> None:
+		connection.send(("progress", describe_progress(frame)))
+
+	if hasattr(signal, "SIGUSR1"):
+		signal.signal(signal.SIGUSR1, report_progress)
+
+	# The worker isn't a daemon, so engines can start a process pool of their own.
+	# It leads its own process group so the pool can be killed along with it.
+	if hasattr(os, "setpgid"):
+		os.setpgid(0, 0)
+
+	try:
+		module = load_day(day)
+
+		if cache is not None:
+			data = cache.load_input(day, filename, engine)
+		else:
+			data = load_input(day, filename, engine)
+
+		answer = get_parts(module, engine)[part](data)
+	except Exception:
+		connection.send(("error", traceback.format_exc()))
+		return
+
+	try:
+		# stdlib
+		import resource
+	except ImportError:  # Windows
+		peak_memory = None
+	else:
+		peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+		# ru_maxrss is in kilobytes on Linux, but bytes on macOS.
+		if sys.platform != "darwin":
+			peak_memory *= 1024
+
+	connection.send(("answer", answer, peak_memory))
+
+
+def _request_progress(process: multiprocessing.Process, connection: Any) -> Optional[str]:
+	if not hasattr(signal, "SIGUSR1") or process.pid is None:
+		return None
+
+	os.kill(process.pid, signal.SIGUSR1)
+
+	# The signal handler only runs between bytecode instructions, so it may never run
+	# if the worker is stuck in a long call into C code.
+	if connection.poll(1):
+		message = connection.recv()
+		if message[0] == "progress":
+			return message[1]
+
+	return None
+
+
+def _kill(process: multiprocessing.Process) -> None:
+	# Kill the worker, and any processes it started, which share its process group.
+	if hasattr(os, "killpg") and process.pid is not None:
+		try:
+			os.killpg(process.pid, signal.SIGKILL)
+			return
+		except (ProcessLookupError, PermissionError):  # The worker hasn't made its group yet
+			pass
+
+	process.kill()
+
+
+def run_part_with_budget(
+		day: int,
+		part: int,
+		budget: Budget,
+		filename: Optional[PathLike] = None,
+		cache: Optional[ParseCache] = None,
+		engine: Optional[str] = None,
+		) -> BudgetedResult:
+	"""
+	Parse the input and solve one part of the given day in a worker process.
+
+	The worker is killed if it exceeds its budget.
+
+	:param day:
+	:param part:
+	:param budget:
+	:param filename: The input file. Defaults to the ``input.txt`` file next to the solution.
+	:param cache: If given, the parsed input is loaded from (and stored in) this cache.
+	:param engine: The name of an alternative implementation to use. See :func:`~.get_engines`.
+	"""
+
+	receiver, sender = multiprocessing.Pipe(duplex=False)
+	process = multiprocessing.Process(
+			target=_worker,
+			args=(day, part, filename, sender, cache, engine),
+			)
+
+	start = time.perf_counter()
+	process.start()
+	sender.close()
+
+	peak_memory: Optional[int] = None
+	exceeded: Optional[str] = None
+
+	try:
+		while not receiver.poll(poll_interval):
+			elapsed = time.perf_counter() - start
+
+			rss = _get_rss(process.pid)  # type: ignore
+			if rss is not None:
+				peak_memory = max(peak_memory or 0, rss)
+
+			if budget.memory is not None and rss is not None and rss > budget.memory:
+				exceeded = "memory"
+			elif budget.time is not None and elapsed > budget.time:
+				exceeded = "time"
+			elif not process.is_alive():
+				error = f"The worker process exited unexpectedly with code {process.exitcode}"
+				return BudgetedResult(day, part, None, elapsed, peak_memory, error=error)
+			else:
+				continue
+
+			progress = _request_progress(process, receiver)
+			return BudgetedResult(day, part, None, elapsed, peak_memory, exceeded, progress)
+
+		message = receiver.recv()
+		elapsed = time.perf_counter() - start
+
+		if message[0] == "error":
+			return BudgetedResult(day, part, None, elapsed, peak_memory, error=message[1])
+
+		if message[2] is not None:
+			peak_memory = max(peak_memory or 0, message[2])
+
+		return BudgetedResult(day, part, message[1], elapsed, peak_memory)
+
+	finally:
+		if process.is_alive():
+			_kill(process)
+
+		process.join()
+		receiver.close()
+
+
+def run_day_with_budget(
+		day: int,
+		budgets: Dict[Tuple[int, int], Budget],
+		default: Budget = Budget(),
+		filename: Optional[PathLike] = None,
+		cache: Optional[ParseCache] = None,
+		engine: Optional[str] = None,
+		) -> List[BudgetedResult]:
+	"""
+	Solve each part of the given day in its own worker process, within its budget.
+
+	:param day:
+	:param budgets: A mapping of ``(day, part)`` to the budget for that part.
+		A part number of ``0`` sets the budget for every part of the day.
+	:param default: The budget for parts without an entry in ``budgets``.
+	:param filename: The input file. Defaults to the ``input.txt`` file next to the solution.
+	:param cache: If given, the parsed input is loaded from (and stored in) this cache.
+	:param engine: The name of an alternative implementation to use. See :func:`~.get_engines`.
+
+	:raises ValueError: If the day has no engine with the given name.
+	"""
+
+	results = []
+
+	for part in get_parts(load_day(day), engine):
+		budget = budgets.get((day, part), budgets.get((day, 0), default))
+		results.append(run_part_with_budget(day, part, budget, filename, cache, engine))
+
+	return results
+
+
+def run_days_with_budget(
+		days: Optional[Iterable[int]] = None,
+		budgets: Optional[Dict[Tuple[int, int], Budget]] = None,
+		default: Budget = Budget(),
+		jobs: Optional[int] = None,
+		cache: Optional[ParseCache] = None,
+		engine: Optional[str] = None,
+		) -> Iterator[List[BudgetedResult]]:
+	"""
+	Solve several days in parallel, each part within its budget.
+
+	Results for each day are yielded as the day completes.
+
+	:param days: The days to run. Defaults to all days with a solution.
+	:param budgets: A mapping of ``(day, part)`` to the budget for that part.
+		A part number of ``0`` sets the budget for every part of the day.
+	:param default: The budget for parts without an entry in ``budgets``.
+	:param jobs: The number of days to run at once. Defaults to the number of CPUs.
+	:param cache: If given, the parsed inputs are loaded from (and stored in) this cache.
+	:param engine: The name of an alternative implementation to use. See :func:`~.get_engines`.
+	"""
+
+	if days is None:
+		days = discover_days()
+
+	# Each part already runs in its own process, so threads are enough to wait on them.
+	with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+		futures = [
+				executor.submit(run_day_with_budget, day, budgets or {}, default, cache=cache, engine=engine)
+				for day in days
+				]
+
+		for future in as_completed(futures):
+			yield future.result()
+
+
+def format_budgeted_result(result: BudgetedResult) -> str:
+	"""
+	Format the result for a part for display.
+
+	:param result:
+	"""
+
+	memory = '' if result.peak_memory is None else f", peak RSS {result.peak_memory / 1024**2:.1f}MB"
+	status = f"[{result.elapsed:.3f}s{memory}]"
+
+	if result.exceeded:
+		line = f"  Part {result.part}: budget exceeded ({result.exceeded}) {status}"
+		if result.progress:
+			line += f"\n    Reached {result.progress}"
+		return line
+	elif result.error:
+		return f"  Part {result.part}: failed {status}\n" + result.error.rstrip()
+	else:
+		return f"  Part {result.part}: {result.answer}  {status}"
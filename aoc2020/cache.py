@@ -0,0 +1,258 @@
+"""
+An on-disk cache of parsed puzzle inputs.
+
+Entries are keyed by the SHA-256 hash of the input file and the version of the day's parser,
+so editing either the input or the parser invalidates the entry.
+A day can declare the version of its parser with a module-level ``parser_version`` variable;
+otherwise the hash of its ``code.py`` is used.
+
+NumPy arrays are stored as ``.npz`` files, and everything else is pickled.
+The least recently used entries are evicted once the cache grows beyond its maximum size.
+"""
+
+# stdlib
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, List, NamedTuple, Optional
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.runner import discover_days, load_day, load_input
+
+__all__ = ["default_cache_dir", "CacheEntry", "ParseCache", "hash_file"]
+
+#: The default cache directory. Can be changed with the ``AOC2020_CACHE_DIR`` environment variable.
+default_cache_dir = PathPlus(
+		os.environ.get("AOC2020_CACHE_DIR")
+		or PathPlus(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "aoc2020"
+		)
+
+
+class CacheEntry(NamedTuple):
+	"""
+	A parsed input stored in the cache.
+	"""
+
+	day: int
+	key: str
+	path: PathPlus
+
+	#: The size of the entry on disk, in bytes.
+	size: int
+
+	#: The time the entry was last used, in seconds since the epoch.
+	last_used: float
+
+
+def hash_file(filename: PathLike) -> str:
+	"""
+	Returns the SHA-256 hash of the file, reading it in chunks.
+
+	:param filename:
+	"""
+
+	digest = hashlib.sha256()
+
+	with open(filename, "rb") as fp:
+		for chunk in iter(lambda: fp.read(1 << 20), b''):
+			digest.update(chunk)
+
+	return digest.hexdigest()
+
+
+class ParseCache:
+	"""
+	An on-disk cache of parsed puzzle inputs.
+
+	:param directory: The directory to store the cache in.
+	:param max_size: The maximum total size of the cache, in bytes.
+	"""
+
+	def __init__(self, directory: PathLike = default_cache_dir, max_size: int = 512 * 1024 * 1024):
+		self.directory = PathPlus(directory)
+		self.max_size = max_size
+
+	def parser_version(self, day: int) -> str:
+		"""
+		Returns the version of the parser for the given day.
+
+		:param day:
+		"""
+
+		module = load_day(day)
+
+		if hasattr(module, "parser_version"):
+			return str(module.parser_version)
+
+		return hash_file(discover_days()[day])
+
+	def key(self, day: int, filename: PathLike, engine: Optional[str] = None) -> str:
+		"""
+		Returns the cache key for the given day's parser and input file.
+
+		:param day:
+		:param filename:
+		:param engine: The alternative implementation whose parser is used, if any.
+		"""
+
+		key = f"{hash_file(filename)}:{self.parser_version(day)}"
+
+		if engine is not None:
+			key += f":{engine}"
+
+		return hashlib.sha256(key.encode()).hexdigest()
+
+	def _find(self, day: int, key: str) -> Optional[PathPlus]:
+		for suffix in (".pickle", ".npz"):
+			path = self.directory / f"{day:02d}-{key}{suffix}"
+			if path.is_file():
+				return path
+
+		return None
+
+	def get(self, day: int, filename: PathLike, engine: Optional[str] = None) -> Any:
+		"""
+		Returns the cached parsed input for the given day and input file.
+
+		:param day:
+		:param filename:
+		:param engine: The alternative implementation whose parser is used, if any.
+
+		:raises KeyError: If the input is not in the cache.
+		"""
+
+		path = self._find(day, self.key(day, filename, engine))
+
+		if path is None:
+			raise KeyError(filename)
+
+		# Loading the day first allows classes defined in its ``code.py`` to be unpickled.
+		load_day(day)
+
+		if path.suffix == ".npz":
+			# 3rd party
+			import numpy
+
+			with numpy.load(path) as npz:
+				data = npz["data"]
+		else:
+			data = pickle.loads(path.read_bytes())
+
+		# Mark the entry as recently used.
+		os.utime(path)
+
+		return data
+
+	def put(self, day: int, filename: PathLike, data: Any, engine: Optional[str] = None) -> PathPlus:
+		"""
+		Store the parsed input for the given day and input file, evicting old entries if necessary.
+
+		:param day:
+		:param filename:
+		:param data: The parsed input.
+		:param engine: The alternative implementation whose parser is used, if any.
+
+		:returns: The path to the cache entry.
+		"""
+
+		self.directory.maybe_make(parents=True)
+		key = self.key(day, filename, engine)
+
+		numpy = sys.modules.get("numpy")
+		is_array = numpy is not None and isinstance(data, numpy.ndarray)
+		path = self.directory / f"{day:02d}-{key}{'.npz' if is_array else '.pickle'}"
+
+		# Write to a temporary file first, so other processes never see a partial entry.
+		fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+		with os.fdopen(fd, "wb") as fp:
+			if is_array:
+				numpy.savez(fp, data=data)  # type: ignore
+			else:
+				pickle.dump(data, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+		os.replace(tmp_name, path)
+		self.evict()
+
+		return path
+
+	def load_input(self, day: int, filename: Optional[PathLike] = None, engine: Optional[str] = None) -> Any:
+		"""
+		Returns the parsed input for the given day, from the cache if possible.
+
+		:param day:
+		:param filename: The input file. Defaults to the ``input.txt`` file next to the solution.
+		:param engine: The alternative implementation whose parser should be used, if any.
+		"""
+
+		if filename is None:
+			filename = load_day(day).input_file
+
+		try:
+			return self.get(day, filename, engine)
+		except KeyError:
+			data = load_input(day, filename, engine)
+			self.put(day, filename, data, engine)
+			return data
+
+	def entries(self) -> List[CacheEntry]:
+		"""
+		Returns the entries in the cache, most recently used first.
+		"""
+
+		if not self.directory.is_dir():
+			return []
+
+		entries = []
+
+		for path in self.directory.iterdir():
+			if path.suffix not in {".pickle", ".npz"}:
+				continue
+
+			day, key = path.stem.split('-', 1)
+			stat = path.stat()
+			entries.append(CacheEntry(int(day), key, path, stat.st_size, stat.st_mtime))
+
+		return sorted(entries, key=lambda entry: entry.last_used, reverse=True)
+
+	def evict(self) -> List[CacheEntry]:
+		"""
+		Remove the least recently used entries until the cache is no larger than its maximum size.
+
+		:returns: The entries which were removed.
+		"""
+
+		total_size = 0
+		evicted = []
+
+		for entry in self.entries():
+			total_size += entry.size
+
+			if total_size > self.max_size:
+				entry.path.unlink()
+				evicted.append(entry)
+
+		return evicted
+
+	def clear(self, day: Optional[int] = None) -> List[CacheEntry]:
+		"""
+		Remove entries from the cache.
+
+		:param day: Only remove the entries for this day.
+
+		:returns: The entries which were removed.
+		"""
+
+		removed = []
+
+		for entry in self.entries():
+			if day is None or entry.day == day:
+				entry.path.unlink()
+				removed.append(entry)
+
+		return removed
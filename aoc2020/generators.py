@@ -0,0 +1,589 @@
+"""
+Seeded generators for synthetic puzzle inputs of any size.
+
+The inputs are valid puzzle inputs, with answers the solutions can find,
+so they can be used to measure how each solution scales with the size of its input.
+
+The meaning of ``size`` depends on the day; it is usually the number of lines or records.
+
+The generators produce their input a piece (usually a line) at a time,
+so the inputs for days whose generator doesn't need to shuffle the whole input
+can be larger than memory when they are written to a file or piped to another process.
+"""
+
+# stdlib
+import itertools
+import math
+import random
+import string
+from typing import Callable, Dict, Iterable, Iterator, List, Set
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+__all__ = ["generators", "register", "iter_generate", "generate", "write_input"]
+
+_Generator = Callable[[int, random.Random], Iterator[str]]
+
+#: Mapping of day numbers to the generator for that day.
+generators: Dict[int, _Generator] = {}
+
+_row_chars = str.maketrans("01", "FB")
+_column_chars = str.maketrans("01", "LR")
+
+
+def register(day: int) -> Callable[[_Generator], _Generator]:
+	"""
+	Decorator to register the input generator for a day.
+
+	The generator is called with the size of the input and a seeded :class:`random.Random`,
+	and returns an iterator over the text of the input, in pieces.
+
+	:param day:
+	"""
+
+	def deco(func: _Generator) -> _Generator:
+		generators[day] = func
+		return func
+
+	return deco
+
+
+def iter_generate(day: int, size: int, seed: int = 0) -> Iterator[str]:
+	"""
+	Generate an input for the given day, a piece at a time.
+
+	The same ``day``, ``size`` and ``seed`` always produce the same input.
+
+	:param day:
+	:param size: The size of the input. The meaning depends on the day.
+	:param seed: The seed for the random number generator.
+	"""
+
+	if day not in generators:
+		raise ValueError(f"There is no input generator for day {day}.")
+
+	return generators[day](size, random.Random(seed))
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+	"""
+	Generate an input for the given day.
+
+	See :func:`~.iter_generate` for details.
+
+	:param day:
+	:param size: The size of the input. The meaning depends on the day.
+	:param seed: The seed for the random number generator.
+	"""
+
+	return ''.join(iter_generate(day, size, seed))
+
+
+def write_input(day: int, size: int, filename: PathLike, seed: int = 0) -> PathPlus:
+	"""
+	Generate an input for the given day and write it to ``filename``.
+
+	:param day:
+	:param size: The size of the input. The meaning depends on the day.
+	:param filename:
+	:param seed: The seed for the random number generator.
+
+	:returns: The path to the file.
+	"""
+
+	filename = PathPlus(filename)
+
+	with filename.open('w') as fp:
+		fp.writelines(iter_generate(day, size, seed))
+
+	return filename
+
+
+def _lines(lines: Iterable[str]) -> Iterator[str]:
+	for line in lines:
+		yield line + '\n'
+
+
+def _word(idx: int, alphabet: str = string.ascii_lowercase) -> str:
+	# A unique word for each index, in the given alphabet.
+	letters = []
+	idx += 1
+
+	while idx:
+		idx, remainder = divmod(idx - 1, len(alphabet))
+		letters.append(alphabet[remainder])
+
+	return ''.join(reversed(letters))
+
+
+@register(1)
+def _expense_report(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` entries. Exactly one pair and one triple sum to 2020.
+	# The other entries are either over 2020, or at most 1009 and one more than a multiple of 3.
+	# No two of those sum to 2020, and no three sum to 2020 as 2020 is also one more than a multiple of 3.
+	# The planted entries are multiples of 3, so they are hidden among the others once sorted.
+
+	while True:
+		pair, first, second = rng.sample(range(3, 1009, 3), 3)
+		if first + second >= 1011:
+			break
+
+	entries = [pair, 2020 - pair, first, second, 2020 - first - second]
+
+	forbidden = {2020 - pair - first, 2020 - pair - second}
+	small = [value for value in range(1, 1010, 3) if value not in forbidden]
+
+	while len(entries) < size:
+		if rng.random() < 0.5:
+			entries.append(rng.choice(small))
+		else:
+			entries.append(rng.randint(2021, 10_000_000))
+
+	rng.shuffle(entries)
+	return _lines(map(str, entries))
+
+
+@register(2)
+def _passwords(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` passwords, each with a policy.
+	for _ in range(size):
+		length = rng.randint(4, 20)
+		char = rng.choice(string.ascii_lowercase)
+		low = rng.randint(1, length - 1)
+		high = rng.randint(low + 1, length)
+		password = ''.join(rng.choice(string.ascii_lowercase[:8] + char * 4) for _ in range(length))
+		yield f"{low}-{high} {char}: {password}\n"
+
+
+@register(3)
+def _toboggan_map(size: int, rng: random.Random) -> Iterator[str]:
+	# A map ``size`` rows tall and 31 columns wide.
+	return _lines(''.join(rng.choices(".#", weights=(3, 1), k=31)) for _ in range(size))
+
+
+_passport_fields = {
+		"byr": (lambda rng: str(rng.randint(1920, 2002)), lambda rng: str(rng.randint(1800, 1919))),
+		"iyr": (lambda rng: str(rng.randint(2010, 2020)), lambda rng: str(rng.randint(2021, 2099))),
+		"eyr": (lambda rng: str(rng.randint(2020, 2030)), lambda rng: str(rng.randint(1920, 2019))),
+		"hgt": (
+				lambda rng: rng.choice([f"{rng.randint(150, 193)}cm", f"{rng.randint(59, 76)}in"]),
+				lambda rng: rng.choice([f"{rng.randint(194, 250)}cm", f"{rng.randint(100, 200)}", "60"]),
+				),
+		"hcl": (
+				lambda rng: '#' + ''.join(rng.choices("0123456789abcdef", k=6)),
+				lambda rng: ''.join(rng.choices("0123456789abcdef", k=6)),
+				),
+		"ecl": (
+				lambda rng: rng.choice(["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]),
+				lambda rng: rng.choice(["xry", "zzz", "wat", "gmt"]),
+				),
+		"pid": (
+				lambda rng: str(rng.randint(0, 999_999_999)).zfill(9),
+				lambda rng: str(rng.randint(0, 9_999_999_999)).zfill(10),
+				),
+		"cid": (lambda rng: str(rng.randint(1, 999)), lambda rng: str(rng.randint(1, 999))),
+		}
+
+
+@register(4)
+def _passports(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` passports. Most have every required field; some values are invalid.
+	for idx in range(size):
+		fields = []
+
+		for key, (valid, invalid) in _passport_fields.items():
+			if rng.random() < 0.08:
+				continue
+
+			value = valid(rng) if rng.random() < 0.9 else invalid(rng)
+			fields.append(f"{key}:{value}")
+
+		rng.shuffle(fields)
+
+		lines = []
+		while fields:
+			n_fields = rng.randint(1, 4)
+			lines.append(' '.join(fields[:n_fields]))
+			fields = fields[n_fields:]
+
+		# Passports are separated by blank lines.
+		if idx:
+			yield '\n'
+
+		yield '\n'.join(lines) + '\n'
+
+
+@register(5)
+def _boarding_passes(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` boarding passes. Every seat between the first and last is taken except one.
+	# There are only 1024 seats, so larger inputs repeat seats.
+	n_seats = min(max(size, 3), 1022)
+	first = rng.randint(0, 1023 - n_seats)
+	last = first + n_seats
+	missing = rng.randint(first + 1, last - 1)
+	seat_ids = [seat_id for seat_id in range(first, last + 1) if seat_id != missing]
+
+	passes = seat_ids + rng.choices(seat_ids, k=max(size - len(seat_ids), 0))
+	rng.shuffle(passes)
+
+	return _lines(
+			f"{seat_id >> 3:07b}".translate(_row_chars) + f"{seat_id & 7:03b}".translate(_column_chars)
+			for seat_id in passes
+			)
+
+
+@register(6)
+def _customs_answers(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` groups of one to five people.
+	for idx in range(size):
+		people = []
+		for _ in range(rng.randint(1, 5)):
+			people.append(''.join(rng.sample(string.ascii_lowercase, rng.randint(1, 26))))
+
+		# Groups are separated by blank lines.
+		if idx:
+			yield '\n'
+
+		yield '\n'.join(people) + '\n'
+
+
+@register(7)
+def _bag_rules(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` bag rules, forming a tree.
+	# The bags on the way down to the shiny gold bag, and inside it, contain few bags,
+	# as the solution lists every bag individually.
+	size = max(size, 20)
+
+	colours = ["red", "orange", "yellow", "green", "blue", "indigo", "violet", "white", "black", "grey"]
+	# Words without a 'b' can't be mistaken for "bag"
+	adjectives = (_word(idx // len(colours), "acdefhijklmnopqrstuvwxyz") for idx in range(size))
+	names = [f"{adjective} {colours[idx % len(colours)]}" for idx, adjective in enumerate(adjectives)]
+	shiny_gold = size - 10
+	names[shiny_gold] = "shiny gold"
+
+	# The bags after the shiny gold bag are all inside it
+	parents = [-1] + [rng.randrange(shiny_gold if idx > shiny_gold else 0, idx) for idx in range(1, size)]
+	children: List[List[int]] = [[] for _ in range(size)]
+	for child, parent in enumerate(parents[1:], start=1):
+		children[parent].append(child)
+
+	# Bags containing the shiny gold bag contain one of each bag
+	ancestors: Set[int] = set()
+	bag = parents[shiny_gold]
+	while bag != -1:
+		ancestors.add(bag)
+		bag = parents[bag]
+
+	rules = []
+
+	for bag, contents in enumerate(children):
+		if not contents:
+			rules.append(f"{names[bag]} bags contain no other bags.")
+			continue
+
+		counts = []
+		for child in contents:
+			if bag in ancestors:
+				count = 1
+			elif bag >= shiny_gold:
+				count = rng.randint(1, 2)
+			else:
+				count = rng.randint(1, 9)
+
+			counts.append(f"{count} {names[child]} {'bag' if count == 1 else 'bags'}")
+
+		rules.append(f"{names[bag]} bags contain {', '.join(counts)}.")
+
+	rng.shuffle(rules)
+	return _lines(rules)
+
+
+@register(8)
+def _boot_code(size: int, rng: random.Random) -> Iterator[str]:
+	# A program of about ``size`` instructions.
+	# An instruction near the end loops back, and changing it to a ``nop`` is the only fix which terminates.
+	# Every other ``jmp`` is either skipped, or skips an instruction which would loop back.
+	program = ["acc +0"]
+	size = max(size, 10)
+
+	while len(program) < size * 9 // 10:
+		kind = rng.random()
+		if kind < 0.6:
+			program.append(f"acc {rng.randint(-99, 99):+d}")
+		elif kind < 0.8:
+			program.append("nop +0")
+		else:
+			program.append("jmp +2")
+			program.append(f"jmp {-rng.randint(1, len(program) - 1):+d}")
+
+	program.append(f"jmp {-rng.randint(1, len(program) - 1):+d}")
+
+	while len(program) < size:
+		program.append(f"acc {rng.randint(-99, 99):+d}")
+
+	# The target of a backwards jump must have been run already; skipped jumps never are.
+	for idx, instruction in enumerate(program):
+		if instruction.startswith("jmp -"):
+			target = idx + int(instruction[4:])
+			while program[target - 1] == "jmp +2" and program[target].startswith("jmp -"):
+				target -= 1
+			program[idx] = f"jmp {target - idx:+d}"
+
+	return _lines(program)
+
+
+@register(9)
+def _xmas_data(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` numbers. Each number is the sum of two of the previous 25, except one,
+	# which is the sum of a contiguous range of earlier numbers.
+	# Zeros are mixed in to keep the numbers small, so valid numbers are often ``0 + x``.
+	size = max(size, 60)
+	cap = 1000
+
+	numbers = [0, 0] + [rng.randint(1, cap) for _ in range(23)]
+	rng.shuffle(numbers)
+	invalid_idx = rng.randint(max(len(numbers) + 10, size * 3 // 4), size - 1)
+
+	while len(numbers) < size:
+		window = numbers[-25:]
+
+		if len(numbers) == invalid_idx:
+			# No two numbers in the window can sum to more than twice the cap
+			total = 0
+			while total <= 2 * cap:
+				start = rng.randrange(len(numbers) - 30)
+				total = sum(numbers[start:start + rng.randint(5, 30)])
+			numbers.append(total)
+			continue
+
+		# Keep enough zeros in the window for the next numbers to be valid
+		if window[1:].count(0) < 3:
+			numbers.append(0)
+			continue
+
+		first, second = rng.sample(range(25), 2)
+		value = window[first] + window[second]
+		if value > cap:
+			value = window[first] or window[second]
+		numbers.append(value)
+
+	return _lines(map(str, numbers))
+
+
+@register(10)
+def _adapters(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` adapters, each one to three jolts above the previous.
+	adapters = []
+	joltage = 0
+
+	for _ in range(size):
+		joltage += rng.choice([1, 1, 2, 3, 3])
+		adapters.append(joltage)
+
+	rng.shuffle(adapters)
+	return _lines(map(str, adapters))
+
+
+@register(11)
+def _seat_layout(size: int, rng: random.Random) -> Iterator[str]:
+	# A ``size`` x ``size`` seat layout.
+	return _lines(''.join(rng.choices("L.", weights=(4, 1), k=size)) for _ in range(size))
+
+
+@register(12)
+def _navigation(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` navigation instructions.
+	for _ in range(size):
+		action = rng.choice("NSEWLRFF")
+		if action in "LR":
+			yield f"{action}{rng.choice([90, 180, 270])}\n"
+		else:
+			yield f"{action}{rng.randint(1, 99)}\n"
+
+
+@register(13)
+def _bus_schedule(size: int, rng: random.Random) -> Iterator[str]:
+	# A schedule with ``size`` entries, nine of which are buses.
+	# Each bus has a distinct prime ID, so there is always a solution to part two,
+	# and the product of the IDs fits in 64 bits like in the real input.
+	primes = [n for n in range(11, 600, 2) if all(n % divisor for divisor in range(3, 25, 2) if divisor < n)]
+	n_buses = min(size, 9)
+
+	while True:
+		bus_ids = rng.sample(primes, n_buses)
+		if math.prod(bus_ids) < 2**62:
+			break
+
+	schedule = [str(bus_ids[0])] + rng.sample(list(map(str, bus_ids[1:])) + ['x'] * (size - n_buses), size - 1)
+
+	return _lines([str(rng.randint(1_000_000, 10_000_000)), ','.join(schedule)])
+
+
+@register(14)
+def _docking_program(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` instructions. Each mask has at most 9 floating bits.
+
+	def instructions() -> Iterator[str]:
+		while True:
+			mask = rng.choices("01", k=36)
+			for idx in rng.sample(range(36), rng.randint(1, 9)):
+				mask[idx] = 'X'
+			yield f"mask = {''.join(mask)}"
+
+			for _ in range(rng.randint(1, 6)):
+				yield f"mem[{rng.randint(0, 65535)}] = {rng.randint(0, 2 ** 30)}"
+
+	return _lines(itertools.islice(instructions(), size))
+
+
+@register(15)
+def _starting_numbers(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` distinct starting numbers.
+	yield ','.join(map(str, rng.sample(range(size * 10), size))) + '\n'
+
+
+_ticket_fields = [
+		"departure location",
+		"departure station",
+		"departure platform",
+		"departure track",
+		"departure date",
+		"departure time",
+		"arrival location",
+		"arrival station",
+		"arrival platform",
+		"arrival track",
+		"class",
+		"duration",
+		"price",
+		"route",
+		"row",
+		"seat",
+		"train",
+		"type",
+		"wagon",
+		"zone",
+		]
+
+
+@register(16)
+def _ticket_notes(size: int, rng: random.Random) -> Iterator[str]:
+	# The 20 fields and ``size`` nearby tickets.
+	# Values from 1 to 100 are valid for every field. Field ``n`` also accepts 200 + 10n and above,
+	# and each position has values which only fit the fields up to its own,
+	# so the fields can be worked out one at a time.
+	# Values from 101 to 199 are not valid for any field.
+	n_fields = len(_ticket_fields)
+	levels = rng.sample(range(n_fields), n_fields)
+
+	lines = [f"{name}: 1-100 or {200 + 10 * idx}-999" for idx, name in enumerate(_ticket_fields)]
+
+	def value_for(position: int, marker: bool = False) -> int:
+		level = levels[position]
+		if marker:
+			return rng.randint(200 + 10 * level, 209 + 10 * level)
+		return rng.randint(1, 100)
+
+	lines.append('')
+	lines.append("your ticket:")
+	lines.append(','.join(str(value_for(position)) for position in range(n_fields)))
+	lines.append('')
+	lines.append("nearby tickets:")
+
+	# The first ticket has a marker in every position.
+	lines.append(','.join(str(value_for(position, True)) for position in range(n_fields)))
+
+	for _ in range(size - 1):
+		ticket = [value_for(position, rng.random() < 0.5) for position in range(n_fields)]
+		if rng.random() < 0.2:
+			ticket[rng.randrange(n_fields)] = rng.randint(101, 199)
+		lines.append(','.join(map(str, ticket)))
+
+	return _lines(lines)
+
+
+@register(17)
+def _pocket_dimension(size: int, rng: random.Random) -> Iterator[str]:
+	# A ``size`` x ``size`` initial slice.
+	return _lines(''.join(rng.choices(".#", k=size)) for _ in range(size))
+
+
+def _expression(rng: random.Random, depth: int) -> str:
+	terms = []
+
+	for _ in range(rng.randint(2, 4)):
+		if depth and rng.random() < 0.3:
+			terms.append(f"({_expression(rng, depth - 1)})")
+		else:
+			terms.append(str(rng.randint(1, 9)))
+
+	expression = terms[0]
+	for term in terms[1:]:
+		expression += f" {rng.choice('+*')} {term}"
+
+	return expression
+
+
+@register(18)
+def _homework(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` expressions, with up to three levels of parentheses.
+	return _lines(_expression(rng, 3) for _ in range(size))
+
+
+_allergens = ["dairy", "eggs", "fish", "nuts", "peanuts", "sesame", "shellfish", "soy", "wheat"]
+
+
+@register(21)
+def _foods(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` foods. Each allergen is in exactly one ingredient,
+	# and two foods list only that allergen, and share no other ingredients.
+	safe_ingredients = [_word(idx + 1000) for idx in range(max(size // 2, 200))]
+	dangerous = dict(zip(_allergens, (_word(idx) for idx in range(len(_allergens)))))
+
+	foods = []
+
+	def add_food(allergens: List[str], safe: List[str]) -> None:
+		ingredients = [dangerous[allergen] for allergen in allergens] + safe
+		rng.shuffle(ingredients)
+		foods.append(f"{' '.join(ingredients)} (contains {', '.join(allergens)})")
+
+	for allergen in _allergens:
+		safe = rng.sample(safe_ingredients, 20)
+		add_food([allergen], safe[:10])
+		add_food([allergen], safe[10:])
+
+	while len(foods) < size:
+		allergens = rng.sample(_allergens, rng.randint(1, 3))
+		add_food(allergens, rng.sample(safe_ingredients, rng.randint(5, 30)))
+
+	rng.shuffle(foods)
+	return _lines(foods)
+
+
+@register(22)
+def _decks(size: int, rng: random.Random) -> Iterator[str]:
+	# Two decks of ``size`` cards each.
+	cards = rng.sample(range(1, 2 * size + 1), 2 * size)
+
+	player1 = '\n'.join(map(str, cards[:size]))
+	player2 = '\n'.join(map(str, cards[size:]))
+
+	yield f"Player 1:\n{player1}\n\nPlayer 2:\n{player2}\n"
+
+
+@register(24)
+def _tile_paths(size: int, rng: random.Random) -> Iterator[str]:
+	# ``size`` paths of 10 to 20 steps.
+	directions = ["e", "se", "sw", "w", "nw", "ne"]
+	return _lines(''.join(rng.choices(directions, k=rng.randint(10, 20))) for _ in range(size))
+
+
+@register(25)
+def _public_keys(size: int, rng: random.Random) -> Iterator[str]:
+	# Two public keys, with loop sizes of up to ``size``.
+	size = min(size, 20_000_000 - 1)
+	card_loop_size, door_loop_size = rng.sample(range(1, size + 1), 2)
+
+	return _lines([str(pow(7, card_loop_size, 20201227)), str(pow(7, door_loop_size, 20201227))])
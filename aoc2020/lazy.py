@@ -0,0 +1,67 @@
+"""
+Defer importing heavy third-party modules until they are first used.
+
+Importing :mod:`numpy` takes around 100ms, and :mod:`pandas` several hundred,
+which can be far longer than the solution itself takes to run on a small input.
+
+.. code-block:: python
+
+	# this package
+	from aoc2020.lazy import lazy_import
+
+	numpy = lazy_import("numpy")
+
+	def part_two(...):
+		return numpy.lcm(...)  # numpy is imported here, on first use
+"""
+
+# stdlib
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any
+
+__all__ = ["LazyModule", "lazy_import"]
+
+
+class LazyModule(ModuleType):
+	"""
+	A placeholder for a module, which imports the real module when one of its attributes is first accessed.
+
+	:param name: The fully qualified name of the module.
+	"""
+
+	def __getattr__(self, name: str) -> Any:
+		module = importlib.import_module(self.__name__)
+
+		# Copy the module's namespace so later attribute lookups don't go through __getattr__.
+		self.__dict__.update(module.__dict__)
+
+		return getattr(module, name)
+
+	def __repr__(self) -> str:
+		if self.__name__ in sys.modules:
+			return repr(sys.modules[self.__name__])
+
+		return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name: str) -> ModuleType:
+	"""
+	Returns a module which is only imported when one of its attributes is first accessed.
+
+	If the module has already been imported it is returned as-is.
+
+	:param name: The fully qualified name of the module.
+
+	:raises ModuleNotFoundError: If the module is not installed. This is checked without importing it.
+	"""
+
+	if name in sys.modules:
+		return sys.modules[name]
+
+	if importlib.util.find_spec(name) is None:
+		raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+	return LazyModule(name)
@@ -0,0 +1,245 @@
+"""
+Memory-mapped, bytes-level loading of puzzle inputs.
+
+Unlike :meth:`PathPlus.read_lines() <domdf_python_tools.paths.PathPlus.read_lines>`,
+nothing here decodes or copies the whole file up front.
+Numeric inputs are parsed straight into a NumPy array a chunk at a time,
+so the memory needed to load an input stays close to the size of the file itself,
+and large files can be split into ranges of lines or records to be processed in parallel.
+
+Text inputs are still read with :meth:`PathPlus.read_lines() <domdf_python_tools.paths.PathPlus.read_lines>`.
+Their parsed form (a list of strings) takes several times the size of the file whichever way it is read,
+and decoding one line at a time from a memory map is several times slower.
+"""
+
+# stdlib
+import mmap
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple, Union
+
+# 3rd party
+from domdf_python_tools.typing import PathLike
+
+if TYPE_CHECKING:
+	# 3rd party
+	import numpy
+
+__all__ = ["Buffer", "map_file", "split_file", "as_grid", "read_ints", "stream_lines"]
+
+#: The types of buffer returned by :func:`~.map_file` (as parsed by :func:`~.read_ints`)
+#: and accepted by :func:`~.as_grid`.
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+
+@contextmanager
+def map_file(filename: PathLike) -> Iterator[Buffer]:
+	"""
+	Context manager to map the given file into memory, read-only.
+
+	Empty files cannot be mapped, so ``b''`` is returned for them instead.
+
+	Any :class:`memoryview` slices of the map should be released before the context manager exits,
+	otherwise the map stays open until they are garbage collected.
+
+	:param filename:
+	"""
+
+	with open(filename, "rb") as fp:
+		try:
+			buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+		except ValueError:  # Empty file
+			yield b''
+			return
+
+	try:
+		yield buffer
+	finally:
+		try:
+			buffer.close()
+		except BufferError:
+			# Slices of the map are still in use.
+			pass
+
+
+def split_file(filename: PathLike, n_chunks: int, separator: bytes = b'\n') -> List[Tuple[int, int]]:
+	"""
+	Split a file into roughly equal ``(start, end)`` byte ranges, for processing in parallel.
+
+	Each range ends just after a ``separator`` (or at the end of the file),
+	so no line or record is split between two ranges.
+	There may be fewer than ``n_chunks`` ranges if the file is small.
+
+	:param filename:
+	:param n_chunks: The number of ranges to aim for.
+	:param separator: The bytes which separate each line or record.
+	"""
+
+	ranges = []
+
+	with map_file(filename) as buffer:
+		size = len(buffer)
+		start = 0
+
+		for chunk in range(1, n_chunks + 1):
+			if start >= size:
+				break
+
+			end = buffer.find(separator, max(start, size * chunk // n_chunks))
+			end = size if end == -1 else end + len(separator)
+
+			ranges.append((start, end))
+			start = end
+
+	return ranges
+
+
+def as_grid(buffer: Buffer) -> "numpy.ndarray":
+	"""
+	Returns a view of a file of equal-length lines as a 2D array of bytes, one row per line, without copying it.
+
+	The line endings (``\n`` or ``\r\n``) are skipped over by the strides of the view,
+	and trailing newlines and blank lines are ignored.
+
+	:param buffer:
+
+	:raises ValueError: If the lines are not all the same length.
+	"""
+
+	# 3rd party
+	import numpy
+
+	size = len(buffer)
+	while size and buffer[size - 1] in b"\r\n":  # Trailing newlines and blank lines
+		size -= 1
+
+	width = buffer.find(b'\n')
+	if width == -1:
+		width = size
+	elif width and buffer[width - 1] == 13:  # \r
+		width -= 1
+
+	# Every line is the same length, so the offset of each row is a multiple of the line width.
+	stride = buffer.find(b'\n') + 1 or size
+	n_rows = (size + stride - width) // stride if size else 0
+
+	if not width or (n_rows - 1) * stride + width != size:
+		raise ValueError("Every line must be the same length")
+
+	# The total size can still come out right for lines of different lengths,
+	# so check that the line ending after each row is where the first line's ending is,
+	# and that there are no other newlines (which would be the ends of shorter lines).
+	data = numpy.frombuffer(buffer, dtype=numpy.uint8, count=size)
+	endings = data[:(n_rows - 1) * stride].reshape(n_rows - 1, stride)[:, width:]
+
+	if not (endings == data[width:stride]).all():
+		raise ValueError("Every line must be the same length")
+
+	chunk_size = 1 << 24
+	n_newlines = sum(
+			int(numpy.count_nonzero(data[start:start + chunk_size] == 10))  # \n
+			for start in range(0, size, chunk_size)
+			)
+
+	if n_newlines != n_rows - 1:
+		raise ValueError("Every line must be the same length")
+
+	return numpy.ndarray((n_rows, width), dtype=numpy.uint8, buffer=buffer, strides=(stride, 1))
+
+
+def read_ints(filename: PathLike, dtype: str = "int64", chunk_size: int = 1 << 20) -> "numpy.ndarray":
+	"""
+	Parse a file of whitespace-separated integers directly into a NumPy array.
+
+	As with :class:`int`, each number may have a leading ``-`` or ``+`` sign.
+
+	The file is memory mapped and parsed ``chunk_size`` bytes at a time with vectorised operations,
+	so the temporary arrays stay small however large the file is.
+
+	:param filename:
+	:param dtype: The dtype of the returned array.
+	:param chunk_size: The approximate number of bytes to parse at once.
+
+	:raises ValueError: If the file contains anything other than signed numbers and whitespace.
+	"""
+
+	# 3rd party
+	import numpy
+
+	chunks: List[numpy.ndarray] = []
+	powers = 10**numpy.arange(19, dtype=numpy.int64)
+
+	with map_file(filename) as buffer:
+		size = len(buffer)
+		start = 0
+
+		while start < size:
+			# Extend the chunk to the next newline so no number is split between chunks.
+			end = buffer.find(b'\n', min(start + chunk_size, size))
+			end = size if end == -1 else end + 1
+
+			data = numpy.frombuffer(buffer, dtype=numpy.uint8, count=end - start, offset=start)
+			chunks.append(_parse_ints(data, powers).astype(dtype, copy=False))
+
+			del data
+			start = end
+
+	if not chunks:
+		return numpy.empty(0, dtype=dtype)
+
+	return numpy.concatenate(chunks)
+
+
+def _parse_ints(data: "numpy.ndarray", powers: "numpy.ndarray") -> "numpy.ndarray":
+	# 3rd party
+	import numpy
+
+	digits = data - 48
+	is_digit = digits < 10  # Wraps around for bytes below "0"
+	is_space = numpy.isin(data, (9, 10, 13, 32))
+
+	# A sign must come straight before a digit, and straight after whitespace or the start of the data.
+	is_sign = (data == 45) | (data == 43)
+	is_sign[:-1] &= is_digit[1:]
+	is_sign[-1:] = False
+	is_sign[1:] &= is_space[:-1]
+
+	if not numpy.all(is_digit | is_space | is_sign):
+		bad = data[~(is_digit | is_space | is_sign)][0]
+		raise ValueError(f"Unexpected character {chr(bad)!r} in numeric input")
+
+	positions = numpy.flatnonzero(is_digit)
+	if not positions.size:
+		return numpy.empty(0, dtype=numpy.int64)
+
+	# Each run of consecutive digits is one number.
+	run_starts = numpy.flatnonzero(numpy.diff(positions, prepend=-2) != 1)
+	run_ends = numpy.append(run_starts[1:], positions.size) - 1
+
+	# The power of ten for each digit is its distance from the last digit of its number.
+	lengths = run_ends - run_starts + 1
+	if lengths.max() > 18:
+		raise ValueError("Number too large for a 64-bit integer")
+
+	exponents = numpy.repeat(positions[run_ends], lengths) - positions
+	values = numpy.add.reduceat(digits[positions].astype(numpy.int64) * powers[exponents], run_starts)
+
+	first_digits = positions[run_starts]
+	is_negative = (first_digits > 0) & (data[first_digits - 1] == 45)
+	values[is_negative] *= -1
+
+	return values
+
+
+def stream_lines(stream: Iterable[str]) -> Iterator[str]:
+	"""
+	Iterate over the non-blank lines of a text stream (such as :py:obj:`sys.stdin`), without their line endings.
+
+	Only one line is held in memory at a time, so inputs of any size can be piped in.
+
+	:param stream:
+	"""
+
+	for line in stream:
+		line = line.rstrip("\r\n")
+		if line:
+			yield line
@@ -0,0 +1,322 @@
+"""
+Profile each part of a day's puzzle with :mod:`cProfile` and :mod:`tracemalloc`.
+
+While each part runs, a background thread also samples its call stack,
+and the samples are written out in the "collapsed stack" format understood by flame graph tools such as
+`flamegraph.pl <https://github.com/brendangregg/FlameGraph>`_ and `speedscope <https://www.speedscope.app/>`_.
+
+Profiling slows each part down considerably, so the timings reported here
+should not be compared with those from the benchmark.
+"""
+
+# stdlib
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+# this package
+from aoc2020.cache import ParseCache
+from aoc2020.runner import get_parts, load_day, load_input
+
+__all__ = [
+		"FunctionStats",
+		"AllocationSite",
+		"PartProfile",
+		"StackSampler",
+		"profile_part",
+		"profile_day",
+		"write_collapsed_stacks",
+		"format_profile",
+		]
+
+
+class FunctionStats(NamedTuple):
+	"""
+	The time spent in a function, from :mod:`cProfile`.
+	"""
+
+	#: The function, as ``name (file:line)``.
+	function: str
+	calls: int
+
+	#: Time spent in the function itself, in seconds.
+	tottime: float
+
+	#: Time spent in the function and everything it called, in seconds.
+	cumtime: float
+
+
+class AllocationSite(NamedTuple):
+	"""
+	A line of code which had memory allocated when the traced memory was at its peak.
+	"""
+
+	filename: str
+	lineno: int
+
+	#: The total size of the blocks allocated at this line, in bytes.
+	size: int
+
+	#: The number of blocks allocated at this line.
+	count: int
+
+
+class PartProfile(NamedTuple):
+	"""
+	The profile of one part of a day's puzzle.
+	"""
+
+	day: int
+	part: int
+	answer: Any
+
+	#: Wall time in seconds, including the overhead of profiling.
+	elapsed: float
+
+	#: The functions which took the most cumulative time, slowest first.
+	functions: List[FunctionStats]
+
+	#: The peak size of the memory blocks traced by :mod:`tracemalloc`, in bytes.
+	peak_memory: int
+
+	#: The lines with the most memory allocated at (or shortly before) the peak, largest first.
+	allocation_sites: List[AllocationSite]
+
+	#: A mapping of collapsed call stacks (``outer;inner;innermost``) to the number of samples.
+	stacks: Dict[str, int]
+
+
+def _frame_name(frame: FrameType) -> str:
+	code = frame.f_code
+	return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler(threading.Thread):
+	"""
+	Periodically samples the call stack of another thread, from a background thread.
+
+	Only stacks sampled while :meth:`cProfile.Profile.runcall` was running are recorded,
+	starting from the frame that was executing when the sampler was created.
+	Frames from :mod:`cProfile` itself are skipped.
+
+	The sampler also takes a :mod:`tracemalloc` snapshot whenever the traced memory
+	grows more than 10% beyond the size at the previous snapshot,
+	so the allocation sites around the peak can be reported.
+
+	:param interval: The time between samples, in seconds.
+	"""
+
+	def __init__(self, interval: float = 0.001):
+		super().__init__(daemon=True)
+		self.interval = interval
+		self.stacks: Counter = Counter()
+		self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+		self._target_thread = threading.get_ident()
+		self._root_frame = sys._getframe(1)
+		self._snapshot_size = 0
+		self._stop_event = threading.Event()
+
+	def run(self) -> None:
+		while not self._stop_event.wait(self.interval):
+			self.sample()
+
+	def sample(self) -> None:
+		"""
+		Record the current call stack of the target thread.
+		"""
+
+		frame = sys._current_frames().get(self._target_thread)
+		names = []
+		profiled = False
+
+		while frame is not None and frame is not self._root_frame:
+			if frame.f_code.co_filename == cProfile.__file__:
+				profiled = True
+			else:
+				names.append(_frame_name(frame))
+			frame = frame.f_back
+
+		# Only count samples taken while the profiler was running the part.
+		if profiled and names:
+			self.stacks[';'.join(reversed(names))] += 1
+
+		if tracemalloc.is_tracing():
+			current = tracemalloc.get_traced_memory()[0]
+			if current > self._snapshot_size * 1.1:
+				self.snapshot = tracemalloc.take_snapshot()
+				self._snapshot_size = current
+
+	def stop(self) -> None:
+		"""
+		Stop sampling, and wait for the thread to finish.
+		"""
+
+		self._stop_event.set()
+		self.join()
+
+
+def _function_stats(profiler: cProfile.Profile, top: int) -> List[FunctionStats]:
+	functions = []
+	stats = pstats.Stats(profiler).stats  # type: ignore
+
+	for (filename, lineno, name), (_, calls, tottime, cumtime, _) in stats.items():
+		if filename == '~':
+			if name == "<method 'disable' of '_lsprof.Profiler' objects>":
+				continue
+			function = name
+		else:
+			function = f"{name} ({os.path.basename(filename)}:{lineno})"
+
+		functions.append(FunctionStats(function, calls, tottime, cumtime))
+
+	functions.sort(key=lambda f: f.cumtime, reverse=True)
+
+	return functions[:top]
+
+
+def _allocation_sites(snapshot: Optional[tracemalloc.Snapshot], top: int) -> List[AllocationSite]:
+	if snapshot is None:
+		return []
+
+	snapshot = snapshot.filter_traces([
+			tracemalloc.Filter(False, tracemalloc.__file__),
+			tracemalloc.Filter(False, threading.__file__),
+			tracemalloc.Filter(False, __file__),
+			tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+			])
+
+	sites = []
+
+	for statistic in snapshot.statistics("lineno")[:top]:
+		frame = statistic.traceback[0]
+		sites.append(AllocationSite(frame.filename, frame.lineno, statistic.size, statistic.count))
+
+	return sites
+
+
+def profile_part(
+		day: int,
+		part: int,
+		func: Callable,
+		data: Any,
+		top: int = 20,
+		interval: float = 0.001,
+		) -> PartProfile:
+	"""
+	Solve one part of a puzzle with :mod:`cProfile`, :mod:`tracemalloc` and the stack sampler running.
+
+	:param day:
+	:param part:
+	:param func: The function which solves the part.
+	:param data: The parsed input.
+	:param top: The number of functions and allocation sites to report.
+	:param interval: The time between stack samples, in seconds.
+	"""
+
+	profiler = cProfile.Profile()
+	sampler = StackSampler(interval)
+
+	tracemalloc.start()
+	tracemalloc.reset_peak()
+	sampler.start()
+	start = time.perf_counter()
+
+	try:
+		answer = profiler.runcall(func, data)
+	finally:
+		elapsed = time.perf_counter() - start
+		sampler.stop()
+		peak_memory = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+
+	return PartProfile(
+			day=day,
+			part=part,
+			answer=answer,
+			elapsed=elapsed,
+			functions=_function_stats(profiler, top),
+			peak_memory=peak_memory,
+			allocation_sites=_allocation_sites(sampler.snapshot, top),
+			stacks=dict(sampler.stacks),
+			)
+
+
+def profile_day(
+		day: int,
+		filename: Optional[PathLike] = None,
+		top: int = 20,
+		cache: Optional[ParseCache] = None,
+		engine: Optional[str] = None,
+		) -> List[PartProfile]:
+	"""
+	Profile each part of the given day.
+
+	The input is parsed before profiling starts.
+
+	:param day:
+	:param filename: The input file. Defaults to the ``input.txt`` file next to the solution.
+	:param top: The number of functions and allocation sites to report for each part.
+	:param cache: If given, the parsed input is loaded from (and stored in) this cache.
+	:param engine: The name of an alternative implementation to profile. See :func:`~.get_engines`.
+	"""
+
+	parts = get_parts(load_day(day), engine)
+
+	if cache is not None:
+		data = cache.load_input(day, filename, engine)
+	else:
+		data = load_input(day, filename, engine)
+
+	return [profile_part(day, part, func, data, top=top) for part, func in parts.items()]
+
+
+def write_collapsed_stacks(profile: PartProfile, filename: PathLike) -> None:
+	"""
+	Write the sampled call stacks in the collapsed stack format, one ``outer;inner;innermost count`` per line.
+
+	:param profile:
+	:param filename:
+	"""
+
+	lines = [f"{stack} {count}" for stack, count in sorted(profile.stacks.items())]
+	PathPlus(filename).write_lines(lines)
+
+
+def format_profile(profile: PartProfile) -> str:
+	"""
+	Format the profile of a part for display.
+
+	:param profile:
+	"""
+
+	lines = [
+			f"Day {profile.day:02d} part {profile.part}: {profile.answer}  [{profile.elapsed:.3f}s profiled]",
+			f"  Peak traced memory: {profile.peak_memory} bytes",
+			'',
+			f"  {'calls':>10}  {'tottime':>9}  {'cumtime':>9}  function",
+			]
+
+	for function in profile.functions:
+		lines.append(
+				f"  {function.calls:>10}  {function.tottime:>9.4f}  {function.cumtime:>9.4f}  {function.function}"
+				)
+
+	if profile.allocation_sites:
+		lines.extend(['', f"  {'bytes':>12}  {'blocks':>8}  allocation site"])
+
+		for site in profile.allocation_sites:
+			lines.append(f"  {site.size:>12}  {site.count:>8}  {site.filename}:{site.lineno}")
+
+	return '\n'.join(lines)
@@ -0,0 +1,364 @@
+"""
+Discover, import and run the solutions for each day.
+"""
+
+# stdlib
+import importlib.util
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# 3rd party
+from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.typing import PathLike
+
+if TYPE_CHECKING:
+	# this package
+	from aoc2020.cache import ParseCache
+
+__all__ = [
+		"repo_root",
+		"PartResult",
+		"DayResult",
+		"ImportTime",
+		"Startup",
+		"discover_days",
+		"load_day",
+		"get_parts",
+		"get_engines",
+		"load_input",
+		"measure_startup",
+		"run_day",
+		"run_days",
+		"stream_day",
+		"format_result",
+		]
+
+repo_root = PathPlus(__file__).parent.parent
+
+_modules: Dict[int, ModuleType] = {}
+
+
+class PartResult(NamedTuple):
+	"""
+	The answer to one part of a day's puzzle, and how long it took to compute.
+	"""
+
+	day: int
+	part: int
+	answer: Any
+
+	#: Wall time in seconds.
+	elapsed: float
+
+
+class DayResult(NamedTuple):
+	"""
+	The results for both parts of a day's puzzle.
+	"""
+
+	day: int
+
+	#: Wall time in seconds taken to parse the input.
+	parse_time: float
+	parts: List[PartResult]
+
+	@property
+	def elapsed(self) -> float:
+		"""
+		The total wall time for the day, including parsing the input.
+		"""
+
+		return self.parse_time + sum(part.elapsed for part in self.parts)
+
+
+class ImportTime(NamedTuple):
+	"""
+	The time taken to import a module, as reported by ``python -X importtime``.
+	"""
+
+	module: str
+
+	#: Time in seconds spent importing the module itself, excluding the modules it imports.
+	self: float
+
+	#: Time in seconds spent importing the module, including the modules it imports.
+	cumulative: float
+
+
+class Startup(NamedTuple):
+	"""
+	The time taken to import the solution for a day in a fresh interpreter.
+	"""
+
+	day: int
+
+	#: Wall time in seconds to import the solution, including its dependencies.
+	elapsed: float
+
+	#: The modules imported directly while importing the solution, slowest first.
+	imports: List[ImportTime]
+
+
+def discover_days(root: PathLike = repo_root) -> Dict[int, PathPlus]:
+	"""
+	Find the solution for each day.
+
+	:param root: The directory containing the ``01/`` ... ``25/`` directories.
+
+	:returns: A mapping of day numbers to the ``code.py`` file for that day.
+	"""
+
+	days = {}
+
+	for directory in PathPlus(root).iterdir():
+		if not re.fullmatch("[0-9]{2}", directory.name):
+			continue
+
+		code_file = directory / "code.py"
+		if code_file.is_file():
+			days[int(directory.name)] = code_file
+
+	return dict(sorted(days.items()))
+
+
+def load_day(day: int) -> ModuleType:
+	"""
+	Import the solution for the given day.
+
+	Modules are cached, so repeated calls in the same process only import the solution once.
+
+	:param day:
+	"""
+
+	if day not in _modules:
+		days = discover_days()
+
+		if day not in days:
+			raise ValueError(f"There is no solution for day {day}.")
+
+		module_name = f"day{day:02d}"
+		spec = importlib.util.spec_from_file_location(module_name, days[day])
+		module = importlib.util.module_from_spec(spec)  # type: ignore
+		sys.modules[module_name] = module
+		spec.loader.exec_module(module)  # type: ignore
+		_modules[day] = module
+
+	return _modules[day]
+
+
+def get_parts(module: ModuleType, engine: Optional[str] = None) -> Dict[int, Callable]:
+	"""
+	Returns a mapping of part numbers to the function which solves that part.
+
+	Days without a second puzzle (such as day 25) only have a ``part_one`` function.
+
+	:param module: The solution for a day, as returned by :func:`~.load_day`.
+	:param engine: The name of an alternative implementation, from the day's ``engines`` dictionary.
+	"""
+
+	if engine is not None:
+		engines = getattr(module, "engines", {})
+
+		if engine not in engines:
+			raise ValueError(f"{module.__name__} has no {engine!r} engine.")
+
+		return dict(engines[engine])
+
+	parts = {}
+
+	for part, name in enumerate(["part_one", "part_two"], start=1):
+		if hasattr(module, name):
+			parts[part] = getattr(module, name)
+
+	return parts
+
+
+def get_engines(module: ModuleType) -> List[str]:
+	"""
+	Returns the names of the alternative implementations of the given day.
+
+	A day can provide alternative implementations with a module-level ``engines`` dictionary,
+	mapping the name of each engine to a dictionary of part numbers and functions.
+	The functions take the same parsed input as ``part_one`` and ``part_two``,
+	unless the engine has its own parser (see :func:`~.load_input`).
+
+	:param module: The solution for a day, as returned by :func:`~.load_day`.
+	"""
+
+	return list(getattr(module, "engines", {}))
+
+
+def load_input(day: int, filename: Optional[PathLike] = None, engine: Optional[str] = None) -> Any:
+	"""
+	Parse the input for the given day.
+
+	A day can provide a parser for each of its alternative implementations in a module-level
+	``parsers`` dictionary, mapping the name of the engine to a function which takes the filename.
+	Otherwise the day's ``parse_input`` function is used.
+
+	:param day:
+	:param filename: The input file. Defaults to the ``input.txt`` file next to the solution.
+	:param engine: The name of an alternative implementation. See :func:`~.get_engines`.
+	"""
+
+	module = load_day(day)
+	parser = getattr(module, "parsers", {}).get(engine, module.parse_input)
+
+	return parser() if filename is None else parser(filename)
+
+
+def measure_startup(day: int) -> Startup:
+	"""
+	Measure how long the solution for the given day takes to import, in a fresh interpreter.
+
+	The interpreter is run with ``-X importtime`` to find out which of the day's imports are slowest.
+	Modules imported by :mod:`aoc2020.runner` itself are not included.
+
+	:param day:
+	"""
+
+	code = '\n'.join([
+			"import sys, time",
+			"from aoc2020.runner import load_day",
+			"print('-- load_day --', file=sys.stderr, flush=True)",
+			"start = time.perf_counter()",
+			f"load_day({day})",
+			"print(time.perf_counter() - start)",
+			])
+
+	process = subprocess.run(
+			[sys.executable, "-X", "importtime", "-c", code],
+			cwd=repo_root,
+			capture_output=True,
+			text=True,
+			check=True,
+			)
+
+	imports = []
+	_, _, report = process.stderr.partition("-- load_day --\n")
+
+	for line in report.splitlines():
+		if not line.startswith("import time:"):
+			continue
+
+		self_us, cumulative_us, module = line[len("import time:"):].split('|')
+
+		# Nested imports are indented by two spaces per level.
+		if module.startswith("  "):
+			continue
+
+		imports.append(ImportTime(module.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+
+	imports.sort(key=lambda i: i.cumulative, reverse=True)
+
+	return Startup(day, float(process.stdout.strip().splitlines()[-1]), imports)
+
+
+def run_day(
+		day: int,
+		filename: Optional[PathLike] = None,
+		cache: Optional["ParseCache"] = None,
+		engine: Optional[str] = None,
+		) -> DayResult:
+	"""
+	Parse the input for the given day and solve each part, timing each step.
+
+	:param day:
+	:param filename: The input file. Defaults to the ``input.txt`` file next to the solution.
+	:param cache: If given, the parsed input is loaded from (and stored in) this cache.
+	:param engine: The name of an alternative implementation to use. See :func:`~.get_engines`.
+	"""
+
+	module = load_day(day)
+
+	start = time.perf_counter()
+	if cache is not None:
+		data = cache.load_input(day, filename, engine)
+	else:
+		data = load_input(day, filename, engine)
+	parse_time = time.perf_counter() - start
+
+	results = []
+
+	for part, func in get_parts(module, engine).items():
+		start = time.perf_counter()
+		answer = func(data)
+		results.append(PartResult(day, part, answer, time.perf_counter() - start))
+
+	return DayResult(day, parse_time, results)
+
+
+def run_days(
+		days: Optional[Iterable[int]] = None,
+		jobs: Optional[int] = None,
+		cache: Optional["ParseCache"] = None,
+		engine: Optional[str] = None,
+		) -> Iterator[DayResult]:
+	"""
+	Run the solutions for several days in parallel, in a pool of worker processes.
+
+	Results are yielded as each day completes, so the slowest day does not hold up the others.
+
+	:param days: The days to run. Defaults to all days with a solution.
+	:param jobs: The number of worker processes. Defaults to the number of CPUs.
+	:param cache: If given, parsed inputs are loaded from (and stored in) this cache.
+	:param engine: The name of an alternative implementation to use. See :func:`~.get_engines`.
+	"""
+
+	if days is None:
+		days = discover_days()
+
+	with ProcessPoolExecutor(max_workers=jobs) as executor:
+		futures = [executor.submit(run_day, day, cache=cache, engine=engine) for day in days]
+
+		for future in as_completed(futures):
+			yield future.result()
+
+
+def stream_day(day: int, part: int, stream: Iterable[str]) -> PartResult:
+	"""
+	Solve one part of the given day from a stream of lines, such as :py:obj:`sys.stdin`.
+
+	Only days with a ``parse_stream`` function support streaming.
+	Their solutions make a single pass over the input, keeping only the state they need,
+	so inputs larger than memory can be piped in.
+
+	:param day:
+	:param part:
+	:param stream: An iterable of lines, which is only read once.
+	"""
+
+	module = load_day(day)
+
+	if not hasattr(module, "parse_stream"):
+		raise ValueError(f"Day {day} does not support streaming input.")
+
+	parts = get_parts(module)
+
+	if part not in parts:
+		raise ValueError(f"Day {day} has no part {part}.")
+
+	start = time.perf_counter()
+	answer = parts[part](module.parse_stream(stream))
+
+	return PartResult(day, part, answer, time.perf_counter() - start)
+
+
+def format_result(result: DayResult) -> str:
+	"""
+	Format the result for a day for display.
+
+	:param result:
+	"""
+
+	lines = [f"Day {result.day:02d} (parsed in {result.parse_time:.3f}s)"]
+
+	for part in result.parts:
+		lines.append(f"  Part {part.part}: {part.answer}  [{part.elapsed:.3f}s]")
+
+	return '\n'.join(lines)